@@ -25,7 +25,7 @@ from .const import (
 )
 from .coordinator import MerakiSensorCoordinator
 from .exceptions import ConfigurationError
-from .hubs import MerakiOrganizationHub
+from .hubs import MerakiOrganizationHub, async_remove_inventory
 from .utils import get_performance_metrics, performance_monitor
 from .utils.device_info import (
     create_network_hub_device_info,
@@ -317,3 +317,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             await org_hub.async_unload()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove data stored for a config entry that is being deleted.
+
+    Args:
+        hass: Home Assistant instance
+        entry: Configuration entry being removed
+    """
+    await async_remove_inventory(hass, entry.data[CONF_ORGANIZATION_ID])
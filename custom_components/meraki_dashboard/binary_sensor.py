@@ -112,10 +112,9 @@ async def async_setup_entry(
 
             # Create binary sensors for applicable metrics that the device supports
             entities_created_for_device = 0
-            for metric in MT_BINARY_SENSOR_METRICS:
-                if metric in MT_BINARY_SENSOR_DESCRIPTIONS:
+            for metric, description in MT_BINARY_SENSOR_DESCRIPTIONS.items():
+                if metric in MT_BINARY_SENSOR_METRICS:
                     if should_create_entity(device, metric, coordinator.data):
-                        description = MT_BINARY_SENSOR_DESCRIPTIONS[metric]
                         entities.append(
                             MerakiMTBinarySensor(
                                 coordinator,
@@ -20,9 +20,9 @@ from ..const import (
     CONF_STATIC_DATA_INTERVAL,
     DEFAULT_DISCOVERY_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
-    DYNAMIC_DATA_REFRESH_INTERVAL_MINUTES,
-    SEMI_STATIC_DATA_REFRESH_INTERVAL_MINUTES,
-    STATIC_DATA_REFRESH_INTERVAL_MINUTES,
+    DYNAMIC_DATA_REFRESH_INTERVAL,
+    SEMI_STATIC_DATA_REFRESH_INTERVAL,
+    STATIC_DATA_REFRESH_INTERVAL,
 )
 from .schemas import MerakiConfigSchema, validate_config_migration
 
@@ -61,27 +61,21 @@ class ConfigMigration:
 
         # Ensure tiered refresh intervals exist
         if CONF_STATIC_DATA_INTERVAL not in options:
-            options[CONF_STATIC_DATA_INTERVAL] = (
-                STATIC_DATA_REFRESH_INTERVAL_MINUTES * 60
-            )
+            options[CONF_STATIC_DATA_INTERVAL] = STATIC_DATA_REFRESH_INTERVAL
             _LOGGER.debug(
                 "Added static data interval: %s seconds",
                 options[CONF_STATIC_DATA_INTERVAL],
             )
 
         if CONF_SEMI_STATIC_DATA_INTERVAL not in options:
-            options[CONF_SEMI_STATIC_DATA_INTERVAL] = (
-                SEMI_STATIC_DATA_REFRESH_INTERVAL_MINUTES * 60
-            )
+            options[CONF_SEMI_STATIC_DATA_INTERVAL] = SEMI_STATIC_DATA_REFRESH_INTERVAL
             _LOGGER.debug(
                 "Added semi-static data interval: %s seconds",
                 options[CONF_SEMI_STATIC_DATA_INTERVAL],
             )
 
         if CONF_DYNAMIC_DATA_INTERVAL not in options:
-            options[CONF_DYNAMIC_DATA_INTERVAL] = (
-                DYNAMIC_DATA_REFRESH_INTERVAL_MINUTES * 60
-            )
+            options[CONF_DYNAMIC_DATA_INTERVAL] = DYNAMIC_DATA_REFRESH_INTERVAL
             _LOGGER.debug(
                 "Added dynamic data interval: %s seconds",
                 options[CONF_DYNAMIC_DATA_INTERVAL],
@@ -3,24 +3,274 @@
 from __future__ import annotations
 
 import re
+import string
+from collections.abc import Callable, Collection, Mapping
 from dataclasses import dataclass, field
-from typing import Any, ClassVar
+from types import MappingProxyType
+from typing import Any, ClassVar, Final
 
 from ..const import (
     DEFAULT_BASE_URL,
     DEFAULT_DISCOVERY_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
-    DYNAMIC_DATA_REFRESH_INTERVAL_MINUTES,
-    REGIONAL_BASE_URLS,
-    SEMI_STATIC_DATA_REFRESH_INTERVAL_MINUTES,
-    STATIC_DATA_REFRESH_INTERVAL_MINUTES,
+    DYNAMIC_DATA_REFRESH_INTERVAL,
+    REGIONAL_BASE_URLS_SET,
+    SEMI_STATIC_DATA_REFRESH_INTERVAL,
+    STATIC_DATA_REFRESH_INTERVAL,
 )
 from ..exceptions import ConfigurationError
 
+# Validation patterns, kept for the public ``*_PATTERN`` class attributes.
+# Meraki organization IDs can contain letters, numbers, and hyphens
+_ORG_ID_PATTERN: re.Pattern[str] = re.compile(r"^[a-zA-Z0-9\-]+$")
+# Meraki device serials follow a specific pattern
+_SERIAL_PATTERN: re.Pattern[str] = re.compile(r"^[A-Z0-9\-]+$")
+
+# Character sets used for validation; a subset check over these is cheaper
+# than a regex match for such short, fixed-charset values
+_ORG_ID_CHARS: Final = frozenset(string.ascii_letters + string.digits + "-")
+_SERIAL_CHARS: Final = frozenset(string.ascii_uppercase + string.digits + "-")
+
+# Keys stored in config entry data rather than options
+_CONFIG_DATA_KEYS: Final = frozenset({"api_key", "base_url", "organization_id"})
+
+# Shared immutable stand-ins for mutable option defaults
+_NO_DEVICES: Final[tuple[str, ...]] = ()
+_NO_HUB_OVERRIDES: Final[Mapping[str, Any]] = MappingProxyType({})
+
+# Option defaults applied by MerakiConfigSchema.from_config_entry
+_DEFAULT_OPTIONS: Final[Mapping[str, Any]] = MappingProxyType(
+    {
+        "scan_interval": DEFAULT_SCAN_INTERVAL,
+        "auto_discovery": True,
+        "discovery_interval": DEFAULT_DISCOVERY_INTERVAL,
+        "selected_devices": _NO_DEVICES,
+        "hub_scan_intervals": _NO_HUB_OVERRIDES,
+        "hub_discovery_intervals": _NO_HUB_OVERRIDES,
+        "hub_auto_discovery": _NO_HUB_OVERRIDES,
+        "static_data_interval": STATIC_DATA_REFRESH_INTERVAL,
+        "semi_static_data_interval": SEMI_STATIC_DATA_REFRESH_INTERVAL,
+        "dynamic_data_interval": DYNAMIC_DATA_REFRESH_INTERVAL,
+    }
+)
+
+_API_KEY_HEX_ERROR = "API key must contain only hexadecimal characters (0-9, a-f, A-F)"
+
+# Regional base URLs never change, so the error listing is built once
+_ALLOWED_URLS_STR: Final = ", ".join(sorted(REGIONAL_BASE_URLS_SET))
+
+
+def _fresh(value: Any) -> Any:
+    """Return a new container in place of a shared immutable default."""
+    if value is _NO_DEVICES:
+        return []
+    if value is _NO_HUB_OVERRIDES:
+        return {}
+    return value
+
+
+def validate_interval(
+    value: Any, min_seconds: int = 60, max_seconds: int = 86400
+) -> None:
+    """Validate an interval in seconds against inclusive bounds.
+
+    Args:
+        value: Interval in seconds
+        min_seconds: Minimum allowed interval
+        max_seconds: Maximum allowed interval
+
+    Raises:
+        ConfigurationError: If the interval is invalid
+    """
+    if type(value) is not int:
+        raise ConfigurationError(
+            f"Interval must be an integer, got {type(value).__name__}"
+        )
+
+    if value < min_seconds:
+        raise ConfigurationError(
+            f"Interval must be at least {min_seconds} seconds, got {value}"
+        )
+
+    if value > max_seconds:
+        raise ConfigurationError(
+            f"Interval must be at most {max_seconds} seconds, got {value}"
+        )
+
+
+def _validate_tiered_intervals(
+    static_interval: Any, semi_static_interval: Any, dynamic_interval: Any
+) -> None:
+    """Validate tiered refresh intervals and their ordering.
+
+    Raises:
+        ConfigurationError: If any interval is invalid
+    """
+    # Validate individual intervals
+    validate_interval(static_interval, 3600, 86400)
+    validate_interval(semi_static_interval, 1800, 43200)
+    validate_interval(dynamic_interval, 300, 7200)
+
+    # Validate relationship: dynamic < semi_static < static
+    if dynamic_interval >= semi_static_interval:
+        raise ConfigurationError(
+            f"Dynamic interval ({dynamic_interval}s) must be less than "
+            f"semi-static interval ({semi_static_interval}s)"
+        )
+
+    if semi_static_interval >= static_interval:
+        raise ConfigurationError(
+            f"Semi-static interval ({semi_static_interval}s) must be less than "
+            f"static interval ({static_interval}s)"
+        )
+
+
+def _validate_base_url(value: Any, allowed_urls: Collection[str]) -> None:
+    """Validate a Meraki Dashboard base URL.
+
+    Raises:
+        ConfigurationError: If the base URL is invalid
+    """
+    if type(value) is not str:
+        raise ConfigurationError("Base URL must be a string")
+
+    if not value.strip():
+        raise ConfigurationError("Base URL cannot be empty")
+
+    # Must be HTTPS
+    if not value.startswith("https://"):
+        raise ConfigurationError("Base URL must use HTTPS")
+
+    # Should be one of the allowed URLs
+    if value not in allowed_urls:
+        allowed = (
+            _ALLOWED_URLS_STR
+            if allowed_urls is REGIONAL_BASE_URLS_SET
+            else ", ".join(sorted(allowed_urls))
+        )
+        raise ConfigurationError(f"Base URL must be one of: {allowed}")
+
+
+def _validate_hub_id(hub_id: Any) -> None:
+    """Validate a hub identifier.
+
+    Raises:
+        ConfigurationError: If the hub ID is invalid
+    """
+    if type(hub_id) is not str or not hub_id.strip():
+        raise ConfigurationError("Hub ID must be a non-empty string")
+
 
-@dataclass
+def _validate_auto_discovery(value: Any) -> None:
+    """Validate an auto discovery flag.
+
+    Raises:
+        ConfigurationError: If the flag is not a boolean
+    """
+    if type(value) is not bool:
+        raise ConfigurationError("Auto discovery must be a boolean")
+
+
+def _validate_hub_scan(hub_id: Any, interval: Any) -> None:
+    """Validate a hub-specific scan interval.
+
+    Raises:
+        ConfigurationError: If the hub ID or interval is invalid
+    """
+    _validate_hub_id(hub_id)
+    validate_interval(interval, 60, 3600)
+
+
+def _validate_hub_discovery(hub_id: Any, interval: Any) -> None:
+    """Validate a hub-specific discovery interval.
+
+    Raises:
+        ConfigurationError: If the hub ID or interval is invalid
+    """
+    _validate_hub_id(hub_id)
+    validate_interval(interval, 300, 86400)
+
+
+def _validate_hub_auto(hub_id: Any, enabled: Any) -> None:
+    """Validate a hub-specific auto discovery flag.
+
+    Raises:
+        ConfigurationError: If the hub ID or flag is invalid
+    """
+    _validate_hub_id(hub_id)
+    _validate_auto_discovery(enabled)
+
+
+def _validate_api_key(value: Any) -> None:
+    """Validate a Meraki API key.
+
+    Raises:
+        ConfigurationError: If the API key is invalid
+    """
+    if type(value) is not str:
+        raise ConfigurationError("API key must be a string")
+
+    if not value.strip():
+        raise ConfigurationError("API key cannot be empty")
+
+    # Basic format validation - Meraki API keys are typically 40 hex characters
+    if len(value) != 40:
+        raise ConfigurationError(
+            f"API key must be 40 characters long, got {len(value)}"
+        )
+
+    # bytes.fromhex skips whitespace, so reject anything non-alphanumeric first
+    if not value.isalnum():
+        raise ConfigurationError(_API_KEY_HEX_ERROR)
+
+    try:
+        bytes.fromhex(value)
+    except ValueError:
+        raise ConfigurationError(_API_KEY_HEX_ERROR) from None
+
+
+def _validate_org_id(value: Any) -> None:
+    """Validate a Meraki organization ID.
+
+    Raises:
+        ConfigurationError: If the organization ID is invalid
+    """
+    if type(value) is not str:
+        raise ConfigurationError("Organization ID must be a string")
+
+    if not value.strip():
+        raise ConfigurationError("Organization ID cannot be empty")
+
+    if not _ORG_ID_CHARS.issuperset(value):
+        raise ConfigurationError(
+            "Organization ID must contain only letters, numbers, and hyphens"
+        )
+
+
+def _validate_serial(value: Any) -> None:
+    """Validate a Meraki device serial.
+
+    Raises:
+        ConfigurationError: If the device serial is invalid
+    """
+    if type(value) is not str:
+        raise ConfigurationError("Device serial must be a string")
+
+    if not value.strip():
+        raise ConfigurationError("Device serial cannot be empty")
+
+    if not _SERIAL_CHARS.issuperset(value):
+        raise ConfigurationError(
+            "Device serial must contain only uppercase letters, digits, and hyphens"
+        )
+
+
+@dataclass(slots=True)
 class IntervalConfig:
-    """Configuration for interval validation."""
+    """Configuration for interval validation.
+
+    Deprecated: kept for compatibility, use ``validate_interval`` instead.
+    """
 
     value: int
     min_seconds: int = 60
@@ -28,123 +278,57 @@ class IntervalConfig:
 
     def __post_init__(self) -> None:
         """Validate interval after initialization."""
-        if not isinstance(self.value, int):
-            raise ConfigurationError(
-                f"Interval must be an integer, got {type(self.value).__name__}"
-            )
+        validate_interval(self.value, self.min_seconds, self.max_seconds)
 
-        if self.value < self.min_seconds:
-            raise ConfigurationError(
-                f"Interval must be at least {self.min_seconds} seconds, got {self.value}"
-            )
-
-        if self.value > self.max_seconds:
-            raise ConfigurationError(
-                f"Interval must be at most {self.max_seconds} seconds, got {self.value}"
-            )
 
-
-@dataclass
+@dataclass(slots=True)
 class APIKeyConfig:
     """Configuration for API key validation."""
 
     value: str
-    # Meraki API keys are typically 40 characters long
-    MERAKI_API_KEY_PATTERN: ClassVar[re.Pattern] = re.compile(r"^[a-fA-F0-9]{40}$")
 
     def __post_init__(self) -> None:
         """Validate API key after initialization."""
-        if not isinstance(self.value, str):
-            raise ConfigurationError("API key must be a string")
+        _validate_api_key(self.value)
 
-        if not self.value.strip():
-            raise ConfigurationError("API key cannot be empty")
 
-        # Basic format validation - Meraki API keys are typically 40 hex characters
-        if len(self.value) != 40:
-            raise ConfigurationError(
-                f"API key must be 40 characters long, got {len(self.value)}"
-            )
-
-        if not self.MERAKI_API_KEY_PATTERN.match(self.value):
-            raise ConfigurationError(
-                "API key must contain only hexadecimal characters (0-9, a-f, A-F)"
-            )
-
-
-@dataclass
+@dataclass(slots=True)
 class BaseURLConfig:
     """Configuration for base URL validation."""
 
     value: str
-    allowed_urls: list[str] = field(
-        default_factory=lambda: list(REGIONAL_BASE_URLS.values())
-    )
+    allowed_urls: frozenset[str] = REGIONAL_BASE_URLS_SET
 
     def __post_init__(self) -> None:
         """Validate base URL after initialization."""
-        if not isinstance(self.value, str):
-            raise ConfigurationError("Base URL must be a string")
+        _validate_base_url(self.value, self.allowed_urls)
 
-        if not self.value.strip():
-            raise ConfigurationError("Base URL cannot be empty")
 
-        # Must be HTTPS
-        if not self.value.startswith("https://"):
-            raise ConfigurationError("Base URL must use HTTPS")
-
-        # Should be one of the allowed URLs
-        if self.value not in self.allowed_urls:
-            raise ConfigurationError(
-                f"Base URL must be one of: {', '.join(self.allowed_urls)}"
-            )
-
-
-@dataclass
+@dataclass(slots=True)
 class OrganizationIDConfig:
     """Configuration for organization ID validation."""
 
     value: str
-    # Meraki organization IDs can contain letters, numbers, and hyphens
-    ORG_ID_PATTERN: ClassVar[re.Pattern] = re.compile(r"^[a-zA-Z0-9\-]+$")
+    ORG_ID_PATTERN: ClassVar[re.Pattern] = _ORG_ID_PATTERN
 
     def __post_init__(self) -> None:
         """Validate organization ID after initialization."""
-        if not isinstance(self.value, str):
-            raise ConfigurationError("Organization ID must be a string")
-
-        if not self.value.strip():
-            raise ConfigurationError("Organization ID cannot be empty")
-
-        if not self.ORG_ID_PATTERN.match(self.value):
-            raise ConfigurationError(
-                "Organization ID must contain only letters, numbers, and hyphens"
-            )
+        _validate_org_id(self.value)
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceSerialConfig:
     """Configuration for device serial validation."""
 
     value: str
-    # Meraki device serials follow a specific pattern
-    SERIAL_PATTERN: ClassVar[re.Pattern] = re.compile(r"^[A-Z0-9\-]+$")
+    SERIAL_PATTERN: ClassVar[re.Pattern] = _SERIAL_PATTERN
 
     def __post_init__(self) -> None:
         """Validate device serial after initialization."""
-        if not isinstance(self.value, str):
-            raise ConfigurationError("Device serial must be a string")
+        _validate_serial(self.value)
 
-        if not self.value.strip():
-            raise ConfigurationError("Device serial cannot be empty")
 
-        if not self.SERIAL_PATTERN.match(self.value):
-            raise ConfigurationError(
-                "Device serial must contain only uppercase letters, digits, and hyphens"
-            )
-
-
-@dataclass
+@dataclass(slots=True)
 class TieredRefreshConfig:
     """Configuration for tiered refresh intervals."""
 
@@ -154,28 +338,17 @@ class TieredRefreshConfig:
 
     def __post_init__(self) -> None:
         """Validate tiered refresh intervals after initialization."""
-        # Validate individual intervals
-        IntervalConfig(self.static_interval, min_seconds=3600, max_seconds=86400)
-        IntervalConfig(self.semi_static_interval, min_seconds=1800, max_seconds=43200)
-        IntervalConfig(self.dynamic_interval, min_seconds=300, max_seconds=7200)
-
-        # Validate relationship: dynamic < semi_static < static
-        if self.dynamic_interval >= self.semi_static_interval:
-            raise ConfigurationError(
-                f"Dynamic interval ({self.dynamic_interval}s) must be less than "
-                f"semi-static interval ({self.semi_static_interval}s)"
-            )
-
-        if self.semi_static_interval >= self.static_interval:
-            raise ConfigurationError(
-                f"Semi-static interval ({self.semi_static_interval}s) must be less than "
-                f"static interval ({self.static_interval}s)"
-            )
+        _validate_tiered_intervals(
+            self.static_interval, self.semi_static_interval, self.dynamic_interval
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class HubIntervalConfig:
-    """Configuration for hub-specific intervals."""
+    """Configuration for hub-specific intervals.
+
+    Kept for compatibility; the schema validates hub settings directly.
+    """
 
     hub_id: str
     scan_interval: int | None = None
@@ -184,22 +357,19 @@ class HubIntervalConfig:
 
     def __post_init__(self) -> None:
         """Validate hub-specific intervals after initialization."""
-        if not isinstance(self.hub_id, str) or not self.hub_id.strip():
-            raise ConfigurationError("Hub ID must be a non-empty string")
+        _validate_hub_id(self.hub_id)
 
         if self.scan_interval is not None:
-            IntervalConfig(self.scan_interval, min_seconds=60, max_seconds=3600)
+            _validate_hub_scan(self.hub_id, self.scan_interval)
 
         if self.discovery_interval is not None:
-            IntervalConfig(self.discovery_interval, min_seconds=300, max_seconds=86400)
+            _validate_hub_discovery(self.hub_id, self.discovery_interval)
 
-        if self.auto_discovery is not None and not isinstance(
-            self.auto_discovery, bool
-        ):
-            raise ConfigurationError("Auto discovery must be a boolean")
+        if self.auto_discovery is not None:
+            _validate_hub_auto(self.hub_id, self.auto_discovery)
 
 
-@dataclass
+@dataclass(slots=True)
 class MerakiConfigSchema:
     """Complete configuration schema for Meraki Dashboard integration."""
 
@@ -220,50 +390,90 @@ class MerakiConfigSchema:
     hub_auto_discovery: dict[str, bool] = field(default_factory=dict)
 
     # Tiered refresh intervals
-    static_data_interval: int = STATIC_DATA_REFRESH_INTERVAL_MINUTES * 60
-    semi_static_data_interval: int = SEMI_STATIC_DATA_REFRESH_INTERVAL_MINUTES * 60
-    dynamic_data_interval: int = DYNAMIC_DATA_REFRESH_INTERVAL_MINUTES * 60
+    static_data_interval: int = STATIC_DATA_REFRESH_INTERVAL
+    semi_static_data_interval: int = SEMI_STATIC_DATA_REFRESH_INTERVAL
+    dynamic_data_interval: int = DYNAMIC_DATA_REFRESH_INTERVAL
 
     def __post_init__(self) -> None:
-        """Validate complete configuration after initialization."""
+        """Validate complete configuration after initialization.
+
+        Every field is checked and all failures are reported together, so a
+        configuration with several problems can be fixed in one pass.
+
+        Raises:
+            ConfigurationError: Listing every invalid field
+        """
+        errors: list[str] = []
+
+        def check(field_name: str, validator: Callable[..., None], *args: Any) -> None:
+            try:
+                validator(*args)
+            except ConfigurationError as err:
+                errors.append(f"{field_name}: {err.message}")
+
         # Validate core configuration
-        APIKeyConfig(self.api_key)
-        BaseURLConfig(self.base_url)
+        check("api_key", _validate_api_key, self.api_key)
+        check("base_url", _validate_base_url, self.base_url, REGIONAL_BASE_URLS_SET)
         if self.organization_id:  # Only validate if provided
-            OrganizationIDConfig(self.organization_id)
+            check("organization_id", _validate_org_id, self.organization_id)
 
         # Validate global intervals
-        IntervalConfig(self.scan_interval, min_seconds=60, max_seconds=3600)
-        IntervalConfig(self.discovery_interval, min_seconds=300, max_seconds=86400)
+        check("scan_interval", validate_interval, self.scan_interval, 60, 3600)
+        check(
+            "discovery_interval", validate_interval, self.discovery_interval, 300, 86400
+        )
 
         # Validate auto discovery
-        if not isinstance(self.auto_discovery, bool):
-            raise ConfigurationError("Auto discovery must be a boolean")
+        check("auto_discovery", _validate_auto_discovery, self.auto_discovery)
 
         # Validate selected devices
         if not isinstance(self.selected_devices, list):
-            raise ConfigurationError("Selected devices must be a list")
-
-        for serial in self.selected_devices:
-            DeviceSerialConfig(serial)
+            errors.append("selected_devices: Selected devices must be a list")
+        else:
+            # Fast path: a single subset check per serial, falling back to the
+            # full validator only to build a precise error message. Duplicate
+            # serials (e.g. from re-configure flows) are dropped, keeping order.
+            unique: dict[str, None] = {}
+            for index, serial in enumerate(self.selected_devices):
+                if type(serial) is str and serial and _SERIAL_CHARS.issuperset(serial):
+                    unique[serial] = None
+                else:
+                    check(f"selected_devices[{index}]", _validate_serial, serial)
+            self.selected_devices = list(unique)
 
         # Validate hub-specific configurations
         for hub_id, interval in self.hub_scan_intervals.items():
-            HubIntervalConfig(hub_id, scan_interval=interval)
+            check(
+                f"hub_scan_intervals[{hub_id!r}]", _validate_hub_scan, hub_id, interval
+            )
 
         for hub_id, interval in self.hub_discovery_intervals.items():
-            HubIntervalConfig(hub_id, discovery_interval=interval)
+            check(
+                f"hub_discovery_intervals[{hub_id!r}]",
+                _validate_hub_discovery,
+                hub_id,
+                interval,
+            )
 
         for hub_id, enabled in self.hub_auto_discovery.items():
-            HubIntervalConfig(hub_id, auto_discovery=enabled)
+            check(
+                f"hub_auto_discovery[{hub_id!r}]", _validate_hub_auto, hub_id, enabled
+            )
 
         # Validate tiered refresh intervals
-        TieredRefreshConfig(
-            static_interval=self.static_data_interval,
-            semi_static_interval=self.semi_static_data_interval,
-            dynamic_interval=self.dynamic_data_interval,
+        check(
+            "tiered_refresh",
+            _validate_tiered_intervals,
+            self.static_data_interval,
+            self.semi_static_data_interval,
+            self.dynamic_data_interval,
         )
 
+        if errors:
+            raise ConfigurationError(
+                "Configuration errors:\n  - " + "\n  - ".join(errors)
+            )
+
     @classmethod
     def from_config_entry(
         cls, data: dict[str, Any], options: dict[str, Any] | None = None
@@ -277,35 +487,15 @@ class MerakiConfigSchema:
         Returns:
             Validated configuration schema
         """
-        options = options or {}
+        merged = {**_DEFAULT_OPTIONS, **(options or {})}
 
         return cls(
             # Core configuration from data
             api_key=data["api_key"],
             base_url=data.get("base_url", DEFAULT_BASE_URL),
             organization_id=data.get("organization_id", ""),
-            # Options configuration
-            scan_interval=options.get("scan_interval", DEFAULT_SCAN_INTERVAL),
-            auto_discovery=options.get("auto_discovery", True),
-            discovery_interval=options.get(
-                "discovery_interval", DEFAULT_DISCOVERY_INTERVAL
-            ),
-            selected_devices=options.get("selected_devices", []),
-            # Hub-specific configuration
-            hub_scan_intervals=options.get("hub_scan_intervals", {}),
-            hub_discovery_intervals=options.get("hub_discovery_intervals", {}),
-            hub_auto_discovery=options.get("hub_auto_discovery", {}),
-            # Tiered refresh intervals
-            static_data_interval=options.get(
-                "static_data_interval", STATIC_DATA_REFRESH_INTERVAL_MINUTES * 60
-            ),
-            semi_static_data_interval=options.get(
-                "semi_static_data_interval",
-                SEMI_STATIC_DATA_REFRESH_INTERVAL_MINUTES * 60,
-            ),
-            dynamic_data_interval=options.get(
-                "dynamic_data_interval", DYNAMIC_DATA_REFRESH_INTERVAL_MINUTES * 60
-            ),
+            # Options configuration, falling back to defaults
+            **{key: _fresh(merged[key]) for key in _DEFAULT_OPTIONS},
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -331,6 +521,21 @@ class MerakiConfigSchema:
         }
 
 
+def _validate_config(config: dict[str, Any]) -> None:
+    """Validate a flat configuration dictionary against the schema.
+
+    Args:
+        config: Combined config entry data and options
+
+    Raises:
+        ConfigurationError: If the configuration is invalid
+    """
+    MerakiConfigSchema.from_config_entry(
+        data={k: v for k, v in config.items() if k in _CONFIG_DATA_KEYS},
+        options={k: v for k, v in config.items() if k not in _CONFIG_DATA_KEYS},
+    )
+
+
 def validate_config_migration(
     old_config: dict[str, Any], new_config: dict[str, Any]
 ) -> bool:
@@ -354,20 +559,13 @@ def validate_config_migration(
     if old_config.get("organization_id") != new_config.get("organization_id"):
         raise ConfigurationError("Organization ID cannot be changed during migration")
 
+    # Nothing changed, so there is nothing new to validate
+    if old_config == new_config:
+        return True
+
     # Validate the new configuration
     try:
-        MerakiConfigSchema.from_config_entry(
-            data={
-                k: v
-                for k, v in new_config.items()
-                if k in ["api_key", "base_url", "organization_id"]
-            },
-            options={
-                k: v
-                for k, v in new_config.items()
-                if k not in ["api_key", "base_url", "organization_id"]
-            },
-        )
+        _validate_config(new_config)
     except Exception as e:
         raise ConfigurationError(f"Invalid configuration after migration: {e}") from e
 
@@ -75,6 +75,23 @@ for logger_name in loggers_to_configure:
     logger.setLevel(logging.ERROR)
     logger.propagate = False
 
+# Schemas for steps whose fields don't depend on flow state, built once
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_API_KEY): str,
+        vol.Optional(CONF_BASE_URL, default=DEFAULT_BASE_URL): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[
+                    selector.SelectOptionDict(value=url, label=region)
+                    for region, url in REGIONAL_BASE_URLS.items()
+                ],
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            )
+        ),
+    }
+)
+_REAUTH_SCHEMA = vol.Schema({vol.Required(CONF_API_KEY): str})
+
 
 class MerakiDashboardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Meraki Dashboard.
@@ -154,22 +171,7 @@ class MerakiDashboardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_API_KEY): str,
-                    vol.Optional(
-                        CONF_BASE_URL, default=DEFAULT_BASE_URL
-                    ): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[
-                                selector.SelectOptionDict(value=url, label=region)
-                                for region, url in REGIONAL_BASE_URLS.items()
-                            ],
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
-                }
-            ),
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -476,11 +478,7 @@ class MerakiDashboardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 if err.status == 401:
                     return self.async_show_form(
                         step_id="reauth",
-                        data_schema=vol.Schema(
-                            {
-                                vol.Required(CONF_API_KEY): str,
-                            }
-                        ),
+                        data_schema=_REAUTH_SCHEMA,
                         errors={"api_key": "invalid_auth"},
                         description_placeholders={
                             "organization_name": reauth_entry.title,
@@ -489,11 +487,7 @@ class MerakiDashboardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 elif err.status == 403:
                     return self.async_show_form(
                         step_id="reauth",
-                        data_schema=vol.Schema(
-                            {
-                                vol.Required(CONF_API_KEY): str,
-                            }
-                        ),
+                        data_schema=_REAUTH_SCHEMA,
                         errors={"api_key": "no_access"},
                         description_placeholders={
                             "organization_name": reauth_entry.title,
@@ -502,11 +496,7 @@ class MerakiDashboardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 else:
                     return self.async_show_form(
                         step_id="reauth",
-                        data_schema=vol.Schema(
-                            {
-                                vol.Required(CONF_API_KEY): str,
-                            }
-                        ),
+                        data_schema=_REAUTH_SCHEMA,
                         errors={"base": "cannot_connect"},
                         description_placeholders={
                             "organization_name": reauth_entry.title,
@@ -515,11 +505,7 @@ class MerakiDashboardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except Exception:
                 return self.async_show_form(
                     step_id="reauth",
-                    data_schema=vol.Schema(
-                        {
-                            vol.Required(CONF_API_KEY): str,
-                        }
-                    ),
+                    data_schema=_REAUTH_SCHEMA,
                     errors={"base": "unknown"},
                     description_placeholders={
                         "organization_name": reauth_entry.title,
@@ -528,11 +514,7 @@ class MerakiDashboardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_API_KEY): str,
-                }
-            ),
+            data_schema=_REAUTH_SCHEMA,
             description_placeholders={
                 "organization_name": reauth_entry.title,
             },
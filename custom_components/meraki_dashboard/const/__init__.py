@@ -0,0 +1,330 @@
+"""Constants for the Meraki Dashboard integration.
+
+Constants shared across the integration are defined here. Device-specific
+sensor metrics live in per-device-type submodules and are resolved lazily
+(PEP 562), so a submodule is only imported the first time one of its names
+is accessed.
+"""
+
+from __future__ import annotations
+
+import importlib
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from .mr import (
+        MR_SENSOR_CHANNEL_UTILIZATION_NON_WIFI_5,
+        MR_SENSOR_CHANNEL_UTILIZATION_NON_WIFI_24,
+        MR_SENSOR_CHANNEL_UTILIZATION_TOTAL_5,
+        MR_SENSOR_CHANNEL_UTILIZATION_TOTAL_24,
+        MR_SENSOR_CHANNEL_UTILIZATION_WIFI_5,
+        MR_SENSOR_CHANNEL_UTILIZATION_WIFI_24,
+        MR_SENSOR_CLIENT_COUNT,
+        MR_SENSOR_ENABLED_SSIDS,
+        MR_SENSOR_MEMORY_USAGE,
+        MR_SENSOR_OPEN_SSIDS,
+        MR_SENSOR_SSID_COUNT,
+        MRSensor,
+    )
+    from .ms import (
+        MS_SENSOR_CONNECTED_CLIENTS,
+        MS_SENSOR_CONNECTED_PORTS,
+        MS_SENSOR_MEMORY_USAGE,
+        MS_SENSOR_POE_LIMIT,
+        MS_SENSOR_POE_PORTS,
+        MS_SENSOR_POE_POWER,
+        MS_SENSOR_PORT_COUNT,
+        MS_SENSOR_PORT_DISCARDS,
+        MS_SENSOR_PORT_ERRORS,
+        MS_SENSOR_PORT_LINK_COUNT,
+        MS_SENSOR_PORT_TRAFFIC_RECV,
+        MS_SENSOR_PORT_TRAFFIC_SENT,
+        MS_SENSOR_PORT_UTILIZATION,
+        MS_SENSOR_PORT_UTILIZATION_RECV,
+        MS_SENSOR_PORT_UTILIZATION_SENT,
+        MS_SENSOR_POWER_MODULE_STATUS,
+        MSSensor,
+    )
+    from .mt import (
+        MT_BINARY_SENSOR_METRICS,
+        MT_EVENT_SENSOR_METRICS,
+        MT_POWER_SENSORS,
+        MT_SENSOR_APPARENT_POWER,
+        MT_SENSOR_BATTERY,
+        MT_SENSOR_BUTTON,
+        MT_SENSOR_CO2,
+        MT_SENSOR_CURRENT,
+        MT_SENSOR_DOOR,
+        MT_SENSOR_DOWNSTREAM_POWER,
+        MT_SENSOR_FREQUENCY,
+        MT_SENSOR_HUMIDITY,
+        MT_SENSOR_INDOOR_AIR_QUALITY,
+        MT_SENSOR_NOISE,
+        MT_SENSOR_PM25,
+        MT_SENSOR_POWER_FACTOR,
+        MT_SENSOR_REAL_POWER,
+        MT_SENSOR_REMOTE_LOCKOUT_SWITCH,
+        MT_SENSOR_TEMPERATURE,
+        MT_SENSOR_TVOC,
+        MT_SENSOR_VOLTAGE,
+        MT_SENSOR_WATER,
+        MTSensor,
+    )
+    from .org import (
+        ORG_SENSOR_ALERTS_COUNT,
+        ORG_SENSOR_API_CALLS,
+        ORG_SENSOR_BLUETOOTH_CLIENTS_TOTAL_COUNT,
+        ORG_SENSOR_CLIENTS_TOTAL_COUNT,
+        ORG_SENSOR_CLIENTS_USAGE_AVERAGE_TOTAL,
+        ORG_SENSOR_CLIENTS_USAGE_OVERALL_DOWNSTREAM,
+        ORG_SENSOR_CLIENTS_USAGE_OVERALL_TOTAL,
+        ORG_SENSOR_CLIENTS_USAGE_OVERALL_UPSTREAM,
+        ORG_SENSOR_DEVICE_COUNT,
+        ORG_SENSOR_DEVICE_STATUS,
+        ORG_SENSOR_FAILED_API_CALLS,
+        ORG_SENSOR_LICENSE_EXPIRING,
+        ORG_SENSOR_LICENSE_INVENTORY,
+        ORG_SENSOR_NETWORK_COUNT,
+        ORG_SENSOR_OFFLINE_DEVICES,
+        ORG_SENSOR_RECENT_ALERTS,
+        ORG_SENSOR_UPLINK_STATUS,
+        OrgSensor,
+    )
+
+# Lazily resolved name -> submodule that defines it
+_LAZY: dict[str, str] = {
+    "MTSensor": ".mt",
+    "MT_SENSOR_APPARENT_POWER": ".mt",
+    "MT_SENSOR_BATTERY": ".mt",
+    "MT_SENSOR_BUTTON": ".mt",
+    "MT_SENSOR_CO2": ".mt",
+    "MT_SENSOR_CURRENT": ".mt",
+    "MT_SENSOR_DOOR": ".mt",
+    "MT_SENSOR_DOWNSTREAM_POWER": ".mt",
+    "MT_SENSOR_FREQUENCY": ".mt",
+    "MT_SENSOR_HUMIDITY": ".mt",
+    "MT_SENSOR_INDOOR_AIR_QUALITY": ".mt",
+    "MT_SENSOR_NOISE": ".mt",
+    "MT_SENSOR_PM25": ".mt",
+    "MT_SENSOR_POWER_FACTOR": ".mt",
+    "MT_SENSOR_REAL_POWER": ".mt",
+    "MT_SENSOR_REMOTE_LOCKOUT_SWITCH": ".mt",
+    "MT_SENSOR_TEMPERATURE": ".mt",
+    "MT_SENSOR_TVOC": ".mt",
+    "MT_SENSOR_VOLTAGE": ".mt",
+    "MT_SENSOR_WATER": ".mt",
+    "MT_POWER_SENSORS": ".mt",
+    "MT_BINARY_SENSOR_METRICS": ".mt",
+    "MT_EVENT_SENSOR_METRICS": ".mt",
+    "MRSensor": ".mr",
+    "MR_SENSOR_SSID_COUNT": ".mr",
+    "MR_SENSOR_ENABLED_SSIDS": ".mr",
+    "MR_SENSOR_OPEN_SSIDS": ".mr",
+    "MR_SENSOR_CLIENT_COUNT": ".mr",
+    "MR_SENSOR_MEMORY_USAGE": ".mr",
+    "MR_SENSOR_CHANNEL_UTILIZATION_TOTAL_24": ".mr",
+    "MR_SENSOR_CHANNEL_UTILIZATION_WIFI_24": ".mr",
+    "MR_SENSOR_CHANNEL_UTILIZATION_NON_WIFI_24": ".mr",
+    "MR_SENSOR_CHANNEL_UTILIZATION_TOTAL_5": ".mr",
+    "MR_SENSOR_CHANNEL_UTILIZATION_WIFI_5": ".mr",
+    "MR_SENSOR_CHANNEL_UTILIZATION_NON_WIFI_5": ".mr",
+    "MSSensor": ".ms",
+    "MS_SENSOR_PORT_COUNT": ".ms",
+    "MS_SENSOR_CONNECTED_PORTS": ".ms",
+    "MS_SENSOR_POE_PORTS": ".ms",
+    "MS_SENSOR_PORT_UTILIZATION_SENT": ".ms",
+    "MS_SENSOR_PORT_UTILIZATION_RECV": ".ms",
+    "MS_SENSOR_PORT_TRAFFIC_SENT": ".ms",
+    "MS_SENSOR_PORT_TRAFFIC_RECV": ".ms",
+    "MS_SENSOR_POE_POWER": ".ms",
+    "MS_SENSOR_CONNECTED_CLIENTS": ".ms",
+    "MS_SENSOR_POWER_MODULE_STATUS": ".ms",
+    "MS_SENSOR_PORT_ERRORS": ".ms",
+    "MS_SENSOR_PORT_DISCARDS": ".ms",
+    "MS_SENSOR_PORT_LINK_COUNT": ".ms",
+    "MS_SENSOR_POE_LIMIT": ".ms",
+    "MS_SENSOR_PORT_UTILIZATION": ".ms",
+    "MS_SENSOR_MEMORY_USAGE": ".ms",
+    "OrgSensor": ".org",
+    "ORG_SENSOR_API_CALLS": ".org",
+    "ORG_SENSOR_FAILED_API_CALLS": ".org",
+    "ORG_SENSOR_DEVICE_COUNT": ".org",
+    "ORG_SENSOR_NETWORK_COUNT": ".org",
+    "ORG_SENSOR_OFFLINE_DEVICES": ".org",
+    "ORG_SENSOR_ALERTS_COUNT": ".org",
+    "ORG_SENSOR_LICENSE_EXPIRING": ".org",
+    "ORG_SENSOR_CLIENTS_TOTAL_COUNT": ".org",
+    "ORG_SENSOR_CLIENTS_USAGE_OVERALL_TOTAL": ".org",
+    "ORG_SENSOR_CLIENTS_USAGE_OVERALL_DOWNSTREAM": ".org",
+    "ORG_SENSOR_CLIENTS_USAGE_OVERALL_UPSTREAM": ".org",
+    "ORG_SENSOR_CLIENTS_USAGE_AVERAGE_TOTAL": ".org",
+    "ORG_SENSOR_BLUETOOTH_CLIENTS_TOTAL_COUNT": ".org",
+    "ORG_SENSOR_DEVICE_STATUS": ".org",
+    "ORG_SENSOR_LICENSE_INVENTORY": ".org",
+    "ORG_SENSOR_RECENT_ALERTS": ".org",
+    "ORG_SENSOR_UPLINK_STATUS": ".org",
+}
+
+
+# Domain constant
+DOMAIN: Final = "meraki_dashboard"
+
+# Integration name
+DEFAULT_NAME: Final = "Meraki Dashboard"
+
+# Device types
+SENSOR_TYPE_MT: Final = "MT"  # Environmental sensors
+SENSOR_TYPE_MR: Final = "MR"  # Wireless access points
+SENSOR_TYPE_MS: Final = "MS"  # Switches
+SENSOR_TYPE_MV: Final = "MV"  # Cameras
+
+# Configuration keys
+# Main configuration
+CONF_API_KEY: Final = "api_key"
+CONF_BASE_URL: Final = "base_url"
+CONF_ORGANIZATION_ID: Final = "organization_id"
+CONF_NETWORKS: Final = "networks"
+CONF_SCAN_INTERVAL: Final = "scan_interval"
+CONF_SELECTED_DEVICES: Final = "selected_devices"
+CONF_AUTO_DISCOVERY: Final = "auto_discovery"
+CONF_DISCOVERY_INTERVAL: Final = "discovery_interval"
+
+# Per-hub configuration
+CONF_HUB_SCAN_INTERVALS: Final = "hub_scan_intervals"
+CONF_HUB_DISCOVERY_INTERVALS: Final = "hub_discovery_intervals"
+CONF_HUB_AUTO_DISCOVERY: Final = "hub_auto_discovery"
+
+# Tiered refresh configuration
+CONF_STATIC_DATA_INTERVAL: Final = "static_data_interval"
+CONF_SEMI_STATIC_DATA_INTERVAL: Final = "semi_static_data_interval"
+CONF_DYNAMIC_DATA_INTERVAL: Final = "dynamic_data_interval"
+
+# Hub types
+HUB_TYPE_ORGANIZATION: Final = "organization"
+HUB_TYPE_NETWORK: Final = "network"
+
+# Entity attributes
+ATTR_NETWORK_ID: Final = "network_id"
+ATTR_NETWORK_NAME: Final = "network_name"
+ATTR_SERIAL: Final = "serial"
+ATTR_MODEL: Final = "model"
+ATTR_LAST_REPORTED_AT: Final = "last_reported_at"
+
+# Event configuration
+EVENT_TYPE: Final = "meraki_dashboard_event"
+EVENT_DEVICE_ID: Final = "device_id"
+EVENT_DEVICE_SERIAL: Final = "device_serial"
+EVENT_SENSOR_TYPE: Final = "sensor_type"
+EVENT_VALUE: Final = "value"
+EVENT_PREVIOUS_VALUE: Final = "previous_value"
+EVENT_TIMESTAMP: Final = "timestamp"
+
+# API Configuration
+USER_AGENT: Final = "MerakiDashboardHomeAssistant rknightion"
+DEFAULT_BASE_URL: Final = "https://api.meraki.com/api/v1"
+REGIONAL_BASE_URLS: Final = {
+    "Global": "https://api.meraki.com/api/v1",
+    "Canada": "https://api.meraki.ca/api/v1",
+    "China": "https://api.meraki.cn/api/v1",
+    "India": "https://api.meraki.in/api/v1",
+    "US Government": "https://api.gov-meraki.com/api/v1",
+}
+REGIONAL_BASE_URLS_SET: Final = frozenset(REGIONAL_BASE_URLS.values())
+
+# Scan intervals (in seconds)
+DEFAULT_SCAN_INTERVAL: Final = 300  # 5 minutes
+MIN_SCAN_INTERVAL: Final = 60  # 1 minute
+DEFAULT_DISCOVERY_INTERVAL: Final = 3600  # 1 hour
+MIN_DISCOVERY_INTERVAL: Final = 300  # 5 minutes
+
+# Device type specific intervals (in seconds)
+DEVICE_TYPE_SCAN_INTERVALS: Final = MappingProxyType(
+    {
+        SENSOR_TYPE_MT: 600,  # 10 minutes for environmental sensors
+        SENSOR_TYPE_MR: 300,  # 5 minutes for wireless access points
+        SENSOR_TYPE_MS: 300,  # 5 minutes for switches
+        SENSOR_TYPE_MV: 600,  # 10 minutes for cameras
+    }
+)
+
+# UI display intervals (in minutes)
+DEFAULT_SCAN_INTERVAL_MINUTES: Final = MappingProxyType(
+    {
+        SENSOR_TYPE_MT: 10,
+        SENSOR_TYPE_MR: 5,
+        SENSOR_TYPE_MS: 5,
+        SENSOR_TYPE_MV: 10,
+    }
+)
+
+DEFAULT_DISCOVERY_INTERVAL_MINUTES: Final = 60  # 1 hour
+MIN_SCAN_INTERVAL_MINUTES: Final = 1
+MIN_DISCOVERY_INTERVAL_MINUTES: Final = 5
+
+# Tiered refresh intervals (in seconds)
+STATIC_DATA_REFRESH_INTERVAL: Final = 14400  # 4 hours
+STATIC_DATA_REFRESH_INTERVAL_MINUTES: Final = 240  # 4 hours
+SEMI_STATIC_DATA_REFRESH_INTERVAL: Final = 3600  # 1 hour
+SEMI_STATIC_DATA_REFRESH_INTERVAL_MINUTES: Final = 60  # 1 hour
+DYNAMIC_DATA_REFRESH_INTERVAL: Final = 600  # 10 minutes
+DYNAMIC_DATA_REFRESH_INTERVAL_MINUTES: Final = 10  # 10 minutes
+
+# Data type classifications
+STATIC_DATA_TYPES: Final = frozenset({"license_inventory", "device_statuses"})
+SEMI_STATIC_DATA_TYPES: Final = frozenset({"network_info", "device_info"})
+DYNAMIC_DATA_TYPES: Final = frozenset({"sensor_readings", "uplink_status"})
+
+# Device type mappings
+DEVICE_TYPE_MAPPINGS: Final = MappingProxyType(
+    {
+        SENSOR_TYPE_MT: MappingProxyType(
+            {
+                "name_suffix": "Environmental Sensor",
+                "description": "Environmental monitoring sensors for temperature, humidity, air quality, etc.",
+                "model_prefixes": ("MT",),
+            }
+        ),
+        SENSOR_TYPE_MR: MappingProxyType(
+            {
+                "name_suffix": "Wireless Access Point",
+                "description": "Wireless access points providing WiFi connectivity and network metrics",
+                "model_prefixes": ("MR",),
+            }
+        ),
+        SENSOR_TYPE_MS: MappingProxyType(
+            {
+                "name_suffix": "Switch",
+                "description": "Network switches providing port status, PoE power, and traffic metrics",
+                "model_prefixes": ("MS",),
+            }
+        ),
+        SENSOR_TYPE_MV: MappingProxyType(
+            {
+                "name_suffix": "Camera",
+                "description": "Security cameras providing video analytics and motion detection",
+                "model_prefixes": ("MV",),
+            }
+        ),
+    }
+)
+
+# Organization hub suffix
+ORG_HUB_SUFFIX: Final = "Organisation"
+
+
+def __getattr__(name: str) -> Any:
+    """Import a constant on first access and cache it on the package."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    attr = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in dir() output."""
+    return sorted({*globals(), *_LAZY})
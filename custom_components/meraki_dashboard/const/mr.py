@@ -0,0 +1,39 @@
+"""MR (wireless) sensor constants for the Meraki Dashboard integration."""
+
+from enum import StrEnum
+from typing import Final
+
+
+class MRSensor(StrEnum):
+    """MR (Wireless) sensor metrics."""
+
+    SSID_COUNT = "ssid_count"
+    ENABLED_SSIDS = "enabled_ssids"
+    OPEN_SSIDS = "open_ssids"
+    CLIENT_COUNT = "client_count"
+    MEMORY_USAGE = "memory_usage"
+    # Channel utilization metrics for 2.4GHz
+    CHANNEL_UTILIZATION_TOTAL_24 = "channel_utilization_total_24"
+    CHANNEL_UTILIZATION_WIFI_24 = "channel_utilization_wifi_24"
+    CHANNEL_UTILIZATION_NON_WIFI_24 = "channel_utilization_non_wifi_24"
+    # Channel utilization metrics for 5GHz
+    CHANNEL_UTILIZATION_TOTAL_5 = "channel_utilization_total_5"
+    CHANNEL_UTILIZATION_WIFI_5 = "channel_utilization_wifi_5"
+    CHANNEL_UTILIZATION_NON_WIFI_5 = "channel_utilization_non_wifi_5"
+
+
+MR_SENSOR_SSID_COUNT: Final = MRSensor.SSID_COUNT
+MR_SENSOR_ENABLED_SSIDS: Final = MRSensor.ENABLED_SSIDS
+MR_SENSOR_OPEN_SSIDS: Final = MRSensor.OPEN_SSIDS
+MR_SENSOR_CLIENT_COUNT: Final = MRSensor.CLIENT_COUNT
+MR_SENSOR_MEMORY_USAGE: Final = MRSensor.MEMORY_USAGE
+MR_SENSOR_CHANNEL_UTILIZATION_TOTAL_24: Final = MRSensor.CHANNEL_UTILIZATION_TOTAL_24
+MR_SENSOR_CHANNEL_UTILIZATION_WIFI_24: Final = MRSensor.CHANNEL_UTILIZATION_WIFI_24
+MR_SENSOR_CHANNEL_UTILIZATION_NON_WIFI_24: Final = (
+    MRSensor.CHANNEL_UTILIZATION_NON_WIFI_24
+)
+MR_SENSOR_CHANNEL_UTILIZATION_TOTAL_5: Final = MRSensor.CHANNEL_UTILIZATION_TOTAL_5
+MR_SENSOR_CHANNEL_UTILIZATION_WIFI_5: Final = MRSensor.CHANNEL_UTILIZATION_WIFI_5
+MR_SENSOR_CHANNEL_UTILIZATION_NON_WIFI_5: Final = (
+    MRSensor.CHANNEL_UTILIZATION_NON_WIFI_5
+)
@@ -0,0 +1,43 @@
+"""MS (switch) sensor constants for the Meraki Dashboard integration."""
+
+from enum import StrEnum
+from typing import Final
+
+
+class MSSensor(StrEnum):
+    """MS (Switch) sensor metrics."""
+
+    PORT_COUNT = "port_count"
+    CONNECTED_PORTS = "connected_ports"
+    POE_PORTS = "poe_ports"
+    PORT_UTILIZATION_SENT = "port_utilization_sent"
+    PORT_UTILIZATION_RECV = "port_utilization_recv"
+    PORT_TRAFFIC_SENT = "port_traffic_sent"
+    PORT_TRAFFIC_RECV = "port_traffic_recv"
+    POE_POWER = "poe_power"
+    CONNECTED_CLIENTS = "connected_clients"
+    POWER_MODULE_STATUS = "power_module_status"
+    PORT_ERRORS = "port_errors"
+    PORT_DISCARDS = "port_discards"
+    PORT_LINK_COUNT = "port_link_count"
+    POE_LIMIT = "poe_limit"
+    PORT_UTILIZATION = "port_utilization"
+    MEMORY_USAGE = "memory_usage"
+
+
+MS_SENSOR_PORT_COUNT: Final = MSSensor.PORT_COUNT
+MS_SENSOR_CONNECTED_PORTS: Final = MSSensor.CONNECTED_PORTS
+MS_SENSOR_POE_PORTS: Final = MSSensor.POE_PORTS
+MS_SENSOR_PORT_UTILIZATION_SENT: Final = MSSensor.PORT_UTILIZATION_SENT
+MS_SENSOR_PORT_UTILIZATION_RECV: Final = MSSensor.PORT_UTILIZATION_RECV
+MS_SENSOR_PORT_TRAFFIC_SENT: Final = MSSensor.PORT_TRAFFIC_SENT
+MS_SENSOR_PORT_TRAFFIC_RECV: Final = MSSensor.PORT_TRAFFIC_RECV
+MS_SENSOR_POE_POWER: Final = MSSensor.POE_POWER
+MS_SENSOR_CONNECTED_CLIENTS: Final = MSSensor.CONNECTED_CLIENTS
+MS_SENSOR_POWER_MODULE_STATUS: Final = MSSensor.POWER_MODULE_STATUS
+MS_SENSOR_PORT_ERRORS: Final = MSSensor.PORT_ERRORS
+MS_SENSOR_PORT_DISCARDS: Final = MSSensor.PORT_DISCARDS
+MS_SENSOR_PORT_LINK_COUNT: Final = MSSensor.PORT_LINK_COUNT
+MS_SENSOR_POE_LIMIT: Final = MSSensor.POE_LIMIT
+MS_SENSOR_PORT_UTILIZATION: Final = MSSensor.PORT_UTILIZATION
+MS_SENSOR_MEMORY_USAGE: Final = MSSensor.MEMORY_USAGE
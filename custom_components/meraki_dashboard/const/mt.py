@@ -0,0 +1,79 @@
+"""MT (environmental) sensor constants for the Meraki Dashboard integration."""
+
+from enum import StrEnum
+from typing import Final
+
+
+class MTSensor(StrEnum):
+    """MT (Environmental) sensor metrics."""
+
+    APPARENT_POWER = "apparentPower"
+    BATTERY = "battery"
+    BUTTON = "button"
+    CO2 = "co2"
+    CURRENT = "current"
+    DOOR = "door"
+    DOWNSTREAM_POWER = "downstreamPower"
+    FREQUENCY = "frequency"
+    HUMIDITY = "humidity"
+    INDOOR_AIR_QUALITY = "indoorAirQuality"
+    NOISE = "noise"
+    PM25 = "pm25"
+    POWER_FACTOR = "powerFactor"
+    REAL_POWER = "realPower"
+    REMOTE_LOCKOUT_SWITCH = "remoteLockoutSwitch"
+    TEMPERATURE = "temperature"
+    TVOC = "tvoc"
+    VOLTAGE = "voltage"
+    WATER = "water"
+
+
+MT_SENSOR_APPARENT_POWER: Final = MTSensor.APPARENT_POWER
+MT_SENSOR_BATTERY: Final = MTSensor.BATTERY
+MT_SENSOR_BUTTON: Final = MTSensor.BUTTON
+MT_SENSOR_CO2: Final = MTSensor.CO2
+MT_SENSOR_CURRENT: Final = MTSensor.CURRENT
+MT_SENSOR_DOOR: Final = MTSensor.DOOR
+MT_SENSOR_DOWNSTREAM_POWER: Final = MTSensor.DOWNSTREAM_POWER
+MT_SENSOR_FREQUENCY: Final = MTSensor.FREQUENCY
+MT_SENSOR_HUMIDITY: Final = MTSensor.HUMIDITY
+MT_SENSOR_INDOOR_AIR_QUALITY: Final = MTSensor.INDOOR_AIR_QUALITY
+MT_SENSOR_NOISE: Final = MTSensor.NOISE
+MT_SENSOR_PM25: Final = MTSensor.PM25
+MT_SENSOR_POWER_FACTOR: Final = MTSensor.POWER_FACTOR
+MT_SENSOR_REAL_POWER: Final = MTSensor.REAL_POWER
+MT_SENSOR_REMOTE_LOCKOUT_SWITCH: Final = MTSensor.REMOTE_LOCKOUT_SWITCH
+MT_SENSOR_TEMPERATURE: Final = MTSensor.TEMPERATURE
+MT_SENSOR_TVOC: Final = MTSensor.TVOC
+MT_SENSOR_VOLTAGE: Final = MTSensor.VOLTAGE
+MT_SENSOR_WATER: Final = MTSensor.WATER
+
+# Sensor groupings
+MT_POWER_SENSORS: Final = frozenset(
+    {
+        MT_SENSOR_APPARENT_POWER,
+        MT_SENSOR_REAL_POWER,
+        MT_SENSOR_CURRENT,
+        MT_SENSOR_VOLTAGE,
+        MT_SENSOR_FREQUENCY,
+        MT_SENSOR_POWER_FACTOR,
+    }
+)
+
+MT_BINARY_SENSOR_METRICS: Final = frozenset(
+    {
+        MT_SENSOR_BUTTON,
+        MT_SENSOR_DOOR,
+        MT_SENSOR_DOWNSTREAM_POWER,
+        MT_SENSOR_REMOTE_LOCKOUT_SWITCH,
+        MT_SENSOR_WATER,
+    }
+)
+
+MT_EVENT_SENSOR_METRICS: Final = frozenset(
+    {
+        MT_SENSOR_BUTTON,
+        MT_SENSOR_DOOR,
+        MT_SENSOR_WATER,
+    }
+)
@@ -0,0 +1,51 @@
+"""Organization sensor constants for the Meraki Dashboard integration."""
+
+from enum import StrEnum
+from typing import Final
+
+
+class OrgSensor(StrEnum):
+    """Organization-level metrics."""
+
+    API_CALLS = "api_calls"
+    FAILED_API_CALLS = "failed_api_calls"
+    DEVICE_COUNT = "device_count"
+    NETWORK_COUNT = "network_count"
+    OFFLINE_DEVICES = "offline_devices"
+    ALERTS_COUNT = "alerts_count"
+    LICENSE_EXPIRING = "license_expiring"
+    CLIENTS_TOTAL_COUNT = "clients_total_count"
+    CLIENTS_USAGE_OVERALL_TOTAL = "clients_usage_overall_total"
+    CLIENTS_USAGE_OVERALL_DOWNSTREAM = "clients_usage_overall_downstream"
+    CLIENTS_USAGE_OVERALL_UPSTREAM = "clients_usage_overall_upstream"
+    CLIENTS_USAGE_AVERAGE_TOTAL = "clients_usage_average_total"
+    BLUETOOTH_CLIENTS_TOTAL_COUNT = "bluetooth_clients_total_count"
+    DEVICE_STATUS = "device_status"
+    LICENSE_INVENTORY = "license_inventory"
+    RECENT_ALERTS = "recent_alerts"
+    UPLINK_STATUS = "uplink_status"
+
+
+ORG_SENSOR_API_CALLS: Final = OrgSensor.API_CALLS
+ORG_SENSOR_FAILED_API_CALLS: Final = OrgSensor.FAILED_API_CALLS
+ORG_SENSOR_DEVICE_COUNT: Final = OrgSensor.DEVICE_COUNT
+ORG_SENSOR_NETWORK_COUNT: Final = OrgSensor.NETWORK_COUNT
+ORG_SENSOR_OFFLINE_DEVICES: Final = OrgSensor.OFFLINE_DEVICES
+ORG_SENSOR_ALERTS_COUNT: Final = OrgSensor.ALERTS_COUNT
+ORG_SENSOR_LICENSE_EXPIRING: Final = OrgSensor.LICENSE_EXPIRING
+ORG_SENSOR_CLIENTS_TOTAL_COUNT: Final = OrgSensor.CLIENTS_TOTAL_COUNT
+ORG_SENSOR_CLIENTS_USAGE_OVERALL_TOTAL: Final = OrgSensor.CLIENTS_USAGE_OVERALL_TOTAL
+ORG_SENSOR_CLIENTS_USAGE_OVERALL_DOWNSTREAM: Final = (
+    OrgSensor.CLIENTS_USAGE_OVERALL_DOWNSTREAM
+)
+ORG_SENSOR_CLIENTS_USAGE_OVERALL_UPSTREAM: Final = (
+    OrgSensor.CLIENTS_USAGE_OVERALL_UPSTREAM
+)
+ORG_SENSOR_CLIENTS_USAGE_AVERAGE_TOTAL: Final = OrgSensor.CLIENTS_USAGE_AVERAGE_TOTAL
+ORG_SENSOR_BLUETOOTH_CLIENTS_TOTAL_COUNT: Final = (
+    OrgSensor.BLUETOOTH_CLIENTS_TOTAL_COUNT
+)
+ORG_SENSOR_DEVICE_STATUS: Final = OrgSensor.DEVICE_STATUS
+ORG_SENSOR_LICENSE_INVENTORY: Final = OrgSensor.LICENSE_INVENTORY
+ORG_SENSOR_RECENT_ALERTS: Final = OrgSensor.RECENT_ALERTS
+ORG_SENSOR_UPLINK_STATUS: Final = OrgSensor.UPLINK_STATUS
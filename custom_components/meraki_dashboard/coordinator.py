@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Coroutine, Mapping, Sequence
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
+from .const import DOMAIN, SENSOR_TYPE_MR, SENSOR_TYPE_MS, SENSOR_TYPE_MT
+from .data.transformers import transformer_registry
 from .types import CoordinatorData, MerakiDeviceData
 from .utils import performance_monitor
 from .utils.error_handling import handle_api_errors
@@ -33,7 +36,7 @@ class MerakiSensorCoordinator(DataUpdateCoordinator[CoordinatorData]):
         self,
         hass: HomeAssistant,
         hub: MerakiNetworkHub,
-        devices: list[MerakiDeviceData],
+        devices: Sequence[MerakiDeviceData],
         scan_interval: int,
         config_entry: ConfigEntry,
     ) -> None:
@@ -83,6 +86,59 @@ class MerakiSensorCoordinator(DataUpdateCoordinator[CoordinatorData]):
         """Get the duration of the last update in seconds."""
         return self._last_update_duration
 
+    async def _async_fetch_mt_data(self) -> CoordinatorData:
+        """Fetch MT sensor readings keyed by device serial."""
+        _LOGGER.debug("Fetching MT sensor data from hub %s", self.hub.hub_name)
+        data = await self.hub.async_get_sensor_data()
+        # Readings transformed for the previous payloads are stale now
+        transformer_registry.clear_cache(SENSOR_TYPE_MT)
+        _LOGGER.debug("Retrieved MT data for %d devices", len(data) if data else 0)
+        return data
+
+    async def _async_fetch_mr_data(self) -> CoordinatorData:
+        """Fetch MR wireless data and the network's wireless events."""
+        _LOGGER.debug("Fetching MR wireless data from hub %s", self.hub.hub_name)
+        # Update wireless data and return it
+        await self.hub._async_setup_wireless_data()
+        data = self.hub.wireless_data or {}
+        _LOGGER.debug("Retrieved MR wireless data with %d entries", len(data))
+
+        # Also fetch network events for wireless devices
+        try:
+            await self.hub.async_fetch_network_events()
+        except Exception as event_err:
+            _LOGGER.debug("Failed to fetch wireless network events: %s", event_err)
+        return data
+
+    async def _async_fetch_ms_data(self) -> CoordinatorData:
+        """Fetch MS switch data and the network's switch events."""
+        _LOGGER.debug("Fetching MS switch data from hub %s", self.hub.hub_name)
+        # Update switch data and return it
+        await self.hub._async_setup_switch_data()
+        data = self.hub.switch_data or {}
+        _LOGGER.debug("Retrieved MS switch data with %d entries", len(data))
+
+        # Also fetch network events for switch devices
+        try:
+            await self.hub.async_fetch_network_events()
+        except Exception as event_err:
+            _LOGGER.debug("Failed to fetch switch network events: %s", event_err)
+        return data
+
+    # Data fetcher for each hub device type
+    _FETCHERS: ClassVar[
+        Mapping[
+            str,
+            Callable[[MerakiSensorCoordinator], Coroutine[Any, Any, CoordinatorData]],
+        ]
+    ] = MappingProxyType(
+        {
+            SENSOR_TYPE_MT: _async_fetch_mt_data,
+            SENSOR_TYPE_MR: _async_fetch_mr_data,
+            SENSOR_TYPE_MS: _async_fetch_ms_data,
+        }
+    )
+
     @performance_monitor("coordinator_update")
     @with_standard_retries("realtime")
     @handle_api_errors(reraise_on=(UpdateFailed,))
@@ -107,46 +163,12 @@ class MerakiSensorCoordinator(DataUpdateCoordinator[CoordinatorData]):
 
         try:
             # Get data from the hub based on device type
-            if self.hub.device_type == "MT":
-                _LOGGER.debug("Fetching MT sensor data from hub %s", self.hub.hub_name)
-                data = await self.hub.async_get_sensor_data()
-                _LOGGER.debug(
-                    "Retrieved MT data for %d devices", len(data) if data else 0
-                )
-            elif self.hub.device_type == "MR":
-                _LOGGER.debug(
-                    "Fetching MR wireless data from hub %s", self.hub.hub_name
-                )
-                # Update wireless data and return it
-                await self.hub._async_setup_wireless_data()
-                data = self.hub.wireless_data or {}
-                _LOGGER.debug("Retrieved MR wireless data with %d entries", len(data))
-
-                # Also fetch network events for wireless devices
-                try:
-                    await self.hub.async_fetch_network_events()
-                except Exception as event_err:
-                    _LOGGER.debug(
-                        "Failed to fetch wireless network events: %s", event_err
-                    )
-
-            elif self.hub.device_type == "MS":
-                _LOGGER.debug("Fetching MS switch data from hub %s", self.hub.hub_name)
-                # Update switch data and return it
-                await self.hub._async_setup_switch_data()
-                data = self.hub.switch_data or {}
-                _LOGGER.debug("Retrieved MS switch data with %d entries", len(data))
-
-                # Also fetch network events for switch devices
-                try:
-                    await self.hub.async_fetch_network_events()
-                except Exception as event_err:
-                    _LOGGER.debug(
-                        "Failed to fetch switch network events: %s", event_err
-                    )
-            else:
+            fetch = self._FETCHERS.get(self.hub.device_type)
+            if fetch is None:
                 _LOGGER.warning("Unknown device type: %s", self.hub.device_type)
                 data = {}
+            else:
+                data = await fetch(self)
 
             # Track update duration
             self._last_update_duration = self.hass.loop.time() - update_start_time
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 from ..const import (
@@ -69,6 +70,11 @@ class DataTransformer(ABC):
         """
         pass
 
+    def clear_cache(self) -> None:
+        """Drop any results kept between coordinator updates."""
+        # Stateless transformers keep nothing to clear
+        return None
+
 
 class UnitConverter:
     """Utility class for consistent unit conversions."""
@@ -195,78 +201,85 @@ class SafeExtractor:
 
 
 class MTSensorDataTransformer(DataTransformer):
-    """Transformer for MT (Environmental) sensor data."""
+    """Transformer for MT (Environmental) sensor data.
+
+    Every entity of an MT device transforms the same device payload, so the
+    result is kept per serial and reused until the coordinator replaces that
+    device's payload or clears the cache on its next update.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the per-device transform cache and metric dispatch table."""
+        self._last_transform: dict[str, tuple[dict[str, Any], dict[str, Any]]] = {}
+
+        # Metric name -> extractor taking just the reading; one dict lookup per
+        # reading replaces a chain of string comparisons
+        self._extractors: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "temperature": self._extract_temperature_value,
+            "humidity": self._extract_humidity_value,
+            "co2": self._extract_co2_value,
+            "battery": self._extract_battery_value,
+            "indoorAirQuality": self._extract_iaq_value,
+            # Motion and the other binary sensors always yield a bool
+            "motion": self._extract_motion_value,
+        }
+        for metric in ("pm25", "tvoc"):
+            self._extractors[metric] = partial(
+                self._extract_concentration_value, metric=metric
+            )
+        self._extractors["noise"] = partial(self._extract_noise_value, metric="noise")
+        for metric in ("realPower", "apparentPower"):
+            self._extractors[metric] = partial(self._extract_power_value, metric=metric)
+        for metric in ("voltage", "current", "frequency", "powerFactor"):
+            self._extractors[metric] = partial(
+                self._extract_electrical_value, metric=metric
+            )
+        for metric in (
+            "button",
+            "door",
+            "water",
+            "remoteLockoutSwitch",
+            "downstreamPower",
+        ):
+            self._extractors[metric] = partial(
+                self._extract_binary_value, metric=metric
+            )
 
     def transform(self, raw_data: dict[str, Any]) -> dict[str, Any]:
         """Transform MT sensor readings to standardized format."""
-        transformed: dict[str, Any] = {}
+        serial = raw_data.get("serial")
+        cached = self._last_transform.get(serial) if serial else None
+        if cached is not None and cached[0] is raw_data:
+            # Callers get their own copy so they can't alter the cached result
+            return dict(cached[1])
+
+        transformed = self._transform_readings(raw_data)
+        if serial:
+            self._last_transform[serial] = (raw_data, transformed)
+            return dict(transformed)
+        return transformed
 
-        readings = raw_data.get("readings", [])
+    def clear_cache(self) -> None:
+        """Forget cached transforms so updated payloads are read again."""
+        self._last_transform.clear()
 
-        for reading in readings:
+    def _transform_readings(self, raw_data: dict[str, Any]) -> dict[str, Any]:
+        """Extract a value for each metric in the device's readings."""
+        transformed: dict[str, Any] = {}
+        extractors = self._extractors
+
+        for reading in raw_data.get("readings", []):
             metric = reading.get("metric")
             if not metric:
                 continue
 
-            # Transform specific MT metrics based on API format
-            if metric == "temperature":
-                value = self._extract_temperature_value(reading)
-                if value is not None:
-                    transformed[metric] = value
-
-            elif metric == "humidity":
-                value = self._extract_humidity_value(reading)
-                if value is not None:
-                    transformed[metric] = value
-
-            elif metric == "co2":
-                value = self._extract_co2_value(reading)
-                if value is not None:
-                    transformed[metric] = value
-
-            elif metric == "battery":
-                value = self._extract_battery_value(reading)
-                if value is not None:
-                    transformed[metric] = value
-
-            elif metric in ["pm25", "tvoc"]:
-                value = self._extract_concentration_value(reading, metric)
-                if value is not None:
-                    transformed[metric] = value
-
-            elif metric == "noise":
-                value = self._extract_noise_value(reading, metric)
-                if value is not None:
-                    transformed[metric] = value
-
-            elif metric in ["realPower", "apparentPower"]:
-                value = self._extract_power_value(reading, metric)
-                if value is not None:
-                    transformed[metric] = value
-
-            elif metric in ["voltage", "current", "frequency", "powerFactor"]:
-                value = self._extract_electrical_value(reading, metric)
-                if value is not None:
-                    transformed[metric] = value
-
-            elif metric == "indoorAirQuality":
-                value = self._extract_iaq_value(reading)
-                if value is not None:
-                    transformed[metric] = value
-
-            elif metric == "motion":
-                # Motion is a binary sensor
-                transformed[metric] = self._extract_motion_value(reading)
-
-            elif metric in [
-                "button",
-                "door",
-                "water",
-                "remoteLockoutSwitch",
-                "downstreamPower",
-            ]:
-                # Binary sensors
-                transformed[metric] = self._extract_binary_value(reading, metric)
+            extract = extractors.get(metric)
+            if extract is None:
+                continue
+
+            value = extract(reading)
+            if value is not None:
+                transformed[metric] = value
 
         # Add metadata
         transformed["_timestamp"] = raw_data.get("ts")
@@ -314,9 +327,10 @@ class MTSensorDataTransformer(DataTransformer):
         self, reading: dict[str, Any], metric: str
     ) -> float | None:
         """Extract power value from API format."""
-        # API returns power metrics with "draw" field in watts
+        # API returns power metrics with "draw" field in watts; "value" is the
+        # alternative field, folded in here so consumers get a single number
         power_data = reading.get(metric, {})
-        return SafeExtractor.safe_float(power_data.get("draw"))
+        return SafeExtractor.safe_float(power_data.get("draw", power_data.get("value")))
 
     def _extract_electrical_value(
         self, reading: dict[str, Any], metric: str
@@ -703,6 +717,12 @@ class TransformerRegistry:
             _LOGGER.warning("No transformer found for device type: %s", device_type)
             return raw_data
 
+    def clear_cache(self, device_type: str) -> None:
+        """Clear results cached by a device type's transformer."""
+        transformer = self.get_device_transformer(device_type)
+        if transformer:
+            transformer.clear_cache()
+
     def transform(self, entity_type: str, raw_value: Any) -> Any:
         """Transform raw API value to entity value.
 
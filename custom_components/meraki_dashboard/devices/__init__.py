@@ -1,24 +1,58 @@
-"""Device-specific implementations for Meraki Dashboard integration."""
-
-from .mr import MerakiMRDeviceSensor, MerakiMRSensor
-from .ms import MerakiMSDeviceSensor, MerakiMSSensor
-from .mt import MerakiMTEnergySensor, MerakiMTSensor
-from .organization import (
-    MerakiHubAlertsCountSensor,
-    MerakiHubApiCallsSensor,
-    MerakiHubBluetoothClientsTotalCountSensor,
-    MerakiHubClientsTotalCountSensor,
-    MerakiHubClientsUsageAverageTotalSensor,
-    MerakiHubClientsUsageOverallDownstreamSensor,
-    MerakiHubClientsUsageOverallTotalSensor,
-    MerakiHubClientsUsageOverallUpstreamSensor,
-    MerakiHubDeviceCountSensor,
-    MerakiHubFailedApiCallsSensor,
-    MerakiHubLicenseExpiringSensor,
-    MerakiHubNetworkCountSensor,
-    MerakiHubOfflineDevicesSensor,
-    MerakiNetworkDeviceCountSensor,
-)
+"""Device-specific implementations for Meraki Dashboard integration.
+
+Sensor classes are resolved lazily (PEP 562) so a device submodule is only
+imported the first time one of its classes is accessed.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .mr import MerakiMRDeviceSensor, MerakiMRSensor
+    from .ms import MerakiMSDeviceSensor, MerakiMSSensor
+    from .mt import MerakiMTEnergySensor, MerakiMTSensor
+    from .organization import (
+        MerakiHubAlertsCountSensor,
+        MerakiHubApiCallsSensor,
+        MerakiHubBluetoothClientsTotalCountSensor,
+        MerakiHubClientsTotalCountSensor,
+        MerakiHubClientsUsageAverageTotalSensor,
+        MerakiHubClientsUsageOverallDownstreamSensor,
+        MerakiHubClientsUsageOverallTotalSensor,
+        MerakiHubClientsUsageOverallUpstreamSensor,
+        MerakiHubDeviceCountSensor,
+        MerakiHubFailedApiCallsSensor,
+        MerakiHubLicenseExpiringSensor,
+        MerakiHubNetworkCountSensor,
+        MerakiHubOfflineDevicesSensor,
+        MerakiNetworkDeviceCountSensor,
+    )
+
+# Public name -> submodule that defines it
+_LAZY: dict[str, str] = {
+    "MerakiMTSensor": ".mt",
+    "MerakiMTEnergySensor": ".mt",
+    "MerakiMRSensor": ".mr",
+    "MerakiMRDeviceSensor": ".mr",
+    "MerakiMSSensor": ".ms",
+    "MerakiMSDeviceSensor": ".ms",
+    "MerakiHubAlertsCountSensor": ".organization",
+    "MerakiHubApiCallsSensor": ".organization",
+    "MerakiHubBluetoothClientsTotalCountSensor": ".organization",
+    "MerakiHubClientsTotalCountSensor": ".organization",
+    "MerakiHubClientsUsageAverageTotalSensor": ".organization",
+    "MerakiHubClientsUsageOverallDownstreamSensor": ".organization",
+    "MerakiHubClientsUsageOverallTotalSensor": ".organization",
+    "MerakiHubClientsUsageOverallUpstreamSensor": ".organization",
+    "MerakiHubDeviceCountSensor": ".organization",
+    "MerakiHubFailedApiCallsSensor": ".organization",
+    "MerakiHubLicenseExpiringSensor": ".organization",
+    "MerakiHubNetworkCountSensor": ".organization",
+    "MerakiHubOfflineDevicesSensor": ".organization",
+    "MerakiNetworkDeviceCountSensor": ".organization",
+}
 
 __all__ = [
     "MerakiMTSensor",
@@ -42,3 +76,20 @@ __all__ = [
     "MerakiHubOfflineDevicesSensor",
     "MerakiNetworkDeviceCountSensor",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a sensor class on first access and cache it on the package."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    attr = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in dir() output."""
+    return sorted({*globals(), *__all__})
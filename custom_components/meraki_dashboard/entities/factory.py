@@ -8,11 +8,13 @@ and entity instantiation for all supported device types.
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from functools import cache, lru_cache, partial
+from types import MappingProxyType, ModuleType
 from typing import Any, TypeVar, cast
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
-from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity import Entity, EntityDescription
 
 from ..const import (
     MR_SENSOR_CHANNEL_UTILIZATION_NON_WIFI_5,
@@ -72,827 +74,457 @@ _LOGGER = logging.getLogger(__name__)
 # Type variable for entity types
 EntityT = TypeVar("EntityT", bound=Entity)
 
+# Device type for each two-character model prefix (e.g. "MT" for MT10)
+_MODEL_PREFIX: Mapping[str, str] = MappingProxyType(
+    {
+        "MT": SENSOR_TYPE_MT,
+        "MR": SENSOR_TYPE_MR,
+        "MS": SENSOR_TYPE_MS,
+        "MV": SENSOR_TYPE_MV,
+    }
+)
 
-class EntityFactory:
-    """Factory for creating Meraki entities with decorator-based registration.
 
-    This factory provides:
-    - Registration of entity creation functions by device type and metric type
-    - Discovery of available entities for a device
-    - Batch entity creation for devices
-    - Type-safe entity instantiation
+# Organizations typically have many devices of a handful of models; the cache
+# is bounded so unexpected model strings can't grow it without limit
+@lru_cache(maxsize=128)
+def _device_type_for_model(model: str) -> str | None:
+    """Determine device type from a device model string."""
+    return _MODEL_PREFIX.get(model[:2])
+
+
+SensorClassAndDescriptions = tuple[type[Entity], Mapping[str, EntityDescription]]
+
+
+# Entity classes and descriptions are resolved lazily to avoid circular imports,
+# then cached so creating each entity doesn't run the import machinery again
+@cache
+def _device_modules() -> Mapping[str, ModuleType]:
+    """Import the device sensor modules together on first entity creation."""
+    from ..devices import mr, ms, mt, organization
+
+    return MappingProxyType(
+        {"mr": mr, "ms": ms, "mt": mt, "organization": organization}
+    )
+
+
+@cache
+def _device_class(module: str, class_name: str) -> type[Entity]:
+    """Resolve a sensor class from one of the device sensor modules."""
+    return getattr(_device_modules()[module], class_name)
+
+
+@lru_cache(maxsize=1)
+def _mt() -> SensorClassAndDescriptions:
+    """Resolve the MT sensor class and descriptions on first use."""
+    from ..sensor import MT_SENSOR_DESCRIPTIONS
+
+    return _device_class("mt", "MerakiMTSensor"), MT_SENSOR_DESCRIPTIONS
+
+
+@lru_cache(maxsize=1)
+def _mt_binary() -> SensorClassAndDescriptions:
+    """Resolve the MT binary sensor class and descriptions on first use."""
+    from ..binary_sensor import MT_BINARY_SENSOR_DESCRIPTIONS, MerakiMTBinarySensor
+
+    return MerakiMTBinarySensor, MT_BINARY_SENSOR_DESCRIPTIONS
+
+
+@lru_cache(maxsize=1)
+def _mr() -> SensorClassAndDescriptions:
+    """Resolve the MR device sensor class and descriptions on first use."""
+    from ..sensor import MR_SENSOR_DESCRIPTIONS
+
+    return _device_class("mr", "MerakiMRDeviceSensor"), MR_SENSOR_DESCRIPTIONS
+
+
+@lru_cache(maxsize=1)
+def _ms() -> SensorClassAndDescriptions:
+    """Resolve the MS device sensor class and descriptions on first use."""
+    from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
+
+    return _device_class("ms", "MerakiMSDeviceSensor"), MS_DEVICE_SENSOR_DESCRIPTIONS
+
+
+# Device entity creators keyed by (device_type, entity_type)
+_registry: dict[tuple[str, str], Callable[..., Entity]] = {}
+# Hub-level and legacy creators keyed by entity type name
+_legacy_registry: dict[str, Callable[..., Entity]] = {}
+# Registered metrics per device type, mapped to their registration position:
+# an ordered set that supports O(1) membership and set-based filtering
+_device_capabilities: dict[str, dict[str, int]] = {}
+# Device types (and _LEGACY for hub-level entities) whose built-in entities
+# have been registered; they register on first use. This and the class
+# resolvers above are the factory's only cached state, see _reset_registry.
+_registered_types: set[str] = set()
+_LEGACY = "_legacy"
+
+
+def register(device_type: str, entity_type: str) -> Callable:
+    """Decorator to register entity creation functions.
+
+    Args:
+        device_type: The device type (MT, MR, MS, MV)
+        entity_type: The metric/entity type (temperature, humidity, etc.)
     """
 
-    _registry: dict[str, Callable[..., Entity]] = {}
-    _device_capabilities: dict[str, list[str]] = {}
-
-    @classmethod
-    def register(cls, device_type: str, entity_type: str) -> Callable:
-        """Decorator to register entity creation functions.
-
-        Args:
-            device_type: The device type (MT, MR, MS, MV)
-            entity_type: The metric/entity type (temperature, humidity, etc.)
-        """
-
-        def decorator(func: Callable[..., EntityT]) -> Callable[..., EntityT]:
-            key = f"{device_type}_{entity_type}"
-            cls._registry[key] = func
-
-            # Track device capabilities
-            if device_type not in cls._device_capabilities:
-                cls._device_capabilities[device_type] = []
-            if entity_type not in cls._device_capabilities[device_type]:
-                cls._device_capabilities[device_type].append(entity_type)
-
-            return func
-
-        return decorator
-
-    @classmethod
-    def create_entity(
-        cls,
-        device_type: str,
-        entity_type: str,
-        *args,
-        **kwargs,
-    ) -> Entity:
-        """Create an entity of the specified type.
-
-        Args:
-            device_type: The device type
-            entity_type: The metric/entity type
-            *args: Positional arguments for entity constructor
-            **kwargs: Keyword arguments for entity constructor
-
-        Returns:
-            The created entity instance
-
-        Raises:
-            ValueError: If the entity type is not registered
-        """
-        key = f"{device_type}_{entity_type}"
-        if key not in cls._registry:
-            raise ValueError(f"Unknown entity type: {key}")
+    def decorator(func: Callable[..., EntityT]) -> Callable[..., EntityT]:
+        _registry[(device_type, entity_type)] = func
 
-        try:
-            return cls._registry[key](*args, **kwargs)
-        except Exception as e:
-            _LOGGER.error("Failed to create entity %s: %s", key, e)
-            raise
-
-    @classmethod
-    def create_entities(
-        cls,
-        coordinator: MerakiSensorCoordinator,
-        device_data: dict[str, Any],
-        config_entry_id: str,
-    ) -> list[Entity]:
-        """Create all applicable entities for a device.
-
-        This method:
-        1. Determines device type from device data
-        2. Checks device capabilities against sensor readings
-        3. Creates all supported entities
-
-        Args:
-            coordinator: The data coordinator
-            device_data: Device information and sensor data
-            config_entry_id: Config entry ID
-
-        Returns:
-            List of created entities
-        """
-        entities: list[Entity] = []
-        device_type = cls._get_device_type(device_data)
-
-        if not device_type:
-            _LOGGER.warning(
-                "Could not determine device type for %s", device_data.get("serial")
-            )
-            return entities
+        # Track device capabilities
+        capabilities = _device_capabilities.setdefault(device_type, {})
+        capabilities.setdefault(entity_type, len(capabilities))
 
-        # Get available metrics for this device
-        available_metrics = cls._get_available_metrics(device_type, device_data)
+        return func
 
-        for metric_type in available_metrics:
-            try:
-                entity = cls.create_entity(
-                    device_type, metric_type, coordinator, device_data, config_entry_id
-                )
-                entities.append(entity)
-            except Exception as e:
-                _LOGGER.error(
-                    "Failed to create %s entity for device %s: %s",
-                    metric_type,
-                    device_data.get("serial"),
-                    e,
-                )
+    return decorator
 
-        return entities
-
-    @classmethod
-    def _get_device_type(cls, device_data: dict[str, Any]) -> str | None:
-        """Determine device type from device data."""
-        model = device_data.get("model", "")
-
-        if model.startswith("MT"):
-            return SENSOR_TYPE_MT
-        elif model.startswith("MR"):
-            return SENSOR_TYPE_MR
-        elif model.startswith("MS"):
-            return SENSOR_TYPE_MS
-        elif model.startswith("MV"):
-            return SENSOR_TYPE_MV
-
-        return None
-
-    @classmethod
-    def _get_available_metrics(
-        cls, device_type: str, device_data: dict[str, Any]
-    ) -> list[str]:
-        """Get available metrics for a device based on its capabilities."""
-        # Start with all registered metrics for this device type
-        potential_metrics = cls._device_capabilities.get(device_type, [])
-        available_metrics = []
-
-        # Check each metric against device capabilities
-        sensor_data = device_data.get("sensor", {})
-
-        for metric in potential_metrics:
-            # Check if device reports this metric
-            if metric in sensor_data:
-                available_metrics.append(metric)
-            # Special cases for derived metrics
-            elif metric == MT_SENSOR_INDOOR_AIR_QUALITY and "tvoc" in sensor_data:
-                available_metrics.append(metric)
-            # Add more special cases as needed
-
-        return available_metrics
-
-    @classmethod
-    def get_registered_types(cls) -> list[str]:
-        """Get list of all registered entity types."""
-        return list(cls._registry.keys())
-
-    @classmethod
-    def get_device_capabilities(cls, device_type: str) -> list[str]:
-        """Get all possible capabilities for a device type."""
-        return cls._device_capabilities.get(device_type, [])
-
-    @classmethod
-    def is_registered(cls, device_type: str, entity_type: str) -> bool:
-        """Check if an entity type is registered for a device type."""
-        return f"{device_type}_{entity_type}" in cls._registry
-
-
-# Import and register all entity types (using lazy imports to avoid circular imports)
-def _register_mt_entities():
-    """Register MT (Environmental) sensor entities."""
-
-    # Temperature sensor
-    @EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_TEMPERATURE)
-    def create_mt_temperature(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.mt import MerakiMTSensor
-        from ..sensor import MT_SENSOR_DESCRIPTIONS
-
-        return MerakiMTSensor(
-            coordinator,
-            device,
-            MT_SENSOR_DESCRIPTIONS["temperature"],
-            config_entry_id,
-            network_hub,
-        )
 
-    # Humidity sensor
-    @EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_HUMIDITY)
-    def create_mt_humidity(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.mt import MerakiMTSensor
-        from ..sensor import MT_SENSOR_DESCRIPTIONS
-
-        return MerakiMTSensor(
-            coordinator,
-            device,
-            MT_SENSOR_DESCRIPTIONS["humidity"],
-            config_entry_id,
-            network_hub,
-        )
+def _ensure_registered(device_type: str) -> None:
+    """Register the built-in entities for a device type on first use."""
+    if device_type in _registered_types:
+        return
+    _registered_types.add(device_type)
+    _register_device_entities(device_type)
 
-    # CO2 sensor
-    @EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_CO2)
-    def create_mt_co2(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.mt import MerakiMTSensor
-        from ..sensor import MT_SENSOR_DESCRIPTIONS
-
-        return MerakiMTSensor(
-            coordinator,
-            device,
-            MT_SENSOR_DESCRIPTIONS["co2"],
-            config_entry_id,
-            network_hub,
-        )
 
-    # TVOC sensor
-    @EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_TVOC)
-    def create_mt_tvoc(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.mt import MerakiMTSensor
-        from ..sensor import MT_SENSOR_DESCRIPTIONS
-
-        return MerakiMTSensor(
-            coordinator,
-            device,
-            MT_SENSOR_DESCRIPTIONS["tvoc"],
-            config_entry_id,
-            network_hub,
-        )
+def _ensure_legacy_registered() -> None:
+    """Register the hub-level and legacy entities on first use."""
+    if _LEGACY in _registered_types:
+        return
+    _registered_types.add(_LEGACY)
+    _register_organization_entities()
 
-    # PM2.5 sensor
-    @EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_PM25)
-    def create_mt_pm25(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.mt import MerakiMTSensor
-        from ..sensor import MT_SENSOR_DESCRIPTIONS
-
-        return MerakiMTSensor(
-            coordinator,
-            device,
-            MT_SENSOR_DESCRIPTIONS["pm25"],
-            config_entry_id,
-            network_hub,
-        )
 
-    # Noise sensor
-    @EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_NOISE)
-    def create_mt_noise(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.mt import MerakiMTSensor
-        from ..sensor import MT_SENSOR_DESCRIPTIONS
-
-        return MerakiMTSensor(
-            coordinator,
-            device,
-            MT_SENSOR_DESCRIPTIONS["noise"],
-            config_entry_id,
-            network_hub,
-        )
+def _reset_registry() -> None:
+    """Drop all registrations and cached class lookups.
 
-    # Indoor Air Quality sensor
-    @EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_INDOOR_AIR_QUALITY)
-    def create_mt_iaq(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.mt import MerakiMTSensor
-        from ..sensor import MT_SENSOR_DESCRIPTIONS
-
-        return MerakiMTSensor(
-            coordinator,
-            device,
-            MT_SENSOR_DESCRIPTIONS["indoorAirQuality"],
-            config_entry_id,
-            network_hub,
-        )
+    Built-in entities register again on next use; entities registered through
+    register() must be registered again.
+    """
+    _registry.clear()
+    _legacy_registry.clear()
+    _device_capabilities.clear()
+    _registered_types.clear()
+    for resolver in (_device_modules, _device_class, _mt, _mt_binary, _mr, _ms):
+        resolver.cache_clear()
 
-    # Battery sensor
-    @EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_BATTERY)
-    def create_mt_battery(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.mt import MerakiMTSensor
-        from ..sensor import MT_SENSOR_DESCRIPTIONS
-
-        return MerakiMTSensor(
-            coordinator,
-            device,
-            MT_SENSOR_DESCRIPTIONS["battery"],
-            config_entry_id,
-            network_hub,
-        )
 
-    # Binary sensors for MT devices
-    @EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_WATER)
-    def create_mt_water_binary(coordinator, device, config_entry_id, network_hub=None):
-        from ..binary_sensor import MT_BINARY_SENSOR_DESCRIPTIONS, MerakiMTBinarySensor
-
-        return MerakiMTBinarySensor(
-            coordinator,
-            device,
-            MT_BINARY_SENSOR_DESCRIPTIONS["water"],
-            config_entry_id,
-            network_hub,
-        )
+def create_entity(
+    device_type: str,
+    entity_type: str,
+    *args,
+    **kwargs,
+) -> Entity:
+    """Create an entity of the specified type.
 
-    @EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_DOOR)
-    def create_mt_door_binary(coordinator, device, config_entry_id, network_hub=None):
-        from ..binary_sensor import MT_BINARY_SENSOR_DESCRIPTIONS, MerakiMTBinarySensor
+    Args:
+        device_type: The device type
+        entity_type: The metric/entity type
+        *args: Positional arguments for entity constructor
+        **kwargs: Keyword arguments for entity constructor
 
-        return MerakiMTBinarySensor(
-            coordinator,
-            device,
-            MT_BINARY_SENSOR_DESCRIPTIONS["door"],
-            config_entry_id,
-            network_hub,
-        )
+    Returns:
+        The created entity instance
 
-    # Power Factor sensor
-    @EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_POWER_FACTOR)
-    def create_mt_power_factor(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.mt import MerakiMTSensor
-        from ..sensor import MT_SENSOR_DESCRIPTIONS
-
-        return MerakiMTSensor(
-            coordinator,
-            device,
-            MT_SENSOR_DESCRIPTIONS["powerFactor"],
-            config_entry_id,
-            network_hub,
-        )
+    Raises:
+        ValueError: If the entity type is not registered
+    """
+    _ensure_registered(device_type)
+    creator = _registry.get((device_type, entity_type))
+    if creator is None:
+        raise ValueError(f"Unknown entity type: {device_type}_{entity_type}")
 
-    # Real Power sensor
-    @EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_REAL_POWER)
-    def create_mt_real_power(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.mt import MerakiMTSensor
-        from ..sensor import MT_SENSOR_DESCRIPTIONS
-
-        return MerakiMTSensor(
-            coordinator,
-            device,
-            MT_SENSOR_DESCRIPTIONS["realPower"],
-            config_entry_id,
-            network_hub,
-        )
+    # Creation failures propagate; create_entities logs and skips them
+    return creator(*args, **kwargs)
 
-    # Voltage sensor
-    @EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_VOLTAGE)
-    def create_mt_voltage(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.mt import MerakiMTSensor
-        from ..sensor import MT_SENSOR_DESCRIPTIONS
-
-        return MerakiMTSensor(
-            coordinator,
-            device,
-            MT_SENSOR_DESCRIPTIONS["voltage"],
-            config_entry_id,
-            network_hub,
-        )
 
-    # Current sensor
-    @EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_CURRENT)
-    def create_mt_current(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.mt import MerakiMTSensor
-        from ..sensor import MT_SENSOR_DESCRIPTIONS
-
-        return MerakiMTSensor(
-            coordinator,
-            device,
-            MT_SENSOR_DESCRIPTIONS["current"],
-            config_entry_id,
-            network_hub,
-        )
+def create_entities(
+    coordinator: MerakiSensorCoordinator,
+    device_data: dict[str, Any],
+    config_entry_id: str,
+) -> list[Entity]:
+    """Create all applicable entities for a device.
 
-    # Frequency sensor
-    @EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_FREQUENCY)
-    def create_mt_frequency(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.mt import MerakiMTSensor
-        from ..sensor import MT_SENSOR_DESCRIPTIONS
-
-        return MerakiMTSensor(
-            coordinator,
-            device,
-            MT_SENSOR_DESCRIPTIONS["frequency"],
-            config_entry_id,
-            network_hub,
-        )
+    This function:
+    1. Determines device type from device data
+    2. Checks device capabilities against sensor readings
+    3. Creates all supported entities
 
-    # Apparent Power sensor
-    @EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_APPARENT_POWER)
-    def create_mt_apparent_power(
-        coordinator, device, config_entry_id, network_hub=None
-    ):
-        from ..devices.mt import MerakiMTSensor
-        from ..sensor import MT_SENSOR_DESCRIPTIONS
-
-        return MerakiMTSensor(
-            coordinator,
-            device,
-            MT_SENSOR_DESCRIPTIONS["apparentPower"],
-            config_entry_id,
-            network_hub,
-        )
+    Args:
+        coordinator: The data coordinator
+        device_data: Device information and sensor data
+        config_entry_id: Config entry ID
 
+    Returns:
+        List of created entities
+    """
+    serial = device_data.get("serial")
+    device_type = _device_type_for_model(device_data.get("model", ""))
 
-def _register_mr_entities():
-    """Register MR (Wireless) sensor entities."""
+    if not device_type:
+        _LOGGER.warning("Could not determine device type for %s", serial)
+        return []
 
-    # MR device sensors
-    @EntityFactory.register(SENSOR_TYPE_MR, MR_SENSOR_CLIENT_COUNT)
-    def create_mr_client_count(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.mr import MerakiMRDeviceSensor
-        from ..sensor import MR_SENSOR_DESCRIPTIONS
+    _ensure_registered(device_type)
 
-        return MerakiMRDeviceSensor(
-            device,
-            coordinator,
-            MR_SENSOR_DESCRIPTIONS["client_count"],
-            config_entry_id,
-            network_hub,
-        )
+    # Bound once per device rather than looked up on every failed metric
+    log_error = _LOGGER.error
+    error_enabled = _LOGGER.isEnabledFor(logging.ERROR)
 
-    @EntityFactory.register(SENSOR_TYPE_MR, MR_SENSOR_MEMORY_USAGE)
-    def create_mr_memory_usage(coordinator, device, config_entry_id, network_hub=None):
-        from ..const import MR_SENSOR_MEMORY_USAGE
-        from ..devices.mr import MerakiMRDeviceSensor
-        from ..sensor import MR_SENSOR_DESCRIPTIONS
-
-        return MerakiMRDeviceSensor(
-            device,
-            coordinator,
-            MR_SENSOR_DESCRIPTIONS[MR_SENSOR_MEMORY_USAGE],
-            config_entry_id,
-            network_hub,
-        )
+    def try_create(metric_type: str) -> Entity | None:
+        try:
+            return create_entity(
+                device_type, metric_type, coordinator, device_data, config_entry_id
+            )
+        except Exception as e:
+            if error_enabled:
+                log_error(
+                    "Failed to create %s entity for device %s: %s",
+                    metric_type,
+                    serial,
+                    e,
+                )
+            return None
 
-    # SSID sensors
-    @EntityFactory.register(SENSOR_TYPE_MR, MR_SENSOR_SSID_COUNT)
-    def create_mr_ssid_count(coordinator, device, config_entry_id, network_hub=None):
-        from ..const import MR_SENSOR_SSID_COUNT
-        from ..devices.mr import MerakiMRDeviceSensor
-        from ..sensor import MR_SENSOR_DESCRIPTIONS
-
-        return MerakiMRDeviceSensor(
-            device,
-            coordinator,
-            MR_SENSOR_DESCRIPTIONS[MR_SENSOR_SSID_COUNT],
-            config_entry_id,
-            network_hub,
-        )
+    # Create entities for the metrics available on this device, skipping
+    # any that fail
+    available_metrics = _get_available_metrics(device_type, device_data)
+    return [
+        entity for entity in map(try_create, available_metrics) if entity is not None
+    ]
 
-    @EntityFactory.register(SENSOR_TYPE_MR, MR_SENSOR_ENABLED_SSIDS)
-    def create_mr_enabled_ssids(coordinator, device, config_entry_id, network_hub=None):
-        from ..const import MR_SENSOR_ENABLED_SSIDS
-        from ..devices.mr import MerakiMRDeviceSensor
-        from ..sensor import MR_SENSOR_DESCRIPTIONS
-
-        return MerakiMRDeviceSensor(
-            device,
-            coordinator,
-            MR_SENSOR_DESCRIPTIONS[MR_SENSOR_ENABLED_SSIDS],
-            config_entry_id,
-            network_hub,
-        )
 
-    @EntityFactory.register(SENSOR_TYPE_MR, MR_SENSOR_OPEN_SSIDS)
-    def create_mr_open_ssids(coordinator, device, config_entry_id, network_hub=None):
-        from ..const import MR_SENSOR_OPEN_SSIDS
-        from ..devices.mr import MerakiMRDeviceSensor
-        from ..sensor import MR_SENSOR_DESCRIPTIONS
-
-        return MerakiMRDeviceSensor(
-            device,
-            coordinator,
-            MR_SENSOR_DESCRIPTIONS[MR_SENSOR_OPEN_SSIDS],
-            config_entry_id,
-            network_hub,
-        )
+def _get_device_type(device_data: dict[str, Any]) -> str | None:
+    """Determine device type from device data."""
+    return _device_type_for_model(device_data.get("model", ""))
 
-    # Channel utilization sensors - 2.4GHz
-    @EntityFactory.register(SENSOR_TYPE_MR, MR_SENSOR_CHANNEL_UTILIZATION_TOTAL_24)
-    def create_mr_channel_util_total_24(
-        coordinator, device, config_entry_id, network_hub=None
-    ):
-        from ..const import MR_SENSOR_CHANNEL_UTILIZATION_TOTAL_24
-        from ..devices.mr import MerakiMRDeviceSensor
-        from ..sensor import MR_SENSOR_DESCRIPTIONS
-
-        return MerakiMRDeviceSensor(
-            device,
-            coordinator,
-            MR_SENSOR_DESCRIPTIONS[MR_SENSOR_CHANNEL_UTILIZATION_TOTAL_24],
-            config_entry_id,
-            network_hub,
-        )
 
-    @EntityFactory.register(SENSOR_TYPE_MR, MR_SENSOR_CHANNEL_UTILIZATION_WIFI_24)
-    def create_mr_channel_util_wifi_24(
-        coordinator, device, config_entry_id, network_hub=None
-    ):
-        from ..const import MR_SENSOR_CHANNEL_UTILIZATION_WIFI_24
-        from ..devices.mr import MerakiMRDeviceSensor
-        from ..sensor import MR_SENSOR_DESCRIPTIONS
-
-        return MerakiMRDeviceSensor(
-            device,
-            coordinator,
-            MR_SENSOR_DESCRIPTIONS[MR_SENSOR_CHANNEL_UTILIZATION_WIFI_24],
-            config_entry_id,
-            network_hub,
-        )
+def _get_available_metrics(device_type: str, device_data: dict[str, Any]) -> list[str]:
+    """Get available metrics for a device based on its capabilities."""
+    # Registered metrics for this device type
+    index = _device_capabilities.get(device_type)
+    if not index:
+        return []
 
-    @EntityFactory.register(SENSOR_TYPE_MR, MR_SENSOR_CHANNEL_UTILIZATION_NON_WIFI_24)
-    def create_mr_channel_util_non_wifi_24(
-        coordinator, device, config_entry_id, network_hub=None
-    ):
-        from ..const import MR_SENSOR_CHANNEL_UTILIZATION_NON_WIFI_24
-        from ..devices.mr import MerakiMRDeviceSensor
-        from ..sensor import MR_SENSOR_DESCRIPTIONS
-
-        return MerakiMRDeviceSensor(
-            device,
-            coordinator,
-            MR_SENSOR_DESCRIPTIONS[MR_SENSOR_CHANNEL_UTILIZATION_NON_WIFI_24],
-            config_entry_id,
-            network_hub,
-        )
+    # Metrics the device reports that are registered for its type
+    sensor_data = device_data.get("sensor", {})
+    available_metrics = index.keys() & sensor_data
 
-    # Channel utilization sensors - 5GHz
-    @EntityFactory.register(SENSOR_TYPE_MR, MR_SENSOR_CHANNEL_UTILIZATION_TOTAL_5)
-    def create_mr_channel_util_total_5(
-        coordinator, device, config_entry_id, network_hub=None
-    ):
-        from ..const import MR_SENSOR_CHANNEL_UTILIZATION_TOTAL_5
-        from ..devices.mr import MerakiMRDeviceSensor
-        from ..sensor import MR_SENSOR_DESCRIPTIONS
-
-        return MerakiMRDeviceSensor(
-            device,
-            coordinator,
-            MR_SENSOR_DESCRIPTIONS[MR_SENSOR_CHANNEL_UTILIZATION_TOTAL_5],
-            config_entry_id,
-            network_hub,
-        )
+    # Special cases for derived metrics
+    if "tvoc" in sensor_data and MT_SENSOR_INDOOR_AIR_QUALITY in index:
+        available_metrics.add(MT_SENSOR_INDOOR_AIR_QUALITY)
 
-    @EntityFactory.register(SENSOR_TYPE_MR, MR_SENSOR_CHANNEL_UTILIZATION_WIFI_5)
-    def create_mr_channel_util_wifi_5(
-        coordinator, device, config_entry_id, network_hub=None
-    ):
-        from ..const import MR_SENSOR_CHANNEL_UTILIZATION_WIFI_5
-        from ..devices.mr import MerakiMRDeviceSensor
-        from ..sensor import MR_SENSOR_DESCRIPTIONS
-
-        return MerakiMRDeviceSensor(
-            device,
-            coordinator,
-            MR_SENSOR_DESCRIPTIONS[MR_SENSOR_CHANNEL_UTILIZATION_WIFI_5],
-            config_entry_id,
-            network_hub,
-        )
+    return sorted(available_metrics, key=index.__getitem__)
 
-    @EntityFactory.register(SENSOR_TYPE_MR, MR_SENSOR_CHANNEL_UTILIZATION_NON_WIFI_5)
-    def create_mr_channel_util_non_wifi_5(
-        coordinator, device, config_entry_id, network_hub=None
-    ):
-        from ..const import MR_SENSOR_CHANNEL_UTILIZATION_NON_WIFI_5
-        from ..devices.mr import MerakiMRDeviceSensor
-        from ..sensor import MR_SENSOR_DESCRIPTIONS
-
-        return MerakiMRDeviceSensor(
-            device,
-            coordinator,
-            MR_SENSOR_DESCRIPTIONS[MR_SENSOR_CHANNEL_UTILIZATION_NON_WIFI_5],
-            config_entry_id,
-            network_hub,
-        )
 
+def get_registered_types() -> list[str]:
+    """Get list of all registered entity types.
 
-def _register_ms_entities():
-    """Register MS (Switch) sensor entities."""
+    Device entities are named "<device type>_<entity type>", followed by the
+    hub-level and legacy entity type names.
+    """
+    for device_type in _DEVICE_ENTITY_TYPES:
+        _ensure_registered(device_type)
+    _ensure_legacy_registered()
+    return [
+        *(f"{device_type}_{entity_type}" for device_type, entity_type in _registry),
+        *_legacy_registry,
+    ]
 
-    # MS device sensors
-    @EntityFactory.register(SENSOR_TYPE_MS, MS_SENSOR_PORT_COUNT)
-    def create_ms_port_count(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.ms import MerakiMSDeviceSensor
-        from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
 
-        return MerakiMSDeviceSensor(
-            device,
-            coordinator,
-            MS_DEVICE_SENSOR_DESCRIPTIONS["port_count"],
-            config_entry_id,
-            network_hub,
-        )
+def get_device_capabilities(device_type: str) -> list[str]:
+    """Get all possible capabilities for a device type."""
+    _ensure_registered(device_type)
+    return list(_device_capabilities.get(device_type, ()))
 
-    @EntityFactory.register(SENSOR_TYPE_MS, MS_SENSOR_MEMORY_USAGE)
-    def create_ms_memory_usage(coordinator, device, config_entry_id, network_hub=None):
-        from ..const import MS_SENSOR_MEMORY_USAGE
-        from ..devices.ms import MerakiMSDeviceSensor
-        from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
-
-        return MerakiMSDeviceSensor(
-            device,
-            coordinator,
-            MS_DEVICE_SENSOR_DESCRIPTIONS[MS_SENSOR_MEMORY_USAGE],
-            config_entry_id,
-            network_hub,
-        )
 
-    # Connected Ports sensor
-    @EntityFactory.register(SENSOR_TYPE_MS, MS_SENSOR_CONNECTED_PORTS)
-    def create_ms_connected_ports(
-        coordinator, device, config_entry_id, network_hub=None
-    ):
-        from ..devices.ms import MerakiMSDeviceSensor
-        from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
-
-        return MerakiMSDeviceSensor(
-            device,
-            coordinator,
-            MS_DEVICE_SENSOR_DESCRIPTIONS["connected_ports"],
-            config_entry_id,
-            network_hub,
-        )
+def is_registered(device_type: str, entity_type: str) -> bool:
+    """Check if an entity type is registered for a device type."""
+    _ensure_registered(device_type)
+    return (device_type, entity_type) in _registry
 
-    # PoE Ports sensor
-    @EntityFactory.register(SENSOR_TYPE_MS, MS_SENSOR_POE_PORTS)
-    def create_ms_poe_ports(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.ms import MerakiMSDeviceSensor
-        from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
-
-        return MerakiMSDeviceSensor(
-            device,
-            coordinator,
-            MS_DEVICE_SENSOR_DESCRIPTIONS["poe_ports"],
-            config_entry_id,
-            network_hub,
-        )
 
-    # Port Utilization Sent sensor
-    @EntityFactory.register(SENSOR_TYPE_MS, MS_SENSOR_PORT_UTILIZATION_SENT)
-    def create_ms_port_utilization_sent(
-        coordinator, device, config_entry_id, network_hub=None
-    ):
-        from ..devices.ms import MerakiMSDeviceSensor
-        from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
-
-        return MerakiMSDeviceSensor(
-            device,
-            coordinator,
-            MS_DEVICE_SENSOR_DESCRIPTIONS["port_utilization_sent"],
-            config_entry_id,
-            network_hub,
-        )
+class EntityFactory:
+    """Factory for creating Meraki entities with decorator-based registration.
 
-    # Port Utilization Received sensor
-    @EntityFactory.register(SENSOR_TYPE_MS, MS_SENSOR_PORT_UTILIZATION_RECV)
-    def create_ms_port_utilization_recv(
-        coordinator, device, config_entry_id, network_hub=None
-    ):
-        from ..devices.ms import MerakiMSDeviceSensor
-        from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
-
-        return MerakiMSDeviceSensor(
-            device,
-            coordinator,
-            MS_DEVICE_SENSOR_DESCRIPTIONS["port_utilization_recv"],
-            config_entry_id,
-            network_hub,
-        )
+    This factory provides:
+    - Registration of entity creation functions by device type and metric type
+    - Discovery of available entities for a device
+    - Batch entity creation for devices
+    - Type-safe entity instantiation
 
-    # Port Traffic Sent sensor
-    @EntityFactory.register(SENSOR_TYPE_MS, MS_SENSOR_PORT_TRAFFIC_SENT)
-    def create_ms_port_traffic_sent(
-        coordinator, device, config_entry_id, network_hub=None
-    ):
-        from ..devices.ms import MerakiMSDeviceSensor
-        from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
-
-        return MerakiMSDeviceSensor(
-            device,
-            coordinator,
-            MS_DEVICE_SENSOR_DESCRIPTIONS["port_traffic_sent"],
-            config_entry_id,
-            network_hub,
-        )
+    The factory state and logic live at module level; this class is a
+    namespace over them for existing callers.
+    """
 
-    # Port Traffic Received sensor
-    @EntityFactory.register(SENSOR_TYPE_MS, MS_SENSOR_PORT_TRAFFIC_RECV)
-    def create_ms_port_traffic_recv(
-        coordinator, device, config_entry_id, network_hub=None
-    ):
-        from ..devices.ms import MerakiMSDeviceSensor
-        from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
-
-        return MerakiMSDeviceSensor(
-            device,
-            coordinator,
-            MS_DEVICE_SENSOR_DESCRIPTIONS["port_traffic_recv"],
-            config_entry_id,
-            network_hub,
-        )
+    __slots__ = ()
+
+    _registry = _registry
+    _legacy_registry = _legacy_registry
+    _device_capabilities = _device_capabilities
+    _registered_types = _registered_types
+
+    register = staticmethod(register)
+    _ensure_registered = staticmethod(_ensure_registered)
+    _ensure_legacy_registered = staticmethod(_ensure_legacy_registered)
+    _reset_registry = staticmethod(_reset_registry)
+    create_entity = staticmethod(create_entity)
+    create_entities = staticmethod(create_entities)
+    _get_device_type = staticmethod(_get_device_type)
+    _get_available_metrics = staticmethod(_get_available_metrics)
+    get_registered_types = staticmethod(get_registered_types)
+    get_device_capabilities = staticmethod(get_device_capabilities)
+    is_registered = staticmethod(is_registered)
+
+
+# Device entities registered with the factory, in registration order:
+# (device type, class/description resolver, metrics). Metric names double as
+# the description keys.
+_DEVICE_ENTITY_SPECS: tuple[
+    tuple[str, Callable[[], SensorClassAndDescriptions], tuple[str, ...]], ...
+] = (
+    (
+        SENSOR_TYPE_MT,
+        _mt,
+        (
+            MT_SENSOR_TEMPERATURE,
+            MT_SENSOR_HUMIDITY,
+            MT_SENSOR_CO2,
+            MT_SENSOR_TVOC,
+            MT_SENSOR_PM25,
+            MT_SENSOR_NOISE,
+            MT_SENSOR_INDOOR_AIR_QUALITY,
+            MT_SENSOR_BATTERY,
+        ),
+    ),
+    (
+        SENSOR_TYPE_MT,
+        _mt_binary,
+        (
+            MT_SENSOR_WATER,
+            MT_SENSOR_DOOR,
+        ),
+    ),
+    (
+        SENSOR_TYPE_MT,
+        _mt,
+        (
+            MT_SENSOR_POWER_FACTOR,
+            MT_SENSOR_REAL_POWER,
+            MT_SENSOR_VOLTAGE,
+            MT_SENSOR_CURRENT,
+            MT_SENSOR_FREQUENCY,
+            MT_SENSOR_APPARENT_POWER,
+        ),
+    ),
+    (
+        SENSOR_TYPE_MR,
+        _mr,
+        (
+            MR_SENSOR_CLIENT_COUNT,
+            MR_SENSOR_MEMORY_USAGE,
+            MR_SENSOR_SSID_COUNT,
+            MR_SENSOR_ENABLED_SSIDS,
+            MR_SENSOR_OPEN_SSIDS,
+            MR_SENSOR_CHANNEL_UTILIZATION_TOTAL_24,
+            MR_SENSOR_CHANNEL_UTILIZATION_WIFI_24,
+            MR_SENSOR_CHANNEL_UTILIZATION_NON_WIFI_24,
+            MR_SENSOR_CHANNEL_UTILIZATION_TOTAL_5,
+            MR_SENSOR_CHANNEL_UTILIZATION_WIFI_5,
+            MR_SENSOR_CHANNEL_UTILIZATION_NON_WIFI_5,
+        ),
+    ),
+    (
+        SENSOR_TYPE_MS,
+        _ms,
+        (
+            MS_SENSOR_PORT_COUNT,
+            MS_SENSOR_MEMORY_USAGE,
+            MS_SENSOR_CONNECTED_PORTS,
+            MS_SENSOR_POE_PORTS,
+            MS_SENSOR_PORT_UTILIZATION_SENT,
+            MS_SENSOR_PORT_UTILIZATION_RECV,
+            MS_SENSOR_PORT_TRAFFIC_SENT,
+            MS_SENSOR_PORT_TRAFFIC_RECV,
+            MS_SENSOR_POE_POWER,
+            MS_SENSOR_CONNECTED_CLIENTS,
+            MS_SENSOR_PORT_ERRORS,
+            MS_SENSOR_PORT_DISCARDS,
+            MS_SENSOR_POWER_MODULE_STATUS,
+            MS_SENSOR_PORT_LINK_COUNT,
+            MS_SENSOR_POE_LIMIT,
+            MS_SENSOR_PORT_UTILIZATION,
+        ),
+    ),
+)
 
-    # PoE Power sensor
-    @EntityFactory.register(SENSOR_TYPE_MS, MS_SENSOR_POE_POWER)
-    def create_ms_poe_power(coordinator, device, config_entry_id, network_hub=None):
-        from ..const import MS_SENSOR_POE_POWER
-        from ..devices.ms import MerakiMSDeviceSensor
-        from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
-
-        return MerakiMSDeviceSensor(
-            device,
-            coordinator,
-            MS_DEVICE_SENSOR_DESCRIPTIONS[MS_SENSOR_POE_POWER],
-            config_entry_id,
-            network_hub,
-        )
+# Device types with built-in entities
+_DEVICE_ENTITY_TYPES = tuple(dict.fromkeys(spec[0] for spec in _DEVICE_ENTITY_SPECS))
 
-    # Connected Clients sensor
-    @EntityFactory.register(SENSOR_TYPE_MS, MS_SENSOR_CONNECTED_CLIENTS)
-    def create_ms_connected_clients(
-        coordinator, device, config_entry_id, network_hub=None
-    ):
-        from ..devices.ms import MerakiMSDeviceSensor
-        from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
-
-        return MerakiMSDeviceSensor(
-            device,
-            coordinator,
-            MS_DEVICE_SENSOR_DESCRIPTIONS["connected_clients"],
-            config_entry_id,
-            network_hub,
-        )
+# MR and MS device sensors take the device before the coordinator
+_DEVICE_FIRST_TYPES = frozenset({SENSOR_TYPE_MR, SENSOR_TYPE_MS})
 
-    # Port Errors sensor
-    @EntityFactory.register(SENSOR_TYPE_MS, MS_SENSOR_PORT_ERRORS)
-    def create_ms_port_errors(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.ms import MerakiMSDeviceSensor
-        from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
-
-        return MerakiMSDeviceSensor(
-            device,
-            coordinator,
-            MS_DEVICE_SENSOR_DESCRIPTIONS["port_errors"],
-            config_entry_id,
-            network_hub,
-        )
 
-    # Port Discards sensor
-    @EntityFactory.register(SENSOR_TYPE_MS, MS_SENSOR_PORT_DISCARDS)
-    def create_ms_port_discards(coordinator, device, config_entry_id, network_hub=None):
-        from ..devices.ms import MerakiMSDeviceSensor
-        from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
-
-        return MerakiMSDeviceSensor(
-            device,
-            coordinator,
-            MS_DEVICE_SENSOR_DESCRIPTIONS["port_discards"],
-            config_entry_id,
-            network_hub,
-        )
+def _make_creator(
+    resolve: Callable[[], SensorClassAndDescriptions],
+    description_key: str,
+    device_first: bool,
+) -> Callable[..., Entity]:
+    """Build an entity creation function for one sensor description."""
 
-    # Power Module Status sensor
-    @EntityFactory.register(SENSOR_TYPE_MS, MS_SENSOR_POWER_MODULE_STATUS)
-    def create_ms_power_module_status(
-        coordinator, device, config_entry_id, network_hub=None
-    ):
-        from ..devices.ms import MerakiMSDeviceSensor
-        from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
-
-        return MerakiMSDeviceSensor(
-            device,
-            coordinator,
-            MS_DEVICE_SENSOR_DESCRIPTIONS["power_module_status"],
-            config_entry_id,
-            network_hub,
+    def creator(coordinator, device, config_entry_id, network_hub=None):
+        sensor_cls, descriptions = resolve()
+        description = descriptions[description_key]
+        if device_first:
+            return sensor_cls(
+                device, coordinator, description, config_entry_id, network_hub
+            )
+        return sensor_cls(
+            coordinator, device, description, config_entry_id, network_hub
         )
 
-    # Port Link Count sensor
-    @EntityFactory.register(SENSOR_TYPE_MS, MS_SENSOR_PORT_LINK_COUNT)
-    def create_ms_port_link_count(
-        coordinator, device, config_entry_id, network_hub=None
-    ):
-        from ..devices.ms import MerakiMSDeviceSensor
-        from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
-
-        return MerakiMSDeviceSensor(
-            device,
-            coordinator,
-            MS_DEVICE_SENSOR_DESCRIPTIONS["port_link_count"],
-            config_entry_id,
-            network_hub,
-        )
+    return creator
 
-    # PoE Limit sensor
-    @EntityFactory.register(SENSOR_TYPE_MS, MS_SENSOR_POE_LIMIT)
-    def create_ms_poe_limit(coordinator, device, config_entry_id, network_hub=None):
-        from ..const import MS_SENSOR_POE_LIMIT
-        from ..devices.ms import MerakiMSDeviceSensor
-        from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
-
-        return MerakiMSDeviceSensor(
-            device,
-            coordinator,
-            MS_DEVICE_SENSOR_DESCRIPTIONS[MS_SENSOR_POE_LIMIT],
-            config_entry_id,
-            network_hub,
-        )
 
-    # Port Utilization sensor
-    @EntityFactory.register(SENSOR_TYPE_MS, MS_SENSOR_PORT_UTILIZATION)
-    def create_ms_port_utilization(
-        coordinator, device, config_entry_id, network_hub=None
-    ):
-        from ..devices.ms import MerakiMSDeviceSensor
-        from ..sensor import MS_DEVICE_SENSOR_DESCRIPTIONS
-
-        return MerakiMSDeviceSensor(
-            device,
-            coordinator,
-            MS_DEVICE_SENSOR_DESCRIPTIONS["port_utilization"],
-            config_entry_id,
-            network_hub,
-        )
+def _register_device_entities(device_type: str) -> None:
+    """Register the built-in sensor entities for one device type.
+
+    Runs on the device type's first use, so creators registered before that
+    through register() are kept rather than replaced.
+    """
+    device_first = device_type in _DEVICE_FIRST_TYPES
+    for spec_type, resolve, metrics in _DEVICE_ENTITY_SPECS:
+        if spec_type != device_type:
+            continue
+        for metric in metrics:
+            if (device_type, metric) in _registry:
+                continue
+            register(device_type, metric)(_make_creator(resolve, metric, device_first))
+
+
+# Organization and network hub entity classes by entity type
+_ORG_ENTITY_CLASSES: Mapping[str, str] = MappingProxyType(
+    {
+        "api_calls": "MerakiHubApiCallsSensor",
+        "failed_api_calls": "MerakiHubFailedApiCallsSensor",
+        "device_count": "MerakiHubDeviceCountSensor",
+        "network_count": "MerakiHubNetworkCountSensor",
+        "offline_devices": "MerakiHubOfflineDevicesSensor",
+        "online_devices": "MerakiHubOnlineDevicesSensor",
+        "alerting_devices": "MerakiHubAlertingDevicesSensor",
+        "dormant_devices": "MerakiHubDormantDevicesSensor",
+        "alerts_count": "MerakiHubAlertsCountSensor",
+        "license_expiring": "MerakiHubLicenseExpiringSensor",
+        "clients_total_count": "MerakiHubClientsTotalCountSensor",
+        "clients_usage_overall_total": "MerakiHubClientsUsageOverallTotalSensor",
+        "clients_usage_overall_downstream": "MerakiHubClientsUsageOverallDownstreamSensor",
+        "clients_usage_overall_upstream": "MerakiHubClientsUsageOverallUpstreamSensor",
+        "clients_usage_average_total": "MerakiHubClientsUsageAverageTotalSensor",
+        "bluetooth_clients_total_count": "MerakiHubBluetoothClientsTotalCountSensor",
+        "network_device_count": "MerakiNetworkDeviceCountSensor",
+    }
+)
 
 
 def _register_organization_entities():
@@ -901,159 +533,29 @@ def _register_organization_entities():
     Note: These don't follow the device type pattern as they're hub-level entities.
     """
     # Organization entities use the old pattern since they're not device-based
-    EntityFactory._registry["api_calls"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiHubApiCallsSensor", hub, description, entry_id
-        )
-    )
-    EntityFactory._registry["failed_api_calls"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiHubFailedApiCallsSensor", hub, description, entry_id
-        )
-    )
-    EntityFactory._registry["device_count"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiHubDeviceCountSensor", hub, description, entry_id
-        )
-    )
-    EntityFactory._registry["network_count"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiHubNetworkCountSensor", hub, description, entry_id
-        )
-    )
-    EntityFactory._registry["offline_devices"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiHubOfflineDevicesSensor", hub, description, entry_id
-        )
-    )
-    EntityFactory._registry["online_devices"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiHubOnlineDevicesSensor", hub, description, entry_id
-        )
-    )
-    EntityFactory._registry["alerting_devices"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiHubAlertingDevicesSensor", hub, description, entry_id
-        )
-    )
-    EntityFactory._registry["dormant_devices"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiHubDormantDevicesSensor", hub, description, entry_id
-        )
-    )
-    EntityFactory._registry["alerts_count"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiHubAlertsCountSensor", hub, description, entry_id
-        )
-    )
-    EntityFactory._registry["license_expiring"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiHubLicenseExpiringSensor", hub, description, entry_id
-        )
-    )
-    EntityFactory._registry["clients_total_count"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiHubClientsTotalCountSensor", hub, description, entry_id
-        )
-    )
-    EntityFactory._registry["clients_usage_overall_total"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiHubClientsUsageOverallTotalSensor", hub, description, entry_id
-        )
-    )
-    EntityFactory._registry["clients_usage_overall_downstream"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiHubClientsUsageOverallDownstreamSensor", hub, description, entry_id
-        )
-    )
-    EntityFactory._registry["clients_usage_overall_upstream"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiHubClientsUsageOverallUpstreamSensor", hub, description, entry_id
-        )
-    )
-    EntityFactory._registry["clients_usage_average_total"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiHubClientsUsageAverageTotalSensor", hub, description, entry_id
-        )
-    )
-    EntityFactory._registry["bluetooth_clients_total_count"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiHubBluetoothClientsTotalCountSensor", hub, description, entry_id
-        )
-    )
-    EntityFactory._registry["network_device_count"] = (
-        lambda hub, description, entry_id: _create_org_entity(
-            "MerakiNetworkDeviceCountSensor", hub, description, entry_id
-        )
+    for entity_type in _ORG_ENTITY_CLASSES:
+        _legacy_registry[entity_type] = partial(_create_org_entity, entity_type)
+
+    # Legacy device entity types without a device-type registry equivalent;
+    # mt_sensor, mr_device_sensor and ms_device_sensor are served by
+    # _LEGACY_DEVICE_ENTITY_TYPES instead
+    _legacy_registry["mt_energy_sensor"] = partial(
+        _create_device_entity, "MerakiMTEnergySensor"
     )
+    _legacy_registry["mr_sensor"] = _create_mr_sensor
+    _legacy_registry["ms_sensor"] = _create_ms_sensor
 
-    # Also register the legacy entity types for backward compatibility
-    EntityFactory._registry["mt_sensor"] = (
-        lambda coordinator,
-        device,
-        description,
-        entry_id,
-        network_hub: _create_device_entity(
-            "MerakiMTSensor", coordinator, device, description, entry_id, network_hub
-        )
-    )
-    EntityFactory._registry["mt_energy_sensor"] = (
-        lambda coordinator,
-        device,
-        description,
-        entry_id,
-        network_hub,
-        power_sensor_key: _create_device_entity(
-            "MerakiMTEnergySensor",
-            coordinator,
-            device,
-            description,
-            entry_id,
-            network_hub,
-            power_sensor_key,
-        )
-    )
-    EntityFactory._registry["mr_sensor"] = (
-        lambda coordinator,
-        device,
-        description,
-        entry_id,
-        network_hub: _create_mr_sensor(coordinator, description, entry_id)
-    )
-    EntityFactory._registry["mr_device_sensor"] = (
-        lambda coordinator,
-        device,
-        description,
-        entry_id,
-        network_hub: _create_mr_device_sensor(
-            device, coordinator, description, entry_id, network_hub
-        )
-    )
-    EntityFactory._registry["ms_sensor"] = (
-        lambda coordinator,
-        device,
-        description,
-        entry_id,
-        network_hub: _create_ms_sensor(coordinator, description, entry_id)
-    )
-    EntityFactory._registry["ms_device_sensor"] = (
-        lambda coordinator,
-        device,
-        description,
-        entry_id,
-        network_hub: _create_ms_device_sensor(
-            device, coordinator, description, entry_id, network_hub
-        )
-    )
+
+def _org_class(entity_type: str) -> type[Entity]:
+    """Resolve an organization entity class on first use."""
+    return _device_class("organization", _ORG_ENTITY_CLASSES[entity_type])
 
 
 def _create_org_entity(
-    class_name: str, hub: Any, description: Any, entry_id: str
+    entity_type: str, hub: Any, description: Any, entry_id: str
 ) -> Entity:
     """Helper to create organization entities with lazy imports."""
-    from ..devices import organization
-
-    return getattr(organization, class_name)(hub, description, entry_id)
+    return _org_class(entity_type)(hub, description, entry_id)
 
 
 def _create_device_entity(
@@ -1066,9 +568,7 @@ def _create_device_entity(
     power_sensor_key: str | None = None,
 ) -> Entity:
     """Helper to create device entities with lazy imports."""
-    from ..devices import mt
-
-    entity_class = getattr(mt, class_name)
+    entity_class = _device_class("mt", class_name)
     if power_sensor_key is not None:
         return entity_class(
             coordinator, device, description, entry_id, network_hub, power_sensor_key
@@ -1076,43 +576,44 @@ def _create_device_entity(
     return entity_class(coordinator, device, description, entry_id, network_hub)
 
 
-def _create_mr_sensor(coordinator: Any, description: Any, entry_id: str) -> Entity:
-    """Helper to create MR network sensor."""
-    from ..devices.mr import MerakiMRSensor
-
-    return MerakiMRSensor(coordinator, description, entry_id)
-
-
-def _create_mr_device_sensor(
-    device: Any, coordinator: Any, description: Any, entry_id: str, network_hub: Any
+def _create_mr_sensor(
+    coordinator: Any,
+    device: Any,
+    description: Any,
+    entry_id: str,
+    network_hub: Any,
 ) -> Entity:
-    """Helper to create MR device sensor."""
-    from ..devices.mr import MerakiMRDeviceSensor
-
-    return MerakiMRDeviceSensor(device, coordinator, description, entry_id, network_hub)
-
+    """Helper to create MR network sensor.
 
-def _create_ms_sensor(coordinator: Any, description: Any, entry_id: str) -> Entity:
-    """Helper to create MS network sensor."""
-    from ..devices.ms import MerakiMSSensor
-
-    return MerakiMSSensor(coordinator, description, entry_id)
+    Takes the legacy device entity arguments; the device and network hub are
+    unused by network-level sensors.
+    """
+    return _device_class("mr", "MerakiMRSensor")(coordinator, description, entry_id)
 
 
-def _create_ms_device_sensor(
-    device: Any, coordinator: Any, description: Any, entry_id: str, network_hub: Any
+def _create_ms_sensor(
+    coordinator: Any,
+    device: Any,
+    description: Any,
+    entry_id: str,
+    network_hub: Any,
 ) -> Entity:
-    """Helper to create MS device sensor."""
-    from ..devices.ms import MerakiMSDeviceSensor
+    """Helper to create MS network sensor.
 
-    return MerakiMSDeviceSensor(device, coordinator, description, entry_id, network_hub)
+    Takes the legacy device entity arguments; the device and network hub are
+    unused by network-level sensors.
+    """
+    return _device_class("ms", "MerakiMSSensor")(coordinator, description, entry_id)
 
 
-# Register all entity types when module is imported
-_register_mt_entities()
-_register_mr_entities()
-_register_ms_entities()
-_register_organization_entities()
+# Legacy device entity types served by the device-type registry
+_LEGACY_DEVICE_ENTITY_TYPES: Mapping[str, str] = MappingProxyType(
+    {
+        "mt_sensor": SENSOR_TYPE_MT,
+        "mr_device_sensor": SENSOR_TYPE_MR,
+        "ms_device_sensor": SENSOR_TYPE_MS,
+    }
+)
 
 
 # Backward compatibility functions
@@ -1125,11 +626,11 @@ def create_organization_entity(
     """Create an organization-level entity (backward compatibility)."""
     # Organization entities don't follow the device type pattern
     # Keep using the old registry pattern for these
-    if entity_type not in EntityFactory._registry:
+    _ensure_legacy_registered()
+    creator = _legacy_registry.get(entity_type)
+    if creator is None:
         raise ValueError(f"Unknown organization entity type: {entity_type}")
-    return cast(
-        SensorEntity, EntityFactory._registry[entity_type](hub, description, entry_id)
-    )
+    return cast(SensorEntity, creator(hub, description, entry_id))
 
 
 def create_device_entity(
@@ -1142,43 +643,27 @@ def create_device_entity(
     **kwargs,
 ) -> SensorEntity:
     """Create a device-level entity (backward compatibility)."""
-    # Map old entity types to new pattern
-    if entity_type == "mt_sensor":
-        # Determine metric type from description key
-        metric_type = description.key
-        return cast(
-            SensorEntity,
-            EntityFactory.create_entity(
-                SENSOR_TYPE_MT, metric_type, coordinator, device, entry_id, network_hub
-            ),
-        )
-    elif entity_type == "mr_device_sensor":
-        metric_type = description.key
-        return cast(
-            SensorEntity,
-            EntityFactory.create_entity(
-                SENSOR_TYPE_MR, metric_type, coordinator, device, entry_id, network_hub
-            ),
-        )
-    elif entity_type == "ms_device_sensor":
-        metric_type = description.key
-        return cast(
-            SensorEntity,
-            EntityFactory.create_entity(
-                SENSOR_TYPE_MS, metric_type, coordinator, device, entry_id, network_hub
-            ),
-        )
-    else:
-        # Fall back to old registry
-        if entity_type not in EntityFactory._registry:
-            raise ValueError(f"Unknown device entity type: {entity_type}")
+    # Map old entity types to new pattern, using the description key as the
+    # metric type
+    device_type = _LEGACY_DEVICE_ENTITY_TYPES.get(entity_type)
+    if device_type is not None:
         return cast(
             SensorEntity,
-            EntityFactory._registry[entity_type](
-                coordinator, device, description, entry_id, network_hub, **kwargs
+            create_entity(
+                device_type, description.key, coordinator, device, entry_id, network_hub
             ),
         )
 
+    # Fall back to old registry
+    _ensure_legacy_registered()
+    creator = _legacy_registry.get(entity_type)
+    if creator is None:
+        raise ValueError(f"Unknown device entity type: {entity_type}")
+    return cast(
+        SensorEntity,
+        creator(coordinator, device, description, entry_id, network_hub, **kwargs),
+    )
+
 
 def create_network_entity(
     entity_type: str,
@@ -1188,12 +673,11 @@ def create_network_entity(
 ) -> SensorEntity:
     """Create a network-level entity (backward compatibility)."""
     # Network entities use old registry pattern
-    if entity_type not in EntityFactory._registry:
+    _ensure_legacy_registered()
+    creator = _legacy_registry.get(entity_type)
+    if creator is None:
         raise ValueError(f"Unknown network entity type: {entity_type}")
-    return cast(
-        SensorEntity,
-        EntityFactory._registry[entity_type](network_hub, description, entry_id),
-    )
+    return cast(SensorEntity, creator(network_hub, description, entry_id))
 
 
 # New pattern-based creation functions
@@ -1204,4 +688,4 @@ def create_entities_for_device(
     network_hub: Any = None,
 ) -> list[Entity]:
     """Create all applicable entities for a device using the new pattern."""
-    return EntityFactory.create_entities(coordinator, device, config_entry_id)
+    return create_entities(coordinator, device, config_entry_id)
@@ -1,6 +1,6 @@
 """Hub classes for managing Meraki organizations and networks."""
 
 from .network import MerakiNetworkHub
-from .organization import MerakiOrganizationHub
+from .organization import MerakiOrganizationHub, async_remove_inventory
 
-__all__ = ["MerakiOrganizationHub", "MerakiNetworkHub"]
+__all__ = ["MerakiOrganizationHub", "MerakiNetworkHub", "async_remove_inventory"]
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from datetime import UTC, datetime, timedelta
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, cast
 
 from homeassistant.config_entries import ConfigEntry
@@ -21,6 +22,7 @@ from ..const import (
     SENSOR_TYPE_MR,
     SENSOR_TYPE_MS,
     SENSOR_TYPE_MT,
+    MTSensor,
 )
 from ..services import MerakiEventService
 from ..types import (
@@ -46,6 +48,21 @@ _LOGGER = logging.getLogger(__name__)
 # Minimum time between discovery attempts to prevent API spam (30 seconds)
 MIN_DISCOVERY_INTERVAL_SECONDS = 30
 
+# Canonical string for each known MT metric name. Readings are rewritten to
+# use these so every poll shares one str object per metric instead of
+# allocating fresh copies for each reading.
+_METRIC_NAMES: Mapping[str, str] = MappingProxyType(
+    {metric.value: metric.value for metric in MTSensor}
+)
+
+
+def _intern_metric_names(readings: list[dict[str, Any]]) -> None:
+    """Replace known metric names in sensor readings with shared strings."""
+    for reading in readings:
+        metric = reading.get("metric")
+        if metric in _METRIC_NAMES:
+            reading["metric"] = _METRIC_NAMES[metric]
+
 
 class MerakiNetworkHub:
     """Network-specific hub for managing devices of a specific type.
@@ -97,8 +114,13 @@ class MerakiNetworkHub:
         # Generate a unique hub name for identification
         self.hub_name = f"{network_name}_{device_type}"
 
-        # Device management
-        self.devices: list[MerakiDeviceData] = []
+        # Device management; the roster is replaced wholesale on discovery and
+        # never mutated, so it is shared by reference with the cache and
+        # coordinators
+        self.devices: tuple[MerakiDeviceData, ...] = ()
+        self._devices_by_serial: tuple[
+            tuple[MerakiDeviceData, ...], dict[str, MerakiDeviceData]
+        ] = ((), {})
         self._selected_devices: set[str] = set()
         self._last_discovery_time: datetime | None = None
         self._discovery_in_progress = False
@@ -265,14 +287,14 @@ class MerakiNetworkHub:
             cache_key = f"devices_{self.network_id}_{self.device_type}"
             cached_devices = get_cached_api_response(cache_key)
 
-            processed_devices: list[MerakiDeviceData]
+            processed_devices: tuple[MerakiDeviceData, ...]
             if cached_devices is not None:
                 _LOGGER.debug(
                     "Using cached device list for %s (found %d devices)",
                     self.hub_name,
                     len(cached_devices),
                 )
-                processed_devices = cached_devices
+                processed_devices = tuple(cached_devices)
             else:
                 # Get all devices in the network
                 api_start_time = self.hass.loop.time()
@@ -318,14 +340,13 @@ class MerakiNetworkHub:
                     ]
 
                 # Process and sanitize devices
-                processed_devices = []
                 for device in type_devices:
                     # Add network information
                     device["network_id"] = self.network_id
                     device["network_name"] = self.network_name
 
-                    # Keep the device as is (don't use sanitize_device_attributes here)
-                    processed_devices.append(device)
+                # Keep the devices as is (don't use sanitize_device_attributes here)
+                processed_devices = tuple(type_devices)
 
                 # Cache the processed devices for 10 minutes
                 cache_api_response(cache_key, processed_devices, ttl=600)
@@ -891,6 +912,19 @@ class MerakiNetworkHub:
             _LOGGER.error("Error getting switch data for %s: %s", self.hub_name, err)
             self.organization_hub.failed_api_calls += 1
 
+    def _get_devices_by_serial(self) -> dict[str, MerakiDeviceData]:
+        """Return the current roster indexed by serial.
+
+        The index is rebuilt only when discovery replaces the roster, so each
+        reading's device is a dict lookup without re-indexing every scan.
+        """
+        roster, index = self._devices_by_serial
+        if roster is not self.devices:
+            roster = self.devices
+            index = {device["serial"]: device for device in roster}
+            self._devices_by_serial = (roster, index)
+        return index
+
     @performance_monitor("sensor_data_fetch")
     @with_standard_retries("realtime")
     @handle_api_errors(
@@ -913,7 +947,8 @@ class MerakiNetworkHub:
             _LOGGER.debug("No devices to fetch sensor data for in %s", self.hub_name)
             return {}
 
-        serials = [device["serial"] for device in self.devices]
+        devices_by_serial = self._get_devices_by_serial()
+        serials = list(devices_by_serial)
 
         try:
             _LOGGER.debug(
@@ -955,27 +990,24 @@ class MerakiNetworkHub:
             result: dict[str, MTDeviceData] = {}
             for reading in all_readings:
                 serial = reading.get("serial")
-                if serial and serial in serials:
+                device_info = devices_by_serial.get(serial) if serial else None
+                if device_info is not None:
+                    _intern_metric_names(reading.get("readings", []))
                     result[serial] = cast(MTDeviceData, reading)
 
                     # Process events for state changes
                     if self.event_service:
                         try:
-                            device_info: MerakiDeviceData = next(
-                                (d for d in self.devices if d["serial"] == serial),
-                                {},
+                            device_info_with_domain = {
+                                **device_info,
+                                "domain": DOMAIN,
+                            }
+                            # Use async method with await
+                            await self.event_service.track_sensor_changes(
+                                serial,
+                                reading.get("readings", []),
+                                cast(MerakiDeviceData, device_info_with_domain),
                             )
-                            if device_info:
-                                device_info_with_domain = {
-                                    **device_info,
-                                    "domain": DOMAIN,
-                                }
-                                # Use async method with await
-                                await self.event_service.track_sensor_changes(
-                                    serial,
-                                    reading.get("readings", []),
-                                    cast(MerakiDeviceData, device_info_with_domain),
-                                )
                         except Exception as event_err:
                             _LOGGER.debug(
                                 "Error processing events for device %s: %s",
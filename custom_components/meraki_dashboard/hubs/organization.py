@@ -14,12 +14,16 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 from meraki.exceptions import APIError
 
 from ..const import (
     CONF_BASE_URL,
+    CONF_DISCOVERY_INTERVAL,
     DEFAULT_BASE_URL,
+    DEFAULT_DISCOVERY_INTERVAL,
     DEVICE_TYPE_MAPPINGS,
+    DOMAIN,
     DYNAMIC_DATA_REFRESH_INTERVAL,
     SEMI_STATIC_DATA_REFRESH_INTERVAL,
     SENSOR_TYPE_MR,
@@ -32,6 +36,7 @@ from ..types import (
     DeviceStatus,
     MemoryUsageData,
     MerakiApiClient,
+    MerakiDeviceData,
     NetworkData,
     OrganizationData,
 )
@@ -43,6 +48,37 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Version of the persisted discovery inventory (networks and their devices)
+_INVENTORY_STORAGE_VERSION = 1
+
+
+class _InventoryStore(Store[dict[str, Any]]):
+    """Store for the discovery inventory that discards other versions."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: Any
+    ) -> dict[str, Any]:
+        """Drop an inventory written in another format so it is refetched."""
+        return {}
+
+
+def _inventory_store(hass: HomeAssistant, organization_id: str) -> _InventoryStore:
+    """Return the discovery inventory store for an organization."""
+    return _InventoryStore(
+        hass, _INVENTORY_STORAGE_VERSION, f"{DOMAIN}.inventory.{organization_id}"
+    )
+
+
+async def async_remove_inventory(hass: HomeAssistant, organization_id: str) -> None:
+    """Delete the stored discovery inventory for an organization.
+
+    Args:
+        hass: Home Assistant instance
+        organization_id: Organization whose inventory is removed
+    """
+    await _inventory_store(hass, organization_id).async_remove()
+
+
 # Thread-safe cache for logging configuration
 _LOGGING_LOCK = threading.Lock()
 _LOGGING_CONFIGURED_FOR_LEVELS: dict[int, bool] = {}
@@ -145,6 +181,11 @@ class MerakiOrganizationHub:
         # Network hubs managed by this organization hub
         self.network_hubs: dict[str, MerakiNetworkHub] = {}
 
+        # Discovery inventory, persisted so a restart within the discovery
+        # interval skips the network and device listing calls
+        self._inventory_store = _inventory_store(hass, organization_id)
+        self._stored_devices: dict[str, list[MerakiDeviceData]] = {}
+
         # Organization-level monitoring data
         self.licenses_info: dict[str, Any] = {}
         self.licenses_expiring_count = 0
@@ -301,15 +342,25 @@ class MerakiOrganizationHub:
                     "Connected to Meraki organization: %s", self.organization_name
                 )
 
-                # Get all networks for the organization
-                networks_start_time = self.hass.loop.time()
-                self.networks = await self.hass.async_add_executor_job(
-                    self.dashboard.organizations.getOrganizationNetworks,
-                    self.organization_id,
-                )
-                networks_duration = self.hass.loop.time() - networks_start_time
-                self._track_api_call_duration(networks_duration)
-                self.total_api_calls += 1
+                # Get all networks for the organization, unless a recent
+                # inventory was stored before the last restart
+                inventory = await self._async_load_inventory()
+                if inventory is not None:
+                    self.networks = inventory["networks"]
+                    self._stored_devices = inventory["devices"]
+                    _LOGGER.debug(
+                        "Using stored inventory for organization %s",
+                        self.organization_id,
+                    )
+                else:
+                    networks_start_time = self.hass.loop.time()
+                    self.networks = await self.hass.async_add_executor_job(
+                        self.dashboard.organizations.getOrganizationNetworks,
+                        self.organization_id,
+                    )
+                    networks_duration = self.hass.loop.time() - networks_start_time
+                    self._track_api_call_duration(networks_duration)
+                    self.total_api_calls += 1
             else:
                 raise ConfigEntryNotReady("Dashboard API not initialized")
 
@@ -443,6 +494,48 @@ class MerakiOrganizationHub:
             )
             raise ConfigEntryNotReady from err
 
+    async def _async_load_inventory(self) -> dict[str, Any] | None:
+        """Load the stored discovery inventory if it is still fresh.
+
+        Returns:
+            The stored inventory, or None if missing, malformed or older than
+            the discovery interval
+        """
+        inventory = await self._inventory_store.async_load()
+        if not inventory:
+            return None
+
+        timestamp = inventory.get("ts")
+        if (
+            not isinstance(timestamp, int | float)
+            or not isinstance(inventory.get("networks"), list)
+            or not isinstance(inventory.get("devices"), dict)
+        ):
+            _LOGGER.debug("Ignoring malformed stored inventory")
+            return None
+
+        discovery_interval = self.config_entry.options.get(
+            CONF_DISCOVERY_INTERVAL, DEFAULT_DISCOVERY_INTERVAL
+        )
+        age = datetime.now(UTC).timestamp() - timestamp
+        if age >= discovery_interval:
+            _LOGGER.debug("Stored inventory is %.0f seconds old, refreshing", age)
+            return None
+
+        return inventory
+
+    async def _async_save_inventory(
+        self, network_devices: dict[str, list[MerakiDeviceData]]
+    ) -> None:
+        """Persist the networks and per-network devices for the next startup."""
+        await self._inventory_store.async_save(
+            {
+                "ts": datetime.now(UTC).timestamp(),
+                "networks": self.networks,
+                "devices": network_devices,
+            }
+        )
+
     @with_standard_retries("discovery")
     @handle_api_errors(default_return={})
     async def async_create_network_hubs(self) -> dict[str, MerakiNetworkHub]:
@@ -459,22 +552,38 @@ class MerakiOrganizationHub:
             _LOGGER.warning("No networks found in organization")
             return network_hubs
 
+        # The stored inventory only stands in for the first pass after setup;
+        # later passes list devices again so discovery sees changes
+        network_devices, self._stored_devices = self._stored_devices, {}
+        inventory_changed = False
+
         for network in self.networks:
             network_id = network["id"]
             network_name = network["name"]
 
-            # Check each device type to see if there are devices in this network
-            for device_type in [SENSOR_TYPE_MT, SENSOR_TYPE_MR, SENSOR_TYPE_MS]:
-                try:
-                    # Check if there are devices of this type in the network
-                    if self.dashboard is None:
-                        continue
+            # List the network's devices once for all device types
+            devices = network_devices.get(network_id)
+            if devices is None:
+                if self.dashboard is None:
+                    continue
 
+                try:
                     devices = await self.hass.async_add_executor_job(
                         self.dashboard.networks.getNetworkDevices, network_id
                     )
-                    self.total_api_calls += 1
+                except Exception as err:
+                    _LOGGER.error(
+                        "Error listing devices for network %s: %s", network_name, err
+                    )
+                    continue
+
+                self.total_api_calls += 1
+                network_devices[network_id] = devices
+                inventory_changed = True
 
+            # Check each device type to see if there are devices in this network
+            for device_type in [SENSOR_TYPE_MT, SENSOR_TYPE_MR, SENSOR_TYPE_MS]:
+                try:
                     # Filter for this device type
                     type_devices = [
                         device
@@ -524,6 +633,9 @@ class MerakiOrganizationHub:
         # Store reference to network hubs
         self.network_hubs = network_hubs
 
+        if inventory_changed:
+            await self._async_save_inventory(network_devices)
+
         return network_hubs
 
     @handle_api_errors(log_errors=True, convert_connection_errors=False)
@@ -1256,11 +1368,10 @@ class MerakiOrganizationHub:
 
             # Check if any devices match the type prefixes
             type_config = DEVICE_TYPE_MAPPINGS.get(device_type, {})
-            model_prefixes = type_config.get("model_prefixes", [])
+            model_prefixes = tuple(type_config.get("model_prefixes", ()))
 
             for device in network_devices:
-                model = device.get("model", "")
-                if any(model.startswith(prefix) for prefix in model_prefixes):
+                if device.get("model", "").startswith(model_prefixes):
                     return True
 
             return False
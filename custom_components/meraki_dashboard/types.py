@@ -432,7 +432,7 @@ class NetworkHubProtocol(Protocol):
     network_id: str
     network_name: str
     device_type: str
-    devices: list[MerakiDeviceData]
+    devices: tuple[MerakiDeviceData, ...]
 
     async def async_update_devices_info(self) -> list[WirelessStats | SwitchStats]:
         """Update devices info."""
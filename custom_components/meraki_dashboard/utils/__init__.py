@@ -34,7 +34,7 @@ from .error_handling import (
 )
 
 # Import from helpers module
-from .helpers import batch_api_calls
+from .helpers import batch_api_calls, iter_api_calls
 
 # Import from performance module
 from .performance import (
@@ -80,6 +80,7 @@ __all__ = [
     "handle_api_errors",
     # Helpers
     "batch_api_calls",
+    "iter_api_calls",
     # Performance monitoring
     "get_performance_metrics",
     "performance_monitor",
@@ -3,47 +3,147 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+import inspect
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import Executor
+from functools import partial
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 
+# A blocking SDK call as (function, args, kwargs), or an awaitable from an
+# async client that runs on the event loop
+ApiCall = tuple[Callable, tuple, dict] | Awaitable[Any]
+
+
+def _api_call_runner(
+    hass: HomeAssistant,
+    max_concurrent: int,
+    delay_between_batches: float,
+    executor: Executor | None,
+) -> Callable[[ApiCall], Awaitable[Any]]:
+    """Build a coroutine function that runs one call under shared limits.
+
+    Raises:
+        ValueError: If max_concurrent is less than 1
+    """
+    if max_concurrent < 1:
+        raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+    # Start times of the most recently started calls
+    recent_starts: deque[float] = deque(maxlen=max_concurrent)
+
+    async def run(call: ApiCall) -> Any:
+        async with semaphore:
+            while (
+                len(recent_starts) == max_concurrent
+                and (
+                    wait := recent_starts[0] + delay_between_batches - time.monotonic()
+                )
+                > 0
+            ):
+                await asyncio.sleep(wait)
+            recent_starts.append(time.monotonic())
+            if not isinstance(call, tuple):
+                return await call
+            func, args, kwargs = call
+            if executor is not None:
+                return await hass.loop.run_in_executor(
+                    executor, partial(func, *args, **kwargs)
+                )
+            return await hass.async_add_executor_job(func, *args, **kwargs)
+
+    return run
+
 
 async def batch_api_calls(
     hass: HomeAssistant,
-    api_calls: list[tuple[Callable, tuple, dict]],
+    api_calls: list[ApiCall],
     max_concurrent: int = 5,
     delay_between_batches: float = 0.1,
+    executor: Executor | None = None,
 ) -> list[Any]:
-    """Execute multiple API calls in batches with concurrency control.
+    """Execute multiple API calls with concurrency control.
+
+    A new call starts as soon as one of the ``max_concurrent`` slots frees up,
+    rather than waiting for the slowest call of a fixed batch. To stay within
+    rate limits, at most ``max_concurrent`` calls start in any window of
+    ``delay_between_batches`` seconds.
+
+    Blocking calls run in an executor; awaitables (e.g. from the SDK's
+    ``meraki.aio`` client) are awaited directly on the event loop and share
+    the same concurrency and rate limits.
 
     Args:
         hass: Home Assistant instance
-        api_calls: List of tuples (function, args, kwargs)
+        api_calls: List of tuples (function, args, kwargs) or awaitables
         max_concurrent: Maximum concurrent API calls
-        delay_between_batches: Delay between batches in seconds
+        delay_between_batches: Window in seconds for spacing call starts
+        executor: Executor to run the calls in instead of Home Assistant's
+            shared executor, e.g. one owned by the hub so a large fan-out
+            keeps reusing the same worker threads
 
     Returns:
         List of results in the same order as input calls
+
+    Raises:
+        ValueError: If max_concurrent is less than 1
     """
-    results = []
+    run = _api_call_runner(hass, max_concurrent, delay_between_batches, executor)
+    return await asyncio.gather(
+        *(run(call) for call in api_calls),
+        return_exceptions=True,
+    )
 
-    # Process in batches
-    for i in range(0, len(api_calls), max_concurrent):
-        batch = api_calls[i : i + max_concurrent]
-        batch_tasks = []
 
-        for func, args, kwargs in batch:
-            # Create task for each API call
-            task = hass.async_add_executor_job(func, *args, **kwargs)
-            batch_tasks.append(task)
+async def iter_api_calls(
+    hass: HomeAssistant,
+    api_calls: list[ApiCall],
+    max_concurrent: int = 5,
+    delay_between_batches: float = 0.1,
+    executor: Executor | None = None,
+) -> AsyncIterator[tuple[int, Any]]:
+    """Execute multiple API calls, yielding each result as it completes.
+
+    Takes the same arguments and applies the same limits as
+    batch_api_calls, but lets callers process each result while the other
+    calls are still in flight.
 
-        # Wait for batch to complete
-        batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-        results.extend(batch_results)
+    Yields:
+        Tuples of (index into api_calls, result or raised exception)
+
+    Raises:
+        ValueError: If max_concurrent is less than 1
+    """
+    run = _api_call_runner(hass, max_concurrent, delay_between_batches, executor)
 
-        # Add delay between batches to avoid rate limiting
-        if i + max_concurrent < len(api_calls):
-            await asyncio.sleep(delay_between_batches)
+    async def run_indexed(index: int, call: ApiCall) -> tuple[int, Any]:
+        try:
+            return index, await run(call)
+        except Exception as err:
+            return index, err
 
-    return results
+    tasks = [
+        asyncio.create_task(run_indexed(index, call))
+        for index, call in enumerate(api_calls)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Don't leave calls running if the consumer stops early
+        for task in tasks:
+            task.cancel()
+        # Let cancelled calls finish unwinding before returning to the caller
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Coroutines whose task was cancelled before reaching them would
+        # otherwise be garbage collected without ever being awaited
+        for call in api_calls:
+            if (
+                inspect.iscoroutine(call)
+                and inspect.getcoroutinestate(call) == inspect.CORO_CREATED
+            ):
+                call.close()
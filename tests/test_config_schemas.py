@@ -14,6 +14,7 @@ from custom_components.meraki_dashboard.config.schemas import (
     OrganizationIDConfig,
     TieredRefreshConfig,
     validate_config_migration,
+    validate_interval,
 )
 from custom_components.meraki_dashboard.const import (
     DEFAULT_BASE_URL,
@@ -64,6 +65,22 @@ class TestIntervalConfig:
         with pytest.raises(ConfigurationError):
             IntervalConfig(1799, min_seconds=1800, max_seconds=3600)
 
+    def test_boolean_interval_rejected(self):
+        """Test booleans are not accepted as intervals."""
+        with pytest.raises(ConfigurationError, match="got bool"):
+            IntervalConfig(True, min_seconds=0, max_seconds=3600)
+
+    def test_validate_interval_function(self):
+        """Test the interval validation function."""
+        assert validate_interval(300) is None
+        assert validate_interval(1800, 1800, 3600) is None
+
+        with pytest.raises(ConfigurationError, match="at least 60 seconds"):
+            validate_interval(30)
+
+        with pytest.raises(ConfigurationError, match="at most 3600 seconds"):
+            validate_interval(3601, max_seconds=3600)
+
 
 class TestAPIKeyConfig:
     """Test API key configuration validation."""
@@ -89,6 +106,10 @@ class TestAPIKeyConfig:
         with pytest.raises(ConfigurationError, match="hexadecimal characters"):
             APIKeyConfig("g1b2c3d4e5f6789012345678901234567890abcd")
 
+        # Whitespace between hex pairs must not be accepted
+        with pytest.raises(ConfigurationError, match="hexadecimal characters"):
+            APIKeyConfig("a1 b2 c3d4e5f6789012345678901234567890ab")
+
     def test_api_key_not_string(self):
         """Test non-string API key."""
         with pytest.raises(ConfigurationError, match="must be a string"):
@@ -130,6 +151,21 @@ class TestBaseURLConfig:
         with pytest.raises(ConfigurationError, match="must be one of"):
             BaseURLConfig("https://invalid.example.com/api/v1")
 
+    def test_invalid_base_url_lists_allowed_urls(self):
+        """Test the error lists the allowed URLs, including custom ones."""
+        with pytest.raises(ConfigurationError) as exc_info:
+            BaseURLConfig("https://invalid.example.com/api/v1")
+        for url in REGIONAL_BASE_URLS.values():
+            assert url in str(exc_info.value)
+
+        with pytest.raises(
+            ConfigurationError, match="one of: https://custom.example.com/api/v1"
+        ):
+            BaseURLConfig(
+                "https://invalid.example.com/api/v1",
+                allowed_urls=frozenset({"https://custom.example.com/api/v1"}),
+            )
+
     def test_base_url_not_string(self):
         """Test non-string base URL."""
         with pytest.raises(ConfigurationError, match="must be a string"):
@@ -165,6 +201,11 @@ class TestOrganizationIDConfig:
         ):
             OrganizationIDConfig("test_org@123")
 
+        with pytest.raises(
+            ConfigurationError, match="must contain only letters, numbers, and hyphens"
+        ):
+            OrganizationIDConfig("organización")
+
     def test_org_id_not_string(self):
         """Test non-string organization ID."""
         with pytest.raises(ConfigurationError, match="must be a string"):
@@ -191,6 +232,14 @@ class TestDeviceSerialConfig:
         ):
             DeviceSerialConfig("q2ab-1234-5678")
 
+    def test_non_ascii_or_trailing_newline_in_serial(self):
+        """Test device serials with non-ASCII characters or a trailing newline."""
+        for serial in ("Q2AB-1234-５678", "Q2AB-1234-5678\n"):
+            with pytest.raises(
+                ConfigurationError, match="uppercase letters, digits, and hyphens"
+            ):
+                DeviceSerialConfig(serial)
+
     def test_device_serial_not_string(self):
         """Test non-string device serial."""
         with pytest.raises(ConfigurationError, match="must be a string"):
@@ -334,6 +383,26 @@ class TestMerakiConfigSchema:
         assert config.auto_discovery is False
         assert len(config.selected_devices) == 1
 
+    def test_from_config_entry_defaults(self):
+        """Test defaults are applied and mutable defaults are not shared."""
+        data = {"api_key": "a1b2c3d4e5f6789012345678901234567890abcd"}
+        first = MerakiConfigSchema.from_config_entry(data)
+        second = MerakiConfigSchema.from_config_entry(data, {"unknown": 1})
+
+        assert first.scan_interval == DEFAULT_SCAN_INTERVAL
+        assert first.selected_devices == []
+        assert first.hub_scan_intervals == {}
+        assert first.selected_devices is not second.selected_devices
+        assert first.hub_scan_intervals is not second.hub_scan_intervals
+
+    def test_schema_uses_slots(self):
+        """Test schema instances do not allocate a per-instance __dict__."""
+        config = MerakiConfigSchema(
+            api_key="a1b2c3d4e5f6789012345678901234567890abcd",
+        )
+        assert not hasattr(config, "__dict__")
+        assert not hasattr(IntervalConfig(300), "__dict__")
+
     def test_to_dict(self):
         """Test converting schema to dictionary."""
         config = MerakiConfigSchema(
@@ -354,6 +423,74 @@ class TestMerakiConfigSchema:
                 selected_devices=["invalid-serial!"],
             )
 
+    def test_selected_devices_error_messages(self):
+        """Test selected device errors keep the per-serial messages."""
+        with pytest.raises(ConfigurationError, match="must be a string"):
+            MerakiConfigSchema(
+                api_key="a1b2c3d4e5f6789012345678901234567890abcd",
+                selected_devices=["Q2AB-1234-5678", 12345],
+            )
+
+        with pytest.raises(ConfigurationError, match="cannot be empty"):
+            MerakiConfigSchema(
+                api_key="a1b2c3d4e5f6789012345678901234567890abcd",
+                selected_devices=[""],
+            )
+
+    def test_invalid_hub_settings(self):
+        """Test invalid hub-specific settings."""
+        with pytest.raises(ConfigurationError, match="must be a boolean"):
+            MerakiConfigSchema(
+                api_key="a1b2c3d4e5f6789012345678901234567890abcd",
+                auto_discovery=1,
+            )
+
+        with pytest.raises(ConfigurationError, match="non-empty string"):
+            MerakiConfigSchema(
+                api_key="a1b2c3d4e5f6789012345678901234567890abcd",
+                hub_scan_intervals={"": 600},
+            )
+
+        with pytest.raises(ConfigurationError, match="at least 300 seconds"):
+            MerakiConfigSchema(
+                api_key="a1b2c3d4e5f6789012345678901234567890abcd",
+                hub_discovery_intervals={"network_123_MT": 60},
+            )
+
+        with pytest.raises(ConfigurationError, match="must be a boolean"):
+            MerakiConfigSchema(
+                api_key="a1b2c3d4e5f6789012345678901234567890abcd",
+                hub_auto_discovery={"network_123_MT": "yes"},
+            )
+
+    def test_duplicate_selected_devices(self):
+        """Test duplicate selected devices are dropped in order."""
+        config = MerakiConfigSchema(
+            api_key="a1b2c3d4e5f6789012345678901234567890abcd",
+            selected_devices=["Q2AB-0002", "Q2AB-0001", "Q2AB-0002"],
+        )
+
+        assert config.selected_devices == ["Q2AB-0002", "Q2AB-0001"]
+
+    def test_all_errors_reported(self):
+        """Test every invalid field is reported in a single error."""
+        with pytest.raises(ConfigurationError) as exc_info:
+            MerakiConfigSchema(
+                api_key="a1b2c3d4e5f6789012345678901234567890abcd",
+                scan_interval=30,
+                selected_devices=["Q2AB-0001", ["not", "a", "serial"]],
+                hub_scan_intervals={"network_1_MT": 30, "network_2_MT": 7200},
+            )
+
+        message = exc_info.value.message
+        assert message.startswith("Configuration errors:")
+        assert "scan_interval: Interval must be at least 60 seconds" in message
+        assert "selected_devices[1]: Device serial must be a string" in message
+        assert (
+            "hub_scan_intervals['network_1_MT']: Interval must be at least" in message
+        )
+        assert "hub_scan_intervals['network_2_MT']: Interval must be at most" in message
+
     def test_non_list_selected_devices(self):
         """Test non-list selected devices."""
         with pytest.raises(ConfigurationError, match="must be a list"):
@@ -379,6 +516,62 @@ class TestConfigMigration:
         }
         assert validate_config_migration(old_config, new_config) is True
 
+    def test_unchanged_config_migration(self):
+        """Test migration with an unchanged configuration."""
+        config = {
+            "api_key": "a1b2c3d4e5f6789012345678901234567890abcd",
+            "organization_id": "123456",
+            "scan_interval": 600,
+        }
+        assert validate_config_migration(config, dict(config)) is True
+
+    def test_migration_with_unhashable_values(self):
+        """Test migration validation with list and dict options."""
+        old_config = {
+            "api_key": "a1b2c3d4e5f6789012345678901234567890abcd",
+            "organization_id": "123456",
+        }
+        new_config = {
+            **old_config,
+            "selected_devices": ["Q2AB-1234-5678"],
+            "hub_scan_intervals": {"network_123_MT": 600},
+        }
+        assert validate_config_migration(old_config, new_config) is True
+
+        new_config["selected_devices"] = ["invalid-serial!"]
+        with pytest.raises(
+            ConfigurationError, match="Invalid configuration after migration"
+        ):
+            validate_config_migration(old_config, new_config)
+
+    def test_repeated_invalid_migration_still_raises(self):
+        """Test that failed validations are not cached as successes."""
+        old_config = {
+            "api_key": "a1b2c3d4e5f6789012345678901234567890abcd",
+            "organization_id": "123456",
+        }
+        new_config = {**old_config, "scan_interval": 30}
+        for _ in range(2):
+            with pytest.raises(
+                ConfigurationError, match="Invalid configuration after migration"
+            ):
+                validate_config_migration(old_config, new_config)
+
+    def test_equal_but_invalid_values_rejected_after_valid_migration(self):
+        """Test a validated config does not let equal values of other types pass."""
+        old_config = {
+            "api_key": "a1b2c3d4e5f6789012345678901234567890abcd",
+            "organization_id": "123456",
+        }
+        assert validate_config_migration(
+            old_config, {**old_config, "scan_interval": 300}
+        )
+
+        with pytest.raises(ConfigurationError, match="must be an integer"):
+            validate_config_migration(
+                old_config, {**old_config, "scan_interval": 300.0}
+            )
+
     def test_api_key_change_not_allowed(self):
         """Test that API key cannot be changed during migration."""
         old_config = {
@@ -1,5 +1,9 @@
 """Test constants for Meraki Dashboard integration."""
 
+from types import MappingProxyType
+
+import pytest
+
 from custom_components.meraki_dashboard.const import (
     ATTR_LAST_REPORTED_AT,
     ATTR_MODEL,
@@ -36,6 +40,8 @@ from custom_components.meraki_dashboard.const import (
     MIN_DISCOVERY_INTERVAL_MINUTES,
     MIN_SCAN_INTERVAL,
     MIN_SCAN_INTERVAL_MINUTES,
+    MR_SENSOR_CLIENT_COUNT,
+    MS_SENSOR_PORT_COUNT,
     MT_BINARY_SENSOR_METRICS,
     MT_EVENT_SENSOR_METRICS,
     MT_POWER_SENSORS,
@@ -48,12 +54,18 @@ from custom_components.meraki_dashboard.const import (
     MT_SENSOR_TEMPERATURE,
     MT_SENSOR_WATER,
     ORG_HUB_SUFFIX,
+    ORG_SENSOR_API_CALLS,
     REGIONAL_BASE_URLS,
+    REGIONAL_BASE_URLS_SET,
     SENSOR_TYPE_MR,
     SENSOR_TYPE_MS,
     SENSOR_TYPE_MT,
     SENSOR_TYPE_MV,
     USER_AGENT,
+    MRSensor,
+    MSSensor,
+    MTSensor,
+    OrgSensor,
 )
 
 
@@ -139,6 +151,11 @@ class TestRegionalConfiguration:
         for region in expected_regions:
             assert region in REGIONAL_BASE_URLS
 
+    def test_regional_base_urls_set(self):
+        """Test regional base URL set mirrors the regional URLs."""
+        assert isinstance(REGIONAL_BASE_URLS_SET, frozenset)
+        assert REGIONAL_BASE_URLS_SET == set(REGIONAL_BASE_URLS.values())
+
 
 class TestSensorTypes:
     """Test sensor type constants."""
@@ -155,7 +172,7 @@ class TestSensorTypes:
 
     def test_device_type_scan_intervals(self):
         """Test device type scan intervals."""
-        assert isinstance(DEVICE_TYPE_SCAN_INTERVALS, dict)
+        assert isinstance(DEVICE_TYPE_SCAN_INTERVALS, MappingProxyType)
 
         # Should have entries for all sensor types
         for sensor_type in [
@@ -170,7 +187,7 @@ class TestSensorTypes:
 
     def test_default_scan_interval_minutes(self):
         """Test default scan interval minutes."""
-        assert isinstance(DEFAULT_SCAN_INTERVAL_MINUTES, dict)
+        assert isinstance(DEFAULT_SCAN_INTERVAL_MINUTES, MappingProxyType)
 
         # Should have entries for all sensor types
         for sensor_type in [
@@ -190,7 +207,7 @@ class TestSensorTypes:
 
     def test_device_type_mappings(self):
         """Test device type mappings structure."""
-        assert isinstance(DEVICE_TYPE_MAPPINGS, dict)
+        assert isinstance(DEVICE_TYPE_MAPPINGS, MappingProxyType)
 
         for sensor_type in [
             SENSOR_TYPE_MT,
@@ -209,9 +226,20 @@ class TestSensorTypes:
             # Should have proper types
             assert isinstance(mapping["name_suffix"], str)
             assert isinstance(mapping["description"], str)
-            assert isinstance(mapping["model_prefixes"], list)
+            assert isinstance(mapping["model_prefixes"], tuple)
             assert len(mapping["model_prefixes"]) > 0
 
+    def test_device_type_mappings_read_only(self):
+        """Test device type mappings cannot be modified."""
+        with pytest.raises(TypeError):
+            DEVICE_TYPE_MAPPINGS[SENSOR_TYPE_MT] = {}
+
+        with pytest.raises(TypeError):
+            DEVICE_TYPE_MAPPINGS[SENSOR_TYPE_MT]["name_suffix"] = "x"
+
+        with pytest.raises(TypeError):
+            DEVICE_TYPE_SCAN_INTERVALS[SENSOR_TYPE_MT] = 1
+
 
 class TestHubTypes:
     """Test hub type constants."""
@@ -250,8 +278,8 @@ class TestMTSensorConstants:
             assert len(sensor) > 0
 
     def test_mt_power_sensors(self):
-        """Test MT power sensor list."""
-        assert isinstance(MT_POWER_SENSORS, list)
+        """Test MT power sensor set."""
+        assert isinstance(MT_POWER_SENSORS, frozenset)
         assert len(MT_POWER_SENSORS) > 0
 
         # Should contain real power
@@ -261,8 +289,8 @@ class TestMTSensorConstants:
         assert all(isinstance(sensor, str) for sensor in MT_POWER_SENSORS)
 
     def test_mt_binary_sensor_metrics(self):
-        """Test MT binary sensor metrics list."""
-        assert isinstance(MT_BINARY_SENSOR_METRICS, list)
+        """Test MT binary sensor metrics set."""
+        assert isinstance(MT_BINARY_SENSOR_METRICS, frozenset)
         assert len(MT_BINARY_SENSOR_METRICS) > 0
 
         # Should contain expected binary sensors
@@ -271,8 +299,8 @@ class TestMTSensorConstants:
             assert sensor in MT_BINARY_SENSOR_METRICS
 
     def test_mt_event_sensor_metrics(self):
-        """Test MT event sensor metrics list."""
-        assert isinstance(MT_EVENT_SENSOR_METRICS, list)
+        """Test MT event sensor metrics set."""
+        assert isinstance(MT_EVENT_SENSOR_METRICS, frozenset)
         assert len(MT_EVENT_SENSOR_METRICS) > 0
 
         # Should contain sensors that emit events
@@ -280,6 +308,33 @@ class TestMTSensorConstants:
         for sensor in event_sensors:
             assert sensor in MT_EVENT_SENSOR_METRICS
 
+    def test_sensor_enums_match_aliases(self):
+        """Test sensor enums and their module-level aliases."""
+        assert MT_SENSOR_TEMPERATURE is MTSensor.TEMPERATURE
+        assert MT_SENSOR_TEMPERATURE == "temperature"
+        assert MR_SENSOR_CLIENT_COUNT is MRSensor.CLIENT_COUNT
+        assert MS_SENSOR_PORT_COUNT is MSSensor.PORT_COUNT
+        assert ORG_SENSOR_API_CALLS is OrgSensor.API_CALLS
+
+        # Members behave as plain strings for lookups and formatting
+        assert f"{MT_SENSOR_TEMPERATURE}" == "temperature"
+        assert {"temperature": 1}[MT_SENSOR_TEMPERATURE] == 1
+        assert MTSensor("humidity") is MTSensor.HUMIDITY
+
+    def test_lazy_sensor_constants(self):
+        """Test sensor constants resolve lazily from their submodules."""
+        from custom_components.meraki_dashboard import const
+        from custom_components.meraki_dashboard.const import mr, ms, mt, org
+
+        assert const.MT_SENSOR_TEMPERATURE is mt.MT_SENSOR_TEMPERATURE
+        assert const.MR_SENSOR_CLIENT_COUNT is mr.MR_SENSOR_CLIENT_COUNT
+        assert const.MS_SENSOR_PORT_COUNT is ms.MS_SENSOR_PORT_COUNT
+        assert const.OrgSensor is org.OrgSensor
+        assert "MT_POWER_SENSORS" in dir(const)
+
+        with pytest.raises(AttributeError):
+            const.MT_SENSOR_UNKNOWN  # noqa: B018
+
 
 class TestEventConstants:
     """Test event-related constants."""
@@ -373,8 +428,8 @@ class TestConstantTypes:
         assert isinstance(USER_AGENT, str)
         assert isinstance(DEFAULT_BASE_URL, str)
         assert isinstance(REGIONAL_BASE_URLS, dict)
-        assert isinstance(MT_POWER_SENSORS, list)
-        assert isinstance(MT_BINARY_SENSOR_METRICS, list)
+        assert isinstance(MT_POWER_SENSORS, frozenset)
+        assert isinstance(MT_BINARY_SENSOR_METRICS, frozenset)
 
     def test_numeric_constants(self):
         """Test numeric constants are integers."""
@@ -69,6 +69,15 @@ class TestMerakiSensorCoordinator:
         # Verify hub method was called
         mock_hub.async_get_sensor_data.assert_called_once()
 
+    async def test_update_data_clears_mt_transform_cache(self, coordinator):
+        """Test each MT update drops readings transformed from older payloads."""
+        with patch(
+            "custom_components.meraki_dashboard.coordinator.transformer_registry"
+        ) as mock_registry:
+            await coordinator._async_update_data()
+
+        mock_registry.clear_cache.assert_called_once_with("MT")
+
     async def test_update_data_hub_error(self, coordinator, mock_hub):
         """Test handling of hub errors during data update."""
         # Set up mock to raise exception
@@ -236,3 +245,17 @@ class TestMerakiSensorCoordinator:
         assert data == partial_data
         assert "Q2XX-XXXX-XXXX" in data
         assert "Q2YY-YYYY-YYYY" not in data
+
+    async def test_update_data_dispatches_by_device_type(self, coordinator, mock_hub):
+        """Test each hub device type uses its own fetcher."""
+        mock_hub.device_type = "MR"
+        mock_hub._async_setup_wireless_data = AsyncMock()
+        mock_hub.async_fetch_network_events = AsyncMock(side_effect=Exception)
+        mock_hub.wireless_data = {"devices_info": []}
+
+        assert await coordinator._async_update_data() == {"devices_info": []}
+        mock_hub._async_setup_wireless_data.assert_awaited_once()
+        mock_hub.async_get_sensor_data.assert_not_called()
+
+        mock_hub.device_type = "MX"
+        assert await coordinator._async_update_data() == {}
@@ -452,3 +452,22 @@ class TestMerakiMREdgeCases:
         # Should have last update time in attributes
         attrs = sensor.extra_state_attributes
         assert "last_reported_at" in attrs
+
+
+class TestDevicesPackageExports:
+    """Test lazy exports from the devices package."""
+
+    def test_lazy_export_resolves_to_submodule_class(self):
+        """Test package attributes resolve to the submodule classes."""
+        from custom_components.meraki_dashboard import devices
+
+        assert devices.MerakiMRSensor is MerakiMRSensor
+        assert devices.MerakiMRDeviceSensor is MerakiMRDeviceSensor
+        assert "MerakiMTSensor" in dir(devices)
+
+    def test_unknown_export_raises_attribute_error(self):
+        """Test unknown package attributes raise AttributeError."""
+        from custom_components.meraki_dashboard import devices
+
+        with pytest.raises(AttributeError):
+            devices.MerakiUnknownSensor  # noqa: B018
@@ -0,0 +1,359 @@
+"""Tests for the entity factory."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.meraki_dashboard.const import (
+    MR_SENSOR_CLIENT_COUNT,
+    MS_SENSOR_PORT_COUNT,
+    MT_SENSOR_HUMIDITY,
+    MT_SENSOR_TEMPERATURE,
+    MT_SENSOR_WATER,
+    SENSOR_TYPE_MR,
+    SENSOR_TYPE_MT,
+)
+from custom_components.meraki_dashboard.devices.mr import MerakiMRDeviceSensor
+from custom_components.meraki_dashboard.devices.ms import MerakiMSDeviceSensor
+from custom_components.meraki_dashboard.devices.mt import MerakiMTSensor
+from custom_components.meraki_dashboard.entities.factory import (
+    EntityFactory,
+    create_device_entity,
+    create_organization_entity,
+)
+
+
+class TestEntityFactoryRegistry:
+    """Test entity factory registration and lookup."""
+
+    def test_registry_keyed_by_device_and_entity_type(self):
+        """Test device entities are registered under (device, entity) keys."""
+        assert EntityFactory.is_registered(SENSOR_TYPE_MT, MT_SENSOR_TEMPERATURE)
+        assert (SENSOR_TYPE_MT, MT_SENSOR_TEMPERATURE) in EntityFactory._registry
+        assert not EntityFactory.is_registered(SENSOR_TYPE_MR, MT_SENSOR_TEMPERATURE)
+        assert f"{SENSOR_TYPE_MT}_{MT_SENSOR_TEMPERATURE}" in (
+            EntityFactory.get_registered_types()
+        )
+
+    def test_registered_types_include_legacy_entries(self):
+        """Test hub-level and legacy entity types are listed as registered."""
+        registered = EntityFactory.get_registered_types()
+        assert "api_calls" in registered
+        assert "mt_energy_sensor" in registered
+        assert registered[-len(EntityFactory._legacy_registry) :] == list(
+            EntityFactory._legacy_registry
+        )
+
+    def test_legacy_entries_kept_separately(self):
+        """Test hub-level and legacy creators do not share the device registry."""
+        EntityFactory._ensure_legacy_registered()
+        assert "api_calls" in EntityFactory._legacy_registry
+        assert "mt_energy_sensor" in EntityFactory._legacy_registry
+        # Device sensors are served by the device registry instead
+        assert "mt_sensor" not in EntityFactory._legacy_registry
+        assert all(isinstance(key, tuple) for key in EntityFactory._registry)
+
+    def test_create_entity(self):
+        """Test creating registered device entities."""
+        coordinator = MagicMock()
+        device = {"serial": "Q2XX-XXXX-XXXX", "model": "MT10", "name": "Sensor"}
+
+        entity = EntityFactory.create_entity(
+            SENSOR_TYPE_MT, MT_SENSOR_TEMPERATURE, coordinator, device, "entry_id"
+        )
+        assert isinstance(entity, MerakiMTSensor)
+        assert entity.entity_description.key == MT_SENSOR_TEMPERATURE
+
+        entity = EntityFactory.create_entity(
+            SENSOR_TYPE_MR, MR_SENSOR_CLIENT_COUNT, coordinator, device, "entry_id"
+        )
+        assert isinstance(entity, MerakiMRDeviceSensor)
+        assert entity.coordinator is coordinator
+
+    def test_device_capabilities_keep_registration_order(self):
+        """Test capabilities list metrics in their registration order."""
+        capabilities = EntityFactory.get_device_capabilities(SENSOR_TYPE_MT)
+        assert capabilities[:2] == [MT_SENSOR_TEMPERATURE, MT_SENSOR_HUMIDITY]
+        assert MT_SENSOR_WATER in capabilities
+        assert EntityFactory.get_device_capabilities("MV") == []
+
+    def test_registration_is_lazy_and_idempotent(self):
+        """Test built-in entities register once, on first use per device type."""
+        with patch(
+            "custom_components.meraki_dashboard.entities.factory."
+            "_register_device_entities"
+        ) as mock_register:
+            EntityFactory._ensure_registered("TEST")
+            EntityFactory._ensure_registered("TEST")
+
+        mock_register.assert_called_once_with("TEST")
+        EntityFactory._registered_types.discard("TEST")
+
+    def test_custom_creator_registered_before_first_use_wins(self):
+        """Test lazy built-in registration keeps an earlier custom creator."""
+        custom = MagicMock()
+        EntityFactory._reset_registry()
+        try:
+            EntityFactory.register(SENSOR_TYPE_MT, MT_SENSOR_TEMPERATURE)(custom)
+
+            entity = EntityFactory.create_entity(
+                SENSOR_TYPE_MT, MT_SENSOR_TEMPERATURE, MagicMock(), {}, "entry"
+            )
+
+            assert entity is custom.return_value
+            # The other built-in metrics are still registered
+            assert EntityFactory.is_registered(SENSOR_TYPE_MT, MT_SENSOR_HUMIDITY)
+            assert EntityFactory.get_device_capabilities(SENSOR_TYPE_MT)[:2] == [
+                MT_SENSOR_TEMPERATURE,
+                MT_SENSOR_HUMIDITY,
+            ]
+        finally:
+            EntityFactory._reset_registry()
+
+    def test_create_unknown_entity(self):
+        """Test creating an unregistered entity raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown entity type: MT_unknown"):
+            EntityFactory.create_entity(SENSOR_TYPE_MT, "unknown")
+
+        with pytest.raises(ValueError, match="Unknown organization entity type"):
+            create_organization_entity("unknown", MagicMock(), MagicMock(), "entry")
+
+    def test_get_device_type(self):
+        """Test device types are derived from the model prefix."""
+        assert EntityFactory._get_device_type({"model": "MT10"}) == SENSOR_TYPE_MT
+        assert EntityFactory._get_device_type({"model": "MR46"}) == SENSOR_TYPE_MR
+        assert EntityFactory._get_device_type({"model": "MS120-8"}) == "MS"
+        assert EntityFactory._get_device_type({"model": "MV12"}) == "MV"
+        assert EntityFactory._get_device_type({"model": "MX"}) is None
+        assert EntityFactory._get_device_type({"model": "M"}) is None
+        assert EntityFactory._get_device_type({}) is None
+
+    def test_get_available_metrics(self):
+        """Test available metrics follow registration order."""
+        EntityFactory._ensure_registered(SENSOR_TYPE_MT)
+        device = {
+            "model": "MT14",
+            "sensor": {"unknown": 1, "tvoc": 100, "humidity": 40, "temperature": 21},
+        }
+
+        assert EntityFactory._get_available_metrics(SENSOR_TYPE_MT, device) == [
+            MT_SENSOR_TEMPERATURE,
+            MT_SENSOR_HUMIDITY,
+            "tvoc",
+            "indoorAirQuality",
+        ]
+        assert EntityFactory._get_available_metrics(SENSOR_TYPE_MT, {}) == []
+        assert EntityFactory._get_available_metrics("MV", device) == []
+
+    def test_create_organization_entity(self):
+        """Test organization entities resolve their classes by entity type."""
+        from custom_components.meraki_dashboard.devices.organization import (
+            MerakiHubApiCallsSensor,
+        )
+
+        hub = MagicMock()
+        description = MagicMock(key="api_calls")
+
+        entity = create_organization_entity("api_calls", hub, description, "entry")
+        assert isinstance(entity, MerakiHubApiCallsSensor)
+
+    def test_create_device_entity_legacy_types(self):
+        """Test legacy device entity types map onto the device registry."""
+        coordinator = MagicMock()
+        device = {"serial": "Q2XX-XXXX-XXXX", "model": "MT10", "name": "Sensor"}
+        description = MagicMock(key=MT_SENSOR_TEMPERATURE)
+
+        entity = create_device_entity(
+            "mt_sensor", coordinator, device, description, "entry", None
+        )
+        assert isinstance(entity, MerakiMTSensor)
+
+        entity = create_device_entity(
+            "ms_device_sensor",
+            coordinator,
+            {"serial": "Q2SW-XXXX-XXXX", "model": "MS120", "name": "Switch"},
+            MagicMock(key=MS_SENSOR_PORT_COUNT),
+            "entry",
+            None,
+        )
+        assert isinstance(entity, MerakiMSDeviceSensor)
+
+        with pytest.raises(ValueError, match="Unknown device entity type"):
+            create_device_entity(
+                "unknown_sensor", coordinator, device, description, "entry", None
+            )
+
+    def test_create_entities_skips_failures(self):
+        """Test entities are created per metric and failures are skipped."""
+        coordinator = MagicMock()
+        device = {
+            "serial": "Q2XX-XXXX-XXXX",
+            "model": "MT10",
+            "name": "Sensor",
+            "sensor": {"temperature": 21, "humidity": 40},
+        }
+
+        entities = EntityFactory.create_entities(coordinator, device, "entry")
+        assert [entity.entity_description.key for entity in entities] == [
+            MT_SENSOR_TEMPERATURE,
+            MT_SENSOR_HUMIDITY,
+        ]
+
+        original = EntityFactory._registry[(SENSOR_TYPE_MT, MT_SENSOR_HUMIDITY)]
+        with patch.dict(
+            EntityFactory._registry,
+            {(SENSOR_TYPE_MT, MT_SENSOR_HUMIDITY): MagicMock(side_effect=KeyError)},
+        ):
+            entities = EntityFactory.create_entities(coordinator, device, "entry")
+        assert len(entities) == 1
+        assert EntityFactory._registry[(SENSOR_TYPE_MT, MT_SENSOR_HUMIDITY)] is original
+
+        assert EntityFactory.create_entities(coordinator, {"model": "MX64"}, "e") == []
+
+    def test_device_type_lookup_is_cached(self):
+        """Test device type lookups are cached per model string."""
+        from custom_components.meraki_dashboard.entities.factory import (
+            _device_type_for_model,
+        )
+
+        _device_type_for_model.cache_clear()
+        assert _device_type_for_model("MT10") == SENSOR_TYPE_MT
+        assert _device_type_for_model("MT10") == SENSOR_TYPE_MT
+        info = _device_type_for_model.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert info.maxsize == 128
+
+    def test_facade_shares_module_state(self):
+        """Test the EntityFactory namespace delegates to the module functions."""
+        from custom_components.meraki_dashboard.entities import factory
+
+        assert EntityFactory._registry is factory._registry
+        assert EntityFactory.create_entity is factory.create_entity
+        assert EntityFactory.create_entities is factory.create_entities
+        assert EntityFactory.is_registered is factory.is_registered
+
+    def test_create_entity_propagates_creator_errors(self, caplog):
+        """Test creator failures propagate from create_entity without logging."""
+        EntityFactory._ensure_registered(SENSOR_TYPE_MT)
+        with (
+            patch.dict(
+                EntityFactory._registry,
+                {(SENSOR_TYPE_MT, MT_SENSOR_HUMIDITY): MagicMock(side_effect=KeyError)},
+            ),
+            pytest.raises(KeyError),
+        ):
+            EntityFactory.create_entity(SENSOR_TYPE_MT, MT_SENSOR_HUMIDITY)
+        assert "Failed to create" not in caplog.text
+
+    def test_create_entities_logs_failures(self, caplog):
+        """Test skipped metrics are logged with the metric and device serial."""
+        EntityFactory._ensure_registered(SENSOR_TYPE_MT)
+        device = {
+            "serial": "Q2XX-XXXX-XXXX",
+            "model": "MT10",
+            "sensor": {"humidity": 40},
+        }
+
+        with patch.dict(
+            EntityFactory._registry,
+            {(SENSOR_TYPE_MT, MT_SENSOR_HUMIDITY): MagicMock(side_effect=KeyError)},
+        ):
+            assert EntityFactory.create_entities(MagicMock(), device, "entry") == []
+        assert "Failed to create humidity entity for device Q2XX-XXXX-XXXX" in (
+            caplog.text
+        )
+
+    def test_registered_types_follow_register(self):
+        """Test registered type names reflect later registrations."""
+        first = EntityFactory.get_registered_types()
+
+        with patch.dict(EntityFactory._registry):
+            EntityFactory.register("TEST", "metric")(MagicMock())
+            assert "TEST_metric" in EntityFactory.get_registered_types()
+
+        EntityFactory._device_capabilities.pop("TEST")
+        assert EntityFactory.get_registered_types() == first
+
+    def test_legacy_network_and_energy_entities(self):
+        """Test remaining legacy creators accept the device entity arguments."""
+        from custom_components.meraki_dashboard.devices.mr import MerakiMRSensor
+        from custom_components.meraki_dashboard.devices.mt import MerakiMTEnergySensor
+
+        coordinator = MagicMock()
+        device = {"serial": "Q2XX-XXXX-XXXX", "model": "MT40", "name": "Sensor"}
+
+        entity = create_device_entity(
+            "mr_sensor",
+            coordinator,
+            {},
+            MagicMock(key=MR_SENSOR_CLIENT_COUNT),
+            "entry",
+            None,
+        )
+        assert isinstance(entity, MerakiMRSensor)
+
+        entity = create_device_entity(
+            "mt_energy_sensor",
+            coordinator,
+            device,
+            MagicMock(key="energy"),
+            "entry",
+            None,
+            power_sensor_key="realPower",
+        )
+        assert isinstance(entity, MerakiMTEnergySensor)
+
+    def test_device_modules_imported_once(self):
+        """Test device sensor modules and classes are resolved through caches."""
+        from custom_components.meraki_dashboard.entities.factory import (
+            _device_class,
+            _device_modules,
+        )
+
+        modules = _device_modules()
+        assert set(modules) == {"mr", "ms", "mt", "organization"}
+        assert _device_modules() is modules
+        assert _device_class("mt", "MerakiMTSensor") is MerakiMTSensor
+        assert _device_class("mr", "MerakiMRDeviceSensor") is MerakiMRDeviceSensor
+
+    def test_register_same_metric_twice(self):
+        """Test registering a metric again replaces the creator only."""
+        creator = MagicMock()
+        try:
+            EntityFactory.register("TEST", "metric")(MagicMock())
+            EntityFactory.register("TEST", "metric")(creator)
+
+            assert EntityFactory._registry[("TEST", "metric")] is creator
+            assert EntityFactory._device_capabilities["TEST"] == {"metric": 0}
+            assert EntityFactory.get_device_capabilities("TEST") == ["metric"]
+        finally:
+            EntityFactory._registry.pop(("TEST", "metric"), None)
+            EntityFactory._device_capabilities.pop("TEST", None)
+
+    def test_reset_registry(self):
+        """Test the reset hook drops registrations and cached class lookups."""
+        from custom_components.meraki_dashboard.entities.factory import (
+            _device_modules,
+        )
+
+        EntityFactory.register("TEST", "metric")(MagicMock())
+        _device_modules()
+
+        EntityFactory._reset_registry()
+
+        assert EntityFactory._registry == {}
+        assert EntityFactory._device_capabilities == {}
+        assert EntityFactory._registered_types == set()
+        assert _device_modules.cache_info().currsize == 0
+        assert not EntityFactory.is_registered("TEST", "metric")
+
+        # Built-in entities register again on next use
+        assert EntityFactory.is_registered(SENSOR_TYPE_MT, MT_SENSOR_TEMPERATURE)
+        entity = EntityFactory.create_entity(
+            SENSOR_TYPE_MT,
+            MT_SENSOR_TEMPERATURE,
+            MagicMock(),
+            {"serial": "Q2XX-XXXX-XXXX", "model": "MT10"},
+            "entry",
+        )
+        assert isinstance(entity, MerakiMTSensor)
@@ -83,7 +83,7 @@ class TestMerakiNetworkHub:
         assert network_hub.device_type == SENSOR_TYPE_MT
         assert network_hub.config_entry is mock_config_entry
         assert network_hub.hub_name == "Test Network_MT"
-        assert network_hub.devices == []
+        assert network_hub.devices == ()
         assert network_hub._selected_devices == set()
         assert network_hub._last_discovery_time is None
         assert network_hub._discovery_in_progress is False
@@ -363,7 +363,7 @@ class TestMerakiNetworkHub:
 
         await network_hub._async_discover_devices()
 
-        assert network_hub.devices == []
+        assert network_hub.devices == ()
         assert network_hub._discovery_in_progress is False
 
     async def test_async_setup_wireless_data_success(
@@ -641,7 +641,7 @@ class TestNetworkHubEdgeCases:
 
         await network_hub._async_discover_devices()
 
-        assert network_hub.devices == []
+        assert network_hub.devices == ()
         assert network_hub._last_discovery_time is not None
 
     async def test_discover_devices_mixed_product_types(self, network_hub):
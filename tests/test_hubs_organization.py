@@ -275,6 +275,9 @@ class TestMerakiOrganizationHub:
         assert len(result) == 3
         assert mock_network_hub_class.call_count == 3
 
+        # Each network's devices are listed once for all device types
+        assert mock_dashboard_api.networks.getNetworkDevices.call_count == 2
+
         # Verify the hubs were created with correct parameters
         # Order should be: network1 MR, network1 MS, network2 MT
         calls = mock_network_hub_class.call_args_list
@@ -300,6 +303,112 @@ class TestMerakiOrganizationHub:
             organization_hub.config_entry,
         )
 
+    @patch("custom_components.meraki_dashboard.hubs.network.MerakiNetworkHub")
+    async def test_async_create_network_hubs_stores_inventory(
+        self, mock_network_hub_class, organization_hub, mock_dashboard_api
+    ):
+        """Test discovered networks and devices are reused after a restart."""
+        networks = [{"id": "network1", "name": "Network 1"}]
+        devices = [{"serial": "device1", "model": "MT40"}]
+        organization_hub.dashboard = mock_dashboard_api
+        organization_hub.networks = networks
+        mock_dashboard_api.networks.getNetworkDevices.return_value = devices
+        mock_network_hub_class.return_value = Mock(
+            async_setup=AsyncMock(return_value=True), hub_name="Network 1_MT"
+        )
+
+        await organization_hub.async_create_network_hubs()
+
+        inventory = await organization_hub._async_load_inventory()
+        assert inventory["networks"] == networks
+        assert inventory["devices"] == {"network1": devices}
+
+        # A stale inventory is ignored
+        organization_hub.config_entry.options = {"discovery_interval": 0}
+        assert await organization_hub._async_load_inventory() is None
+
+    @patch("custom_components.meraki_dashboard.hubs.network.MerakiNetworkHub")
+    async def test_later_discovery_refetches_stored_devices(
+        self, mock_network_hub_class, organization_hub, mock_dashboard_api
+    ):
+        """Test only the first discovery pass reuses the stored devices."""
+        devices = [{"serial": "device1", "model": "MT40"}]
+        organization_hub.dashboard = mock_dashboard_api
+        organization_hub.networks = [{"id": "network1", "name": "Network 1"}]
+        organization_hub._stored_devices = {"network1": devices}
+        mock_dashboard_api.networks.getNetworkDevices.return_value = devices
+        mock_network_hub_class.return_value = Mock(
+            async_setup=AsyncMock(return_value=True), hub_name="Network 1_MT"
+        )
+
+        await organization_hub.async_create_network_hubs()
+        mock_dashboard_api.networks.getNetworkDevices.assert_not_called()
+
+        await organization_hub.async_create_network_hubs()
+        mock_dashboard_api.networks.getNetworkDevices.assert_called_once_with(
+            "network1"
+        )
+
+    @patch("custom_components.meraki_dashboard.hubs.organization.meraki.DashboardAPI")
+    async def test_async_setup_uses_stored_inventory(
+        self, mock_dashboard_class, organization_hub, mock_dashboard_api, hass_storage
+    ):
+        """Test setup skips listing networks when a fresh inventory is stored."""
+        hass_storage["meraki_dashboard.inventory.test_org_id"] = {
+            "version": 1,
+            "key": "meraki_dashboard.inventory.test_org_id",
+            "data": {
+                "ts": datetime.now(UTC).timestamp(),
+                "networks": [{"id": "network1", "name": "Network 1"}],
+                "devices": {"network1": []},
+            },
+        }
+        mock_dashboard_class.return_value = mock_dashboard_api
+        mock_dashboard_api.organizations.getOrganization.return_value = {
+            "id": "test_org_id",
+            "name": "Test Organization",
+        }
+
+        assert await organization_hub.async_setup() is True
+
+        mock_dashboard_api.organizations.getOrganizationNetworks.assert_not_called()
+        assert organization_hub.networks == [{"id": "network1", "name": "Network 1"}]
+        assert organization_hub._stored_devices == {"network1": []}
+
+        await organization_hub.async_unload()
+
+    @pytest.mark.parametrize(
+        "stored",
+        [
+            {"version": 1, "data": {"networks": [], "devices": {}}},
+            {"version": 1, "data": {"ts": 1e12, "networks": {}, "devices": {}}},
+            {"version": 99, "data": {"ts": 1e12, "networks": [], "devices": {}}},
+        ],
+    )
+    async def test_malformed_or_other_version_inventory_ignored(
+        self, organization_hub, hass_storage, stored
+    ):
+        """Test an inventory of the wrong shape or version falls back to the API."""
+        hass_storage["meraki_dashboard.inventory.test_org_id"] = {
+            "key": "meraki_dashboard.inventory.test_org_id",
+            "minor_version": 1,
+            **stored,
+        }
+
+        assert await organization_hub._async_load_inventory() is None
+
+    async def test_remove_entry_deletes_inventory(
+        self, hass: HomeAssistant, organization_hub, mock_config_entry, hass_storage
+    ):
+        """Test removing the config entry deletes the stored inventory."""
+        from custom_components.meraki_dashboard import async_remove_entry
+
+        await organization_hub._async_save_inventory({})
+        assert "meraki_dashboard.inventory.test_org_id" in hass_storage
+
+        await async_remove_entry(hass, mock_config_entry)
+        assert "meraki_dashboard.inventory.test_org_id" not in hass_storage
+
     @patch("custom_components.meraki_dashboard.hubs.network.MerakiNetworkHub")
     async def test_async_create_network_hubs_setup_failure(
         self, mock_network_hub_class, organization_hub, mock_dashboard_api
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from homeassistant.config_entries import ConfigEntry
@@ -11,6 +11,8 @@ from homeassistant.core import HomeAssistant
 from custom_components.meraki_dashboard.const import (
     CONF_BASE_URL,
     DEFAULT_BASE_URL,
+    DOMAIN,
+    MT_SENSOR_TEMPERATURE,
     SENSOR_TYPE_MR,
     SENSOR_TYPE_MS,
     SENSOR_TYPE_MT,
@@ -142,7 +144,7 @@ class TestNetworkHubBasics:
         assert hub.network_name == "Test Network"
         assert hub.device_type == SENSOR_TYPE_MT
         assert hub.hub_name == "Test Network_MT"
-        assert hub.devices == []
+        assert hub.devices == ()
         assert hub._selected_devices == set()
         assert hasattr(hub, "event_service")  # MT devices should have event service
 
@@ -387,6 +389,84 @@ class TestNetworkHubBasics:
         result = await hub.async_get_sensor_data()
         assert result == {}
 
+    async def test_async_get_sensor_data_matches_readings_to_devices(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        """Test readings are kept only for this hub's devices."""
+        org_hub = Mock()
+        org_hub.hass = hass
+        org_hub.dashboard = Mock()
+        org_hub.organization_id = "test_org_id"
+        org_hub.total_api_calls = 0
+
+        hub = MerakiNetworkHub(
+            organization_hub=org_hub,
+            network_id="test_network_id",
+            network_name="Test Network",
+            device_type=SENSOR_TYPE_MT,
+            config_entry=mock_config_entry,
+        )
+        hub.devices = (
+            {"serial": "Q2XX-0001", "name": "First"},
+            {"serial": "Q2XX-0002", "name": "Second"},
+        )
+        hub.event_service = Mock(track_sensor_changes=AsyncMock())
+        org_hub.dashboard.sensor.getOrganizationSensorReadingsLatest.return_value = [
+            {"serial": "Q2XX-0002", "readings": [{"metric": "temperature"}]},
+            {"serial": "Q2XX-9999", "readings": []},
+            {"readings": []},
+        ]
+
+        result = await hub.async_get_sensor_data()
+
+        assert list(result) == ["Q2XX-0002"]
+        hub.event_service.track_sensor_changes.assert_awaited_once_with(
+            "Q2XX-0002",
+            [{"metric": "temperature"}],
+            {"serial": "Q2XX-0002", "name": "Second", "domain": DOMAIN},
+        )
+
+    def test_devices_by_serial_rebuilt_only_for_new_roster(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        """Test the serial index is reused until the roster is replaced."""
+        org_hub = Mock()
+        org_hub.hass = hass
+        hub = MerakiNetworkHub(
+            organization_hub=org_hub,
+            network_id="test_network_id",
+            network_name="Test Network",
+            device_type=SENSOR_TYPE_MT,
+            config_entry=mock_config_entry,
+        )
+        hub.devices = ({"serial": "Q2XX-0001"},)
+
+        index = hub._get_devices_by_serial()
+        assert list(index) == ["Q2XX-0001"]
+        assert hub._get_devices_by_serial() is index
+
+        hub.devices = ({"serial": "Q2XX-0002"},)
+        assert list(hub._get_devices_by_serial()) == ["Q2XX-0002"]
+
+
+class TestMetricNameInterning:
+    """Test sensor reading metric names share canonical strings."""
+
+    def test_intern_metric_names(self):
+        """Test known metric names are replaced and unknown ones kept."""
+        from custom_components.meraki_dashboard.hubs.network import (
+            _intern_metric_names,
+        )
+
+        temperature = "".join(["temper", "ature"])
+        readings = [{"metric": temperature}, {"metric": "custom"}, {}]
+
+        _intern_metric_names(readings)
+
+        assert readings[0]["metric"] is MT_SENSOR_TEMPERATURE.value
+        assert type(readings[0]["metric"]) is str
+        assert readings[1:] == [{"metric": "custom"}, {}]
+
 
 class TestLoggingConfiguration:
     """Test logging configuration functionality."""
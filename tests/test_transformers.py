@@ -128,6 +128,76 @@ class TestMTSensorDataTransformer:
         assert result["current"] == 0.37
         assert result["powerFactor"] == 53
 
+    def test_transform_power_value_alternative(self):
+        """Test power readings using "value" instead of "draw" are normalized."""
+        transformer = MTSensorDataTransformer()
+        raw_data = {
+            "readings": [
+                {"metric": "realPower", "realPower": {"value": 12.5, "unit": "W"}},
+                {"metric": "apparentPower", "apparentPower": {"draw": 20.0}},
+            ]
+        }
+
+        result = transformer.transform(raw_data)
+        assert result["realPower"] == 12.5
+        assert result["apparentPower"] == 20.0
+
+    def test_transform_dispatches_binary_and_nested_metrics(self):
+        """Test binary, nested and unknown metrics through the dispatch table."""
+        transformer = MTSensorDataTransformer()
+        raw_data = {
+            "readings": [
+                {"metric": "noise", "noise": {"ambient": {"level": 48}}},
+                {"metric": "door", "door": {"open": True}},
+                {"metric": "downstreamPower", "downstreamPower": {"enabled": False}},
+                {"metric": "motion", "motion": {}},
+                {"metric": "unknownMetric", "unknownMetric": {"value": 1}},
+            ]
+        }
+
+        result = transformer.transform(raw_data)
+        assert result["noise"] == 48.0
+        assert result["door"] is True
+        assert result["downstreamPower"] is False
+        assert result["motion"] is False
+        assert "unknownMetric" not in result
+
+    def test_transform_reused_per_device_payload(self):
+        """Test a device payload is transformed once until it is replaced."""
+        transformer = MTSensorDataTransformer()
+        raw_data = {
+            "serial": "Q2XX-XXXX-XXXX",
+            "readings": [{"metric": "temperature", "temperature": {"celsius": 23.5}}],
+        }
+
+        result = transformer.transform(raw_data)
+        assert transformer.transform(raw_data) == result
+
+        # Returned results are copies, so callers can't alter the cache
+        result["temperature"] = 0.0
+        assert transformer.transform(raw_data)["temperature"] == 23.5
+
+        new_data = {
+            "serial": "Q2XX-XXXX-XXXX",
+            "readings": [{"metric": "temperature", "temperature": {"celsius": 25.0}}],
+        }
+        assert transformer.transform(new_data)["temperature"] == 25.0
+
+    def test_transform_reads_payload_updated_in_place_after_clear(self):
+        """Test clearing the cache picks up a payload updated in place."""
+        transformer = MTSensorDataTransformer()
+        raw_data = {
+            "serial": "Q2XX-XXXX-XXXX",
+            "readings": [{"metric": "temperature", "temperature": {"celsius": 23.5}}],
+        }
+        assert transformer.transform(raw_data)["temperature"] == 23.5
+
+        raw_data["readings"][0]["temperature"]["celsius"] = 26.0
+        transformer.clear_cache()
+
+        assert transformer.transform(raw_data)["temperature"] == 26.0
+        assert transformer._last_transform.keys() == {"Q2XX-XXXX-XXXX"}
+
 
 class TestMRWirelessDataTransformer:
     """Test MR wireless data transformer."""
@@ -1,6 +1,9 @@
 """Test utility functions for Meraki Dashboard integration."""
 
 import asyncio
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
 import pytest
@@ -17,7 +20,10 @@ from custom_components.meraki_dashboard.utils.device_info import (
     get_device_status_info,
     should_create_entity,
 )
-from custom_components.meraki_dashboard.utils.helpers import batch_api_calls
+from custom_components.meraki_dashboard.utils.helpers import (
+    batch_api_calls,
+    iter_api_calls,
+)
 from custom_components.meraki_dashboard.utils.performance import (
     get_performance_metrics,
     performance_monitor,
@@ -661,6 +667,151 @@ class TestBatchApiCalls:
         assert len(results) == 1
         assert results[0] == "result_pos1_kw1_kw2"
 
+    @pytest.mark.asyncio
+    async def test_batch_api_calls_start_when_a_slot_frees(self):
+        """Test a queued call starts as soon as any running call finishes."""
+        hass = MagicMock(spec=HomeAssistant)
+        slow_release = asyncio.Event()
+        started: list[str] = []
+
+        async def mock_executor_job(func, *args, **kwargs):
+            started.append(args[0])
+            if args[0] == "slow":
+                await slow_release.wait()
+            return args[0]
+
+        hass.async_add_executor_job.side_effect = mock_executor_job
+
+        api_calls = [(str, (name,), {}) for name in ("slow", "fast", "queued")]
+        task = asyncio.ensure_future(
+            batch_api_calls(hass, api_calls, max_concurrent=2, delay_between_batches=0)
+        )
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        # The queued call does not wait for the slow call to finish
+        assert started == ["slow", "fast", "queued"]
+        slow_release.set()
+        assert await task == ["slow", "fast", "queued"]
+
+    async def test_batch_api_calls_dedicated_executor(self, hass: HomeAssistant):
+        """Test calls run in the given executor instead of the shared one."""
+        with ThreadPoolExecutor(thread_name_prefix="meraki_api") as executor:
+            api_calls = [(threading.current_thread, (), {}) for _ in range(3)]
+            results = await batch_api_calls(
+                hass, api_calls, max_concurrent=2, executor=executor
+            )
+
+        assert all(thread.name.startswith("meraki_api") for thread in results)
+
+    @pytest.mark.asyncio
+    async def test_batch_api_calls_awaitables(self):
+        """Test awaitables run on the event loop alongside executor calls."""
+        hass = MagicMock(spec=HomeAssistant)
+
+        async def mock_executor_job(func, *args, **kwargs):
+            return func(*args, **kwargs)
+
+        hass.async_add_executor_job.side_effect = mock_executor_job
+
+        async def async_call(value):
+            return value
+
+        async def async_error():
+            raise ValueError("Test error")
+
+        results = await batch_api_calls(
+            hass, [async_call("async"), (str, ("sync",), {}), async_error()]
+        )
+
+        assert results[:2] == ["async", "sync"]
+        assert isinstance(results[2], ValueError)
+        hass.async_add_executor_job.assert_called_once_with(str, "sync")
+
+    @pytest.mark.asyncio
+    async def test_iter_api_calls_yields_as_completed(self):
+        """Test results are yielded with their index as each call finishes."""
+        hass = MagicMock(spec=HomeAssistant)
+        slow_release = asyncio.Event()
+
+        async def slow_call():
+            await slow_release.wait()
+            return "slow"
+
+        async def fast_call():
+            return "fast"
+
+        async def failing_call():
+            raise ValueError("Test error")
+
+        results = []
+        async for index, result in iter_api_calls(
+            hass, [slow_call(), fast_call(), failing_call()], delay_between_batches=0
+        ):
+            results.append((index, result))
+            if len(results) == 2:
+                slow_release.set()
+
+        assert results[0] == (1, "fast")
+        assert results[1][0] == 2
+        assert isinstance(results[1][1], ValueError)
+        assert results[2] == (0, "slow")
+
+    @pytest.mark.asyncio
+    async def test_iter_api_calls_stopped_early_closes_pending_calls(self):
+        """Test calls that never started are closed when iteration stops early."""
+        hass = MagicMock(spec=HomeAssistant)
+
+        async def call(value):
+            return value
+
+        calls = [call("first"), call("second"), call("third")]
+        results = iter_api_calls(hass, calls, max_concurrent=1, delay_between_batches=0)
+
+        assert await anext(results) == (0, "first")
+        await results.aclose()
+
+        assert all(
+            inspect.getcoroutinestate(pending) == inspect.CORO_CLOSED
+            for pending in calls
+        )
+
+    @pytest.mark.asyncio
+    async def test_iter_api_calls_stopped_early_waits_for_cancelled_calls(self):
+        """Test running calls finish cancelling before iteration returns."""
+        hass = MagicMock(spec=HomeAssistant)
+        cleaned_up = []
+
+        async def fast():
+            return "fast"
+
+        async def slow():
+            try:
+                await asyncio.Event().wait()
+            finally:
+                cleaned_up.append(True)
+
+        results = iter_api_calls(
+            hass, [fast(), slow()], max_concurrent=2, delay_between_batches=0
+        )
+
+        assert await anext(results) == (0, "fast")
+        await results.aclose()
+
+        assert cleaned_up == [True]
+
+    @pytest.mark.asyncio
+    async def test_api_calls_reject_zero_concurrency(self):
+        """Test a concurrency limit below one is rejected instead of hanging."""
+        hass = MagicMock(spec=HomeAssistant)
+
+        with pytest.raises(ValueError, match="max_concurrent"):
+            await batch_api_calls(hass, [(str, (), {})], max_concurrent=0)
+
+        with pytest.raises(ValueError, match="max_concurrent"):
+            async for _ in iter_api_calls(hass, [(str, (), {})], max_concurrent=0):
+                pass
+
 
 class TestDeviceCapabilityFilter:
     """Test device capability filtering functionality."""